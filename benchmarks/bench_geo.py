@@ -0,0 +1,70 @@
+"""Cost per batch of the radius/duplicate filter against a per-place Python loop.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_geo --batch-size 1000
+"""
+import argparse
+import math
+import random
+import time
+from typing import Callable, List, Sequence
+
+from src.business_information_scraper.data_models import BusinessRecord
+from src.business_information_scraper.geo import EARTH_RADIUS_METERS, filter_records
+
+LATITUDE, LONGITUDE, RADIUS = 4.6748, -74.0474, 1000
+
+
+def make_batch(size: int, seed: int = 0) -> List[BusinessRecord]:
+    """Places spread over 1.5x the radius, a fifth of them repeated as from an overlapping search."""
+    rng = random.Random(seed)  # nosec B311 - synthetic data
+    span = 1.5 * RADIUS / 111_195
+    records = [
+        BusinessRecord(f"P{index}", 'Cafe', None, None, ('cafe',),
+                       LATITUDE + rng.uniform(-span, span), LONGITUDE + rng.uniform(-span, span))
+        for index in range(size - size // 5)
+    ]
+    return records + rng.sample(records, size // 5)
+
+
+def python_filter(records: Sequence[BusinessRecord]) -> List[BusinessRecord]:
+    nearest = {}
+    for record in records:
+        lat1, lat2 = math.radians(LATITUDE), math.radians(record.latitude)
+        dlat, dlng = lat2 - lat1, math.radians(record.longitude - LONGITUDE)
+        a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlng / 2) ** 2
+        distance = 2 * EARTH_RADIUS_METERS * math.asin(math.sqrt(a))
+        if distance <= RADIUS and (record.place_id not in nearest or distance < nearest[record.place_id][0]):
+            nearest[record.place_id] = (distance, record)
+    return [record for _, record in nearest.values()]
+
+
+def numpy_filter(records: Sequence[BusinessRecord]) -> List[BusinessRecord]:
+    return filter_records(records, LATITUDE, LONGITUDE, RADIUS).records
+
+
+def time_per_batch(run: Callable[[Sequence[BusinessRecord]], list], batch: List[BusinessRecord], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        run(batch)
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--batch-size', type=int, action='append', help="Default: 100, 1000 and 10000")
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'batch':>7} {'python µs':>11} {'numpy µs':>10} {'speed-up':>9}")
+    for size in args.batch_size or [100, 1000, 10_000]:
+        batch = make_batch(size)
+        assert len(python_filter(batch)) == len(numpy_filter(batch))
+        python_seconds = time_per_batch(python_filter, batch, args.repeat)
+        numpy_seconds = time_per_batch(numpy_filter, batch, args.repeat)
+        print(f"{size:>7} {python_seconds * 1e6:>11.0f} {numpy_seconds * 1e6:>10.0f} {python_seconds / numpy_seconds:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+"""End-to-end throughput benchmarks of the scraping pipeline against the fake Places server.
+
+Each scenario runs in a fresh process, so peak RSS is its own, against a new
+fake server. Results are compared with the stored baselines; use
+``--save-baseline`` after an intended performance change.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_pipeline
+    python -m benchmarks.bench_pipeline --scenario adaptive --save-baseline
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from benchmarks.fake_places import FakePlacesServer
+from src.business_information_scraper.data_models import BusinessInfo
+from src.business_information_scraper.storage import DataStorage, get_storage_strategy
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baselines', 'pipeline.json')
+FAKE_API_KEY = 'AIzaFakeBenchmarkKey'
+TOKEN_DELAY = 0.3
+
+# Search area and fake server settings per scenario.
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    'single': {'radius': 1000, 'server': {'density': 300, 'latency': 0.02}},
+    'adaptive': {'radius': 1000, 'min_tile_radius': 150, 'server': {'density': 150, 'latency': 0.02}},
+    'enriched': {'radius': 1000, 'min_tile_radius': 250, 'enrich': True, 'server': {'density': 100, 'latency': 0.02}},
+    'async': {'radius': 1000, 'server': {'density': 300, 'latency': 0.02}},
+    'quota': {'radius': 1000, 'min_tile_radius': 250, 'server': {'density': 100, 'latency': 0.02, 'quota_error_rate': 0.1}},
+    'main': {'radius': 1000, 'min_tile_radius': 250, 'server': {'density': 100, 'latency': 0.02}},
+}
+LATITUDE, LONGITUDE, BUSINESS_TYPE = 4.6748, -74.0474, 'restaurant'
+
+
+class TimedStorage(DataStorage):
+    """Wraps a storage backend and measures the time spent writing rows."""
+
+    def __init__(self, inner: DataStorage):
+        self.inner = inner
+        self.rows = 0
+        self.seconds = 0.0
+
+    def setup(self) -> None:
+        self.inner.setup()
+
+    def save(self, data: List[BusinessInfo]) -> None:
+        started = time.perf_counter()
+        self.inner.save(data)
+        self.seconds += time.perf_counter() - started
+        self.rows += len(data)
+
+    def flush(self) -> None:
+        started = time.perf_counter()
+        self.inner.flush()
+        self.seconds += time.perf_counter() - started
+
+    def close(self) -> None:
+        started = time.perf_counter()
+        self.inner.close()
+        self.seconds += time.perf_counter() - started
+
+
+def _run_processor(config: Dict[str, Any], base_url: str, storage: TimedStorage) -> None:
+    from src.business_information_scraper.enrichment import DetailsEnricher
+    from src.business_information_scraper.maps_api_client import GoogleMapsClient
+    from src.business_information_scraper.processor import BusinessDataProcessor
+    from src.business_information_scraper.rate_limiter import RateLimiter, RetryPolicy
+
+    client = GoogleMapsClient(
+        FAKE_API_KEY, base_url=base_url, token_activation_delay=TOKEN_DELAY,
+        rate_limiter=RateLimiter(max_qps=50), retry_policy=RetryPolicy(max_retries=8, base_delay=0.05),
+    )
+    enricher = DetailsEnricher(client) if config.get('enrich') else None
+    processor = BusinessDataProcessor(
+        client, storage, batch_size=100, min_tile_radius=config.get('min_tile_radius'), enricher=enricher
+    )
+    try:
+        processor.process_location(LATITUDE, LONGITUDE, config['radius'], BUSINESS_TYPE)
+    finally:
+        if enricher is not None:
+            enricher.close()
+
+
+def _run_async(config: Dict[str, Any], base_url: str, storage: TimedStorage) -> None:
+    from src.business_information_scraper.async_client import AsyncPlacesClient
+    from src.business_information_scraper.processor import BusinessDataProcessor
+
+    async def scenario() -> None:
+        async with AsyncPlacesClient(FAKE_API_KEY, base_url=base_url, token_activation_delay=TOKEN_DELAY) as client:
+            processor = BusinessDataProcessor(client, storage, batch_size=100)
+            await processor.process_location_async(LATITUDE, LONGITUDE, config['radius'], BUSINESS_TYPE)
+
+    asyncio.run(scenario())
+
+
+def _run_main(config: Dict[str, Any], base_url: str, storage: TimedStorage) -> None:
+    os.environ.setdefault('Maps_API_KEY', FAKE_API_KEY)
+    from src import main
+
+    settings = main.settings
+    settings.api_base_url = base_url
+    settings.search_latitude, settings.search_longitude = LATITUDE, LONGITUDE
+    settings.search_radius_meters = config['radius']
+    settings.target_business_type = BUSINESS_TYPE
+    settings.min_tile_radius_meters = config.get('min_tile_radius')
+    settings.page_token_delay_seconds = TOKEN_DELAY
+    settings.api_max_qps = 50
+    settings.cache_path = None
+    settings.checkpoint_path = None
+    main.get_storage_strategy = lambda **kwargs: storage
+    main.logging.getLogger().setLevel('ERROR')
+    main.logging.getLogger('googlemaps').setLevel('ERROR')
+    main.run()
+
+
+def run_scenario(name: str, base_url: str) -> Dict[str, float]:
+    """Runs one scenario in the current process and returns its measurements."""
+    import logging
+    logging.basicConfig(level=logging.ERROR)
+    config = SCENARIOS[name]
+    directory = tempfile.mkdtemp()
+    try:
+        storage = TimedStorage(get_storage_strategy(storage_type='sqlite', file_path=os.path.join(directory, 'bench.sqlite')))
+        runner = {'async': _run_async, 'main': _run_main}.get(name, _run_processor)
+        if name != 'main':
+            storage.setup()
+        started = time.perf_counter()
+        try:
+            runner(config, base_url, storage)
+        finally:
+            if name != 'main':
+                storage.close()
+        seconds = time.perf_counter() - started
+    finally:
+        shutil.rmtree(directory)
+    return {
+        'seconds': seconds,
+        'rows': storage.rows,
+        'storage_seconds': storage.seconds,
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024),
+    }
+
+
+def measure(name: str) -> Dict[str, float]:
+    """Runs a scenario in a fresh process against a fresh fake server."""
+    with FakePlacesServer(token_activation_delay=TOKEN_DELAY, **SCENARIOS[name]['server']) as server:
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+            result = executor.submit(run_scenario, name, server.base_url).result()
+        requests = server.requests
+    calls = requests['nearby'] + requests['details'] + requests['quota_errors']
+    rows = max(result['rows'], 1)
+    return {
+        'places_per_second': round(result['rows'] / result['seconds'], 1),
+        'api_calls_per_place': round(calls / rows, 3),
+        'peak_rss_mb': round(result['peak_rss_mb'], 1),
+        'storage_rows_per_second': round(result['rows'] / result['storage_seconds'], 0) if result['storage_seconds'] else 0.0,
+        'places': result['rows'],
+        'api_calls': calls,
+        'seconds': round(result['seconds'], 2),
+    }
+
+
+def compare(name: str, result: Dict[str, float], baseline: Optional[Dict[str, float]], tolerance: float) -> List[str]:
+    """Returns the metrics of ``result`` that regressed beyond ``tolerance`` against ``baseline``."""
+    if not baseline:
+        return []
+    regressions = []
+    if result['places_per_second'] < baseline['places_per_second'] * (1 - tolerance):
+        regressions.append('places_per_second')
+    for metric in ('api_calls_per_place', 'peak_rss_mb'):
+        if result[metric] > baseline[metric] * (1 + tolerance):
+            regressions.append(metric)
+    return [f"{name}: {metric} {baseline[metric]} -> {result[metric]}" for metric in regressions]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help="Run only these scenarios")
+    parser.add_argument('--save-baseline', action='store_true', help=f"Store the results in {BASELINE_PATH}")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed relative regression")
+    args = parser.parse_args()
+
+    baselines: Dict[str, Dict[str, float]] = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, encoding='utf-8') as f:
+            baselines = json.load(f)
+
+    regressions: List[str] = []
+    print(f"{'scenario':<10} {'places/s':>10} {'calls/place':>12} {'peak RSS MB':>12} {'storage rows/s':>15} {'vs baseline':>12}")
+    for name in args.scenario or list(SCENARIOS):
+        result = measure(name)
+        baseline = baselines.get(name)
+        change = f"{result['places_per_second'] / baseline['places_per_second'] - 1:+.0%}" if baseline else 'n/a'
+        print(
+            f"{name:<10} {result['places_per_second']:>10,.1f} {result['api_calls_per_place']:>12.3f} "
+            f"{result['peak_rss_mb']:>12.1f} {result['storage_rows_per_second']:>15,.0f} {change:>12}"
+        )
+        regressions.extend(compare(name, result, baseline, args.tolerance))
+        if args.save_baseline:
+            baselines[name] = result
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baselines written to {BASELINE_PATH}")
+    elif regressions:
+        print("Regressions beyond tolerance:\n  " + "\n  ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
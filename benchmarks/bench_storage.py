@@ -0,0 +1,89 @@
+"""Measures write throughput of the storage backends against the original CSV implementation.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_storage --rows 200000 --batch-size 100
+"""
+import argparse
+import csv
+import os
+import shutil
+import tempfile
+import time
+from typing import Callable, List
+
+from src.business_information_scraper.data_models import BusinessInfo
+from src.business_information_scraper.storage import CsvStorage, ParquetStorage, SqliteStorage, pa
+
+
+class LegacyCsvStorage:
+    """The original writer: reopens the file per batch and model_dumps every row."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+    def setup(self) -> None:
+        with open(self.file_path, 'a', newline='', encoding='utf-8') as f:
+            if f.tell() == 0:
+                csv.writer(f).writerow(BusinessInfo.model_fields.keys())
+
+    def save(self, data: List[BusinessInfo]) -> None:
+        with open(self.file_path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            for item in data:
+                writer.writerow(item.model_dump(mode='python').values())
+
+    def close(self) -> None:
+        pass
+
+
+def make_rows(count: int) -> List[BusinessInfo]:
+    return [
+        BusinessInfo(
+            place_id=f"ChIJ{i:020d}",
+            name=f"Business number {i}",
+            address=f"Calle {i % 200} # {i % 97}-{i % 13}, Bogotá",
+            phone_number=f"+57 1 {i % 10_000_000:07d}",
+            types=['restaurant', 'food', 'point_of_interest', 'establishment'],
+        )
+        for i in range(count)
+    ]
+
+
+def measure(factory: Callable[[str], object], rows: List[BusinessInfo], batch_size: int) -> float:
+    """Returns rows/s for writing ``rows`` in batches through a fresh storage instance."""
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'bench.out')
+    try:
+        storage = factory(path)
+        started = time.perf_counter()
+        storage.setup()
+        for start in range(0, len(rows), batch_size):
+            storage.save(rows[start:start + batch_size])
+        storage.close()
+        return len(rows) / (time.perf_counter() - started)
+    finally:
+        shutil.rmtree(directory)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--batch-size', type=int, default=100)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    legacy = measure(LegacyCsvStorage, rows, args.batch_size)
+    current = measure(CsvStorage, rows, args.batch_size)
+    print(f"rows={args.rows} batch_size={args.batch_size}")
+    print(f"legacy  CsvStorage: {legacy:12,.0f} rows/s")
+    print(f"current CsvStorage: {current:12,.0f} rows/s ({current / legacy:.1f}x)")
+    sqlite = measure(SqliteStorage, rows, args.batch_size)
+    print(f"SqliteStorage:      {sqlite:12,.0f} rows/s ({sqlite / legacy:.1f}x)")
+    if pa is not None:
+        parquet = measure(ParquetStorage, rows, args.batch_size)
+        print(f"ParquetStorage:     {parquet:12,.0f} rows/s ({parquet / legacy:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""Per-record CPU and memory of turning raw Places results into storable rows.
+
+Compares the per-place pydantic ``BusinessInfo`` construction the processor used
+to do with the page-at-a-time ``to_records`` path. Run from the repository root:
+
+    python -m benchmarks.bench_transform --places 200000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from src.business_information_scraper.data_models import UNKNOWN_ADDRESS, UNKNOWN_PHONE_NUMBER, BusinessInfo
+from src.business_information_scraper.transform import to_records
+
+PAGE_SIZE = 20
+TYPE_LISTS = (
+    ['restaurant', 'food', 'point_of_interest', 'establishment'],
+    ['cafe', 'food', 'point_of_interest', 'establishment'],
+    ['bar', 'point_of_interest', 'establishment'],
+)
+
+
+def make_pages(count: int) -> List[List[Dict[str, Any]]]:
+    """Nearby Search-shaped pages; every result decodes its own strings, as json.loads does."""
+    places = [
+        {
+            'place_id': f"ChIJ{index:012d}",
+            'name': f"Business {index}",
+            'vicinity': f"Calle {index % 200} # {index % 100}",
+            'types': [str(value) for value in TYPE_LISTS[index % len(TYPE_LISTS)]],
+            'geometry': {'location': {'lat': 4.6 + index * 1e-6, 'lng': -74.0 - index * 1e-6}},
+        }
+        for index in range(count)
+    ]
+    return [places[start:start + PAGE_SIZE] for start in range(0, count, PAGE_SIZE)]
+
+
+def legacy_transform(pages: List[List[Dict[str, Any]]]) -> list:
+    rows = []
+    for page in pages:
+        for place in page:
+            try:
+                rows.append(BusinessInfo(
+                    place_id=place['place_id'],
+                    name=place.get('name', 'N/A'),
+                    address=place.get('formatted_address', UNKNOWN_ADDRESS),
+                    phone_number=place.get('international_phone_number', UNKNOWN_PHONE_NUMBER),
+                    types=place.get('types', []),
+                ))
+            except Exception:
+                pass
+    return rows
+
+
+def record_transform(pages: List[List[Dict[str, Any]]]) -> list:
+    rows = []
+    for page in pages:
+        rows.extend(to_records(page)[0])
+    return rows
+
+
+def measure(transform: Callable[[list], list], count: int) -> Dict[str, float]:
+    pages = make_pages(count)
+    gc.collect()
+    started = time.process_time()
+    rows = transform(pages)
+    cpu = time.process_time() - started
+
+    # Memory is measured separately so tracing does not inflate the CPU figure.
+    del rows
+    pages = make_pages(count)
+    gc.collect()
+    tracemalloc.start()
+    rows = transform(pages)
+    # Rows outlive the raw pages in the pipeline: count only what the transform allocated and the rows keep.
+    del pages
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(rows) == count
+    return {'us_per_record': cpu / count * 1e6, 'bytes_per_record': retained / count}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--places', type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'transform':<10} {'µs/record':>10} {'bytes/record':>13}")
+    for name, transform in (('legacy', legacy_transform), ('records', record_transform)):
+        result = measure(transform, args.places)
+        print(f"{name:<10} {result['us_per_record']:>10.2f} {result['bytes_per_record']:>13.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,286 @@
+"""Local stand-in for the Places API (Nearby Search and Place Details) and Geocoding over HTTP.
+
+Businesses sit on a deterministic jittered grid, so the same query always returns
+the same places and overlapping queries share them. Nearby Search pages through
+at most 60 results, 20 per page, with page tokens that only become valid after an
+activation delay. Every address geocodes to the same square area. Latency and
+OVER_QUERY_LIMIT errors can be injected. Types listed in ``shared_types`` share one
+grid of places, each having a random subset of them, so their searches overlap.
+
+Run it standalone and point the scraper at it with API_BASE_URL:
+
+    python -m benchmarks.fake_places --port 8765 --density 400 --latency 0.05
+"""
+import argparse
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
+
+METERS_PER_DEGREE = 111_320.0
+PAGE_SIZE = 20
+MAX_RESULTS = 60
+# Where every geocoded address lands, and the half-width of its viewport.
+GEOCODE_CENTER = (4.6748, -74.0474)
+GEOCODE_HALF_SIZE_METERS = 5000.0
+
+
+class FakePlacesServer:
+    """Threaded HTTP server emulating the Places web service endpoints the scraper uses.
+
+    ``density`` is businesses per square kilometre (the grid is laid out in
+    degrees, so density is exact near the equator and only approximate elsewhere).
+    ``latency`` is added to every response and ``quota_error_rate`` is the chance
+    that a request is answered with OVER_QUERY_LIMIT.
+    """
+
+    def __init__(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 0,
+            density: float = 200.0,
+            latency: float = 0.0,
+            token_activation_delay: float = 0.2,
+            quota_error_rate: float = 0.0,
+            seed: int = 0,
+            shared_types: Sequence[str] = (),
+    ):
+        self.shared_types = tuple(shared_types)
+        self.spacing_degrees = 1000.0 / math.sqrt(density) / METERS_PER_DEGREE
+        self.latency = latency
+        self.token_activation_delay = token_activation_delay
+        self.quota_error_rate = quota_error_rate
+        self.requests: Dict[str, int] = {
+            'nearby': 0, 'details': 0, 'geocode': 0, 'quota_errors': 0, 'token_not_ready': 0,
+        }
+        self._tokens: Dict[str, Tuple[List[Dict[str, Any]], int, float]] = {}
+        self._random = random.Random(seed)  # nosec B311 - synthetic load, not security
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakePlacesServer':
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'FakePlacesServer':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    # --- Synthetic data -------------------------------------------------------
+
+    def _place_location(self, row: int, col: int) -> Tuple[float, float]:
+        digest = hashlib.blake2b(f"{row}:{col}".encode(), digest_size=4).digest()
+        jitter_lat = (digest[0] / 255 - 0.5) * self.spacing_degrees
+        jitter_lng = (digest[1] / 255 - 0.5) * self.spacing_degrees
+        return (row + 0.5) * self.spacing_degrees + jitter_lat, (col + 0.5) * self.spacing_degrees + jitter_lng
+
+    def _cell_types(self, row: int, col: int) -> List[str]:
+        """The shared types of the place in a grid cell: each with even odds, and at least one."""
+        digest = hashlib.blake2b(f"types:{row}:{col}".encode(), digest_size=8).digest()
+        types = [name for name, byte in zip(self.shared_types, digest) if byte & 1]
+        return types or [self.shared_types[digest[-1] % len(self.shared_types)]]
+
+    @staticmethod
+    def _place(place_id: str, latitude: float, longitude: float, business_types: List[str]) -> Dict[str, Any]:
+        return {
+            'place_id': place_id,
+            'name': f"{business_types[0].replace('_', ' ').title()} {place_id[-6:].lstrip('_')}",
+            'types': [*business_types, 'point_of_interest', 'establishment'],
+            'geometry': {'location': {'lat': latitude, 'lng': longitude}},
+            'vicinity': f"{latitude:.5f}, {longitude:.5f}",
+        }
+
+    def places_within(self, latitude: float, longitude: float, radius: float, business_type: str) -> List[Dict[str, Any]]:
+        """Every synthetic business of a type inside the circle, nearest first."""
+        lat_span = radius / METERS_PER_DEGREE
+        lng_span = radius / (METERS_PER_DEGREE * max(math.cos(math.radians(latitude)), 1e-6))
+        found = []
+        for row in range(math.floor((latitude - lat_span) / self.spacing_degrees) - 1,
+                         math.floor((latitude + lat_span) / self.spacing_degrees) + 1):
+            for col in range(math.floor((longitude - lng_span) / self.spacing_degrees) - 1,
+                             math.floor((longitude + lng_span) / self.spacing_degrees) + 1):
+                place_lat, place_lng = self._place_location(row, col)
+                north = (place_lat - latitude) * METERS_PER_DEGREE
+                east = (place_lng - longitude) * METERS_PER_DEGREE * math.cos(math.radians(latitude))
+                distance = math.hypot(north, east)
+                if distance > radius:
+                    continue
+                if business_type in self.shared_types:
+                    types = self._cell_types(row, col)
+                    if business_type in types:
+                        found.append((distance, self._place(f"fake_shared_{row}_{col}", place_lat, place_lng, types)))
+                else:
+                    place_id = f"fake_{business_type}_{row}_{col}"
+                    found.append((distance, self._place(place_id, place_lat, place_lng, [business_type])))
+        found.sort(key=lambda item: item[0])
+        return [place for _, place in found]
+
+    def place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            prefix, row, col = place_id.rsplit('_', 2)
+            business_type = prefix[len('fake_'):]
+            latitude, longitude = self._place_location(int(row), int(col))
+        except ValueError:
+            return None
+        types = self._cell_types(int(row), int(col)) if business_type == 'shared' and self.shared_types else [business_type]
+        place = self._place(place_id, latitude, longitude, types)
+        place['formatted_address'] = f"Calle {abs(int(row)) % 200} # {abs(int(col)) % 100}-{len(place_id) % 50}"
+        number = int.from_bytes(hashlib.blake2b(place_id.encode(), digest_size=4).digest(), 'big')
+        place['international_phone_number'] = f"+57 1 {number % 10_000_000:07d}"
+        return place
+
+    # --- Endpoints ------------------------------------------------------------
+
+    def nearby_search(self, params: Dict[str, str]) -> Dict[str, Any]:
+        now = time.monotonic()
+        token = params.get('pagetoken')
+        if token:
+            with self._lock:
+                entry = self._tokens.get(token)
+                if entry is None:
+                    return {'status': 'INVALID_REQUEST'}
+                places, page_index, active_at = entry
+                if now < active_at:
+                    self.requests['token_not_ready'] += 1
+                    return {'status': 'INVALID_REQUEST'}
+                del self._tokens[token]
+        else:
+            try:
+                latitude, longitude = (float(value) for value in params['location'].split(','))
+                radius = float(params['radius'])
+            except (KeyError, ValueError):
+                return {'status': 'INVALID_REQUEST', 'error_message': 'location and radius are required'}
+            places = self.places_within(latitude, longitude, radius, params.get('type', 'establishment'))[:MAX_RESULTS]
+            page_index = 0
+        if not places:
+            return {'status': 'ZERO_RESULTS', 'results': []}
+
+        response: Dict[str, Any] = {'status': 'OK', 'results': places[page_index * PAGE_SIZE:(page_index + 1) * PAGE_SIZE]}
+        if (page_index + 1) * PAGE_SIZE < len(places):
+            next_token = uuid.uuid4().hex
+            with self._lock:
+                # The delay runs from when the page is sent, however long it took to build.
+                self._tokens[next_token] = (places, page_index + 1, time.monotonic() + self.token_activation_delay)
+            response['next_page_token'] = next_token
+        return response
+
+    def details(self, params: Dict[str, str]) -> Dict[str, Any]:
+        # googlemaps still sends the legacy 'placeid' spelling; the API accepts both.
+        place = self.place_details(params.get('place_id') or params.get('placeid', ''))
+        if place is None:
+            return {'status': 'NOT_FOUND'}
+        fields = {'types' if field == 'type' else field for field in params.get('fields', '').split(',') if field}
+        result = {key: value for key, value in place.items() if not fields or key in fields}
+        return {'status': 'OK', 'result': result}
+
+    @staticmethod
+    def geocode(params: Dict[str, str]) -> Dict[str, Any]:
+        address = params.get('address', '').strip()
+        if not address:
+            return {'status': 'INVALID_REQUEST', 'error_message': 'address is required'}
+        latitude, longitude = GEOCODE_CENTER
+        lat_span = GEOCODE_HALF_SIZE_METERS / METERS_PER_DEGREE
+        lng_span = GEOCODE_HALF_SIZE_METERS / (METERS_PER_DEGREE * math.cos(math.radians(latitude)))
+        box = {
+            'southwest': {'lat': latitude - lat_span, 'lng': longitude - lng_span},
+            'northeast': {'lat': latitude + lat_span, 'lng': longitude + lng_span},
+        }
+        return {'status': 'OK', 'results': [{
+            'formatted_address': address.title(),
+            'geometry': {'location': {'lat': latitude, 'lng': longitude}, 'bounds': box, 'viewport': box},
+        }]}
+
+    def handle(self, path: str, params: Dict[str, str]) -> Dict[str, Any]:
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            if self.quota_error_rate and self._random.random() < self.quota_error_rate:
+                self.requests['quota_errors'] += 1
+                return {'status': 'OVER_QUERY_LIMIT', 'error_message': 'Injected quota error'}
+        if path.endswith('/place/nearbysearch/json'):
+            with self._lock:
+                self.requests['nearby'] += 1
+            return self.nearby_search(params)
+        if path.endswith('/place/details/json'):
+            with self._lock:
+                self.requests['details'] += 1
+            return self.details(params)
+        if path.endswith('/geocode/json'):
+            with self._lock:
+                self.requests['geocode'] += 1
+            return self.geocode(params)
+        return {'status': 'NOT_FOUND', 'error_message': f"Unknown endpoint {path}"}
+
+    def _handler_class(self) -> type:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                payload = json.dumps(fake.handle(url.path, params)).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--density', type=float, default=200.0, help="Businesses per km²")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument('--token-delay', type=float, default=2.0, help="Seconds before a page token is valid")
+    parser.add_argument('--quota-error-rate', type=float, default=0.0)
+    parser.add_argument(
+        '--shared-types', default='', help="Comma-separated types whose places overlap, e.g. restaurant,cafe,bar",
+    )
+    args = parser.parse_args()
+
+    server = FakePlacesServer(
+        host=args.host, port=args.port, density=args.density, latency=args.latency,
+        token_activation_delay=args.token_delay, quota_error_rate=args.quota_error_rate,
+        shared_types=[name for name in args.shared_types.split(',') if name],
+    )
+    print(f"Fake Places API listening on {server.base_url} (Ctrl+C to stop)")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,275 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from googlemaps.exceptions import ApiError, HTTPError, Timeout, TransportError
+
+from src.business_information_scraper.cache import ResponseCache
+from src.business_information_scraper.data_models import NearbyQuery
+from src.business_information_scraper.exceptions import (
+    ApiClientError,
+    ConfigurationError,
+    PageTokenNotReadyError,
+    QuotaExceededError,
+)
+from src.business_information_scraper.maps_api_client import (
+    DEFAULT_BASE_URL,
+    DETAILS_FIELDS,
+    QUOTA_API_STATUSES,
+    GoogleMapsClient,
+)
+from src.business_information_scraper.metrics import RESULTS_PER_PAGE_BUCKETS, MetricsRegistry
+from src.business_information_scraper.pagination import NEARBY_MAX_RESULTS, NearbyPage
+from src.business_information_scraper.rate_limiter import RateLimiter, RetryPolicy
+
+try:
+    import httpx  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+NEARBY_SEARCH_PATH = '/maps/api/place/nearbysearch/json'
+PLACE_DETAILS_PATH = '/maps/api/place/details/json'
+# Statuses that carry a usable response body.
+OK_API_STATUSES = {'OK', 'ZERO_RESULTS'}
+
+
+class AsyncPlacesClient:
+    """asyncio counterpart of ``GoogleMapsClient`` built on a pooled httpx client.
+
+    Requests share keep-alive connections from one pool instead of holding a
+    thread each, so thousands of calls can be in flight from a single event loop.
+    Errors are raised as the googlemaps exception types internally, so retries,
+    the shared rate limiter and the resulting ``ApiClientError`` messages behave
+    exactly as in the synchronous client. Requires the ``httpx`` package.
+    """
+
+    def __init__(
+            self,
+            api_key: str,
+            timeout: float = 10,
+            max_connections: int = 100,
+            max_keepalive_connections: int = 20,
+            max_concurrent_queries: int = 8,
+            token_activation_delay: float = 1.5,
+            token_retry_interval: float = 0.25,
+            max_token_retries: int = 20,
+            base_url: str = DEFAULT_BASE_URL,
+            cache: Optional[ResponseCache] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            metrics: Optional[MetricsRegistry] = None,
+    ):
+        if httpx is None:
+            raise ConfigurationError("The async Places client requires the 'httpx' package")
+        self.api_key = api_key
+        self.api_calls = 0
+        self.max_concurrent_queries = max_concurrent_queries
+        self.token_activation_delay = token_activation_delay
+        self.token_retry_interval = token_retry_interval
+        self.max_token_retries = max_token_retries
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        self.metrics = metrics or MetricsRegistry()
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+        logger.info(f"Async Places client initialized (pool of {max_connections} connections).")
+
+    async def __aenter__(self) -> 'AsyncPlacesClient':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _send(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            response = await self.client.get(path, params={**params, 'key': self.api_key})
+        except httpx.TimeoutException as e:
+            raise Timeout() from e
+        except httpx.TransportError as e:
+            raise TransportError(e) from e
+        if response.status_code != 200:
+            raise HTTPError(response.status_code)
+        body = response.json()
+        status = body.get('status')
+        if status not in OK_API_STATUSES:
+            raise ApiError(status, body.get('error_message'))
+        return body
+
+    async def _call(self, endpoint: str, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Sends one API request through the rate limiter, retrying transient failures."""
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve()
+                if delay > 0:
+                    self.metrics.inc('rate_limit_wait_seconds_total', delay)
+                    await asyncio.sleep(delay)
+            self.api_calls += 1
+            started = time.perf_counter()
+            try:
+                response = await self._send(path, params)
+            except Exception as e:
+                self.metrics.observe('api_request_seconds', time.perf_counter() - started, endpoint=endpoint)
+                self.metrics.inc('api_requests_total', endpoint=endpoint, status=GoogleMapsClient._error_status(e))
+                if isinstance(e, ApiError) and e.status in QUOTA_API_STATUSES and self.rate_limiter is not None:
+                    self.rate_limiter.record_quota_error()
+                if not GoogleMapsClient._is_transient(e) or attempt >= self.retry_policy.max_retries:
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                attempt += 1
+                self.metrics.inc('api_retries_total', endpoint=endpoint)
+                logger.warning(f"Transient API error ({e}); retry {attempt}/{self.retry_policy.max_retries} in {delay:.2f}s.")
+                await asyncio.sleep(delay)
+                continue
+            self.metrics.observe('api_request_seconds', time.perf_counter() - started, endpoint=endpoint)
+            self.metrics.inc('api_requests_total', endpoint=endpoint, status='ok')
+            if self.rate_limiter is not None:
+                self.rate_limiter.record_success()
+            return response
+
+    def _record_page(self, page: NearbyPage, source: str, results_so_far: int) -> None:
+        self.metrics.inc('nearby_pages_total', source=source)
+        self.metrics.observe('nearby_results_per_page', len(page.results), buckets=RESULTS_PER_PAGE_BUCKETS)
+        if page.is_last:
+            self.metrics.inc('nearby_queries_total')
+            if results_so_far + len(page.results) >= NEARBY_MAX_RESULTS:
+                self.metrics.inc('nearby_queries_saturated_total')
+
+    async def fetch_nearby_page(self, query: NearbyQuery, page_token: Optional[str] = None) -> Dict[str, Any]:
+        """Performs a single Nearby Search request: the first page, or the page for ``page_token``."""
+        if page_token:
+            params: Dict[str, Any] = {'pagetoken': page_token}
+        else:
+            logger.debug(f"Nearby Search request: {query}")
+            params = {
+                'location': f"{query.latitude},{query.longitude}",
+                'radius': query.radius,
+                'type': query.business_type,
+            }
+        try:
+            return await self._call('nearby', NEARBY_SEARCH_PATH, params)
+        except QuotaExceededError:
+            raise
+        except ApiError as e:
+            if page_token and e.status == 'INVALID_REQUEST':
+                raise PageTokenNotReadyError(f"Page token not yet valid: {e}")
+            logger.error(f"Google Maps API error during Nearby Search: {e}", exc_info=True)
+            raise ApiClientError(f"API error during Nearby Search: {e}")
+        except (HTTPError, Timeout, TransportError) as e:
+            logger.error(f"Google Maps API error during Nearby Search: {e}", exc_info=True)
+            raise ApiClientError(f"API error during Nearby Search: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error during Nearby Search: {e}", exc_info=True)
+            raise ApiClientError(f"Unexpected error during Nearby Search: {e}")
+
+    async def get_place_details(self, place_id: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Fetches Place Details for one place, limited to ``fields`` (DETAILS_FIELDS by default)."""
+        params = {'place_id': place_id, 'fields': ','.join(fields or DETAILS_FIELDS)}
+        try:
+            response = await self._call('details', PLACE_DETAILS_PATH, params)
+            return response.get('result', {})
+        except QuotaExceededError:
+            raise
+        except (ApiError, HTTPError, Timeout, TransportError) as e:
+            logger.error(f"Google Maps API error during Place Details for {place_id}: {e}")
+            raise ApiClientError(f"API error during Place Details: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error during Place Details for {place_id}: {e}", exc_info=True)
+            raise ApiClientError(f"Unexpected error during Place Details: {e}")
+
+    async def _fetch_token_page(self, query: NearbyQuery, page_token: str) -> Dict[str, Any]:
+        """Waits for a page token to activate, retrying at short intervals until Google accepts it."""
+        await asyncio.sleep(self.token_activation_delay)
+        for attempt in range(self.max_token_retries + 1):
+            try:
+                return await self.fetch_nearby_page(query, page_token)
+            except PageTokenNotReadyError:
+                if attempt == self.max_token_retries:
+                    break
+                self.metrics.inc('page_token_retries_total')
+                await asyncio.sleep(self.token_retry_interval)
+        raise ApiClientError(f"Page token for {query} did not become valid after {self.max_token_retries} retries")
+
+    async def iter_nearby_pages(
+            self,
+            latitude: float,
+            longitude: float,
+            radius: int,
+            business_type: str
+    ) -> AsyncIterator[NearbyPage]:
+        """Yields Nearby Search results one page at a time, as soon as each page arrives."""
+        query = NearbyQuery(latitude=latitude, longitude=longitude, radius=radius, business_type=business_type)
+        # The cache is SQLite; its reads and writes run in a thread so they never block the event loop.
+        cached = await asyncio.to_thread(self.cache.get_nearby_pages, query) if self.cache is not None else None
+        if cached is not None:
+            logger.debug(f"Cache hit for {query}: {len(cached)} pages.")
+            total = 0
+            for page_index, response in enumerate(cached):
+                page = NearbyPage(query, response.get('results', []), page_index, response.get('next_page_token'))
+                self._record_page(page, 'cache', total)
+                total += len(page.results)
+                yield page
+            return
+
+        logger.info(f"Initiating Nearby Search: location={(latitude, longitude)}, radius={radius}, type={business_type}")
+        fetched: List[Dict[str, Any]] = []
+        response = await self.fetch_nearby_page(query)
+        page_index = 0
+        total = 0
+        while True:
+            fetched.append(response)
+            results = response.get('results', [])
+            next_page_token = response.get('next_page_token')
+            page = NearbyPage(query, results, page_index, next_page_token)
+            self._record_page(page, 'api', total)
+            total += len(results)
+            logger.debug(f"Nearby Search page returned {len(results)} results.")
+            yield page
+            if not next_page_token:
+                break
+            response = await self._fetch_token_page(query, next_page_token)
+            page_index += 1
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.put_nearby_pages, query, fetched)
+        logger.info(f"Nearby Search completed. Found {total} total potential places.")
+
+    async def find_nearby_businesses(
+            self,
+            latitude: float,
+            longitude: float,
+            radius: int,
+            business_type: str
+    ) -> List[Dict[str, Any]]:
+        """Finds businesses using Nearby Search, handling pagination."""
+        return [
+            place
+            async for page in self.iter_nearby_pages(latitude, longitude, radius, business_type)
+            for place in page.results
+        ]
+
+    async def find_nearby_businesses_many(self, queries: List[NearbyQuery]) -> Dict[NearbyQuery, List[Dict[str, Any]]]:
+        """Runs independent Nearby Search queries concurrently, at most ``max_concurrent_queries`` at a time."""
+        logger.info(f"Initiating {len(queries)} concurrent Nearby Search queries.")
+        semaphore = asyncio.Semaphore(self.max_concurrent_queries)
+
+        async def run_one(query: NearbyQuery) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.find_nearby_businesses(
+                    query.latitude, query.longitude, query.radius, query.business_type
+                )
+
+        results = await asyncio.gather(*(run_one(query) for query in queries))
+        return dict(zip(queries, results))
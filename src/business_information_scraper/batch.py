@@ -0,0 +1,119 @@
+import csv
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from pydantic import ValidationError
+
+from src.business_information_scraper.data_models import BatchReport, JobResult, SearchJob
+from src.business_information_scraper.exceptions import ConfigurationError
+from src.business_information_scraper.processor import BusinessDataProcessor
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    tomllib = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+def _read_manifest_rows(path: str) -> List[Dict[str, Any]]:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        with open(path, newline='', encoding='utf-8') as f:
+            # Empty cells fall back to the defaults instead of failing validation.
+            return [{k: v for k, v in row.items() if v not in (None, '')} for row in csv.DictReader(f)]
+    if extension == '.json':
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return data['jobs'] if isinstance(data, dict) else data
+    if extension == '.toml':
+        if tomllib is None:
+            raise ConfigurationError("TOML manifests require Python 3.11 or newer")
+        with open(path, 'rb') as f:
+            return tomllib.load(f).get('jobs', [])
+    raise ConfigurationError(f"Unsupported manifest format: {extension or path}")
+
+
+def load_manifest(path: str, default_radius: int, default_business_type: str) -> List[SearchJob]:
+    """Loads search jobs from a CSV, JSON or TOML manifest.
+
+    CSV files need a header row; JSON files hold a list of jobs (or ``{"jobs": [...]}``);
+    TOML files use ``[[jobs]]`` tables. ``radius_meters`` and ``business_type`` may be
+    omitted per job, in which case the given defaults apply.
+    """
+    try:
+        rows = _read_manifest_rows(path)
+    except (OSError, ValueError, KeyError) as e:
+        raise ConfigurationError(f"Could not read batch manifest {path}: {e}")
+
+    jobs = []
+    for index, row in enumerate(rows, start=1):
+        try:
+            jobs.append(SearchJob(**{
+                'radius_meters': default_radius,
+                'business_type': default_business_type,
+                **row,
+            }))
+        except (ValidationError, TypeError) as e:
+            raise ConfigurationError(f"Invalid job #{index} in manifest {path}: {e}")
+    logger.info(f"Loaded {len(jobs)} search jobs from {path}")
+    return jobs
+
+
+def run_job(processor: BusinessDataProcessor, job: SearchJob) -> JobResult:
+    """Runs one search job, turning a failure into an unsuccessful result instead of raising."""
+    started = time.perf_counter()
+    try:
+        processed = processor.process_location(
+            latitude=job.latitude,
+            longitude=job.longitude,
+            radius=job.radius_meters,
+            business_type=job.business_type,
+        )
+        return JobResult(
+            job=job, succeeded=True, businesses_processed=processed,
+            duration_seconds=time.perf_counter() - started,
+        )
+    except Exception as e:
+        # process_location re-raises with the original error as the cause.
+        cause = e.__cause__ or e
+        logger.error(f"Search job {job.label} failed: {cause!r}")
+        return JobResult(
+            job=job, succeeded=False, error=f"{type(cause).__name__}: {cause}",
+            duration_seconds=time.perf_counter() - started,
+        )
+
+
+class BatchRunner:
+    """Runs many search jobs through one processor on a bounded thread pool.
+
+    All jobs share the processor's API client and storage. A failing job is recorded
+    in the report and does not stop the others.
+    """
+
+    def __init__(self, processor: BusinessDataProcessor, max_workers: int = 4):
+        self.processor = processor
+        self.max_workers = max_workers
+
+    def _run_job(self, job: SearchJob) -> JobResult:
+        return run_job(self.processor, job)
+
+    def run(self, jobs: List[SearchJob]) -> BatchReport:
+        """Runs all jobs and returns a report in manifest order."""
+        logger.info(f"Starting batch of {len(jobs)} jobs with {self.max_workers} workers.")
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='batch-job') as executor:
+            results = list(executor.map(self._run_job, jobs))
+        report = BatchReport(results=results, duration_seconds=time.perf_counter() - started)
+        logger.info(
+            f"Batch finished in {report.duration_seconds:.1f}s: "
+            f"{report.succeeded} succeeded, {report.failed} failed."
+        )
+        for result in report.results:
+            if not result.succeeded:
+                logger.warning(f"Failed job {result.job.label}: {result.error}")
+        return report
@@ -0,0 +1,134 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from src.business_information_scraper.data_models import NearbyQuery
+from src.business_information_scraper.exceptions import StorageError
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """SQLite-backed cache of Places API responses with a TTL and LRU eviction.
+
+    Nearby Search pages are keyed by normalized location, radius, type and page
+    index. A query's pages are written together once its last page has arrived,
+    so a lookup either finds the complete page chain or nothing; an interrupted
+    query is simply fetched again.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 86400, max_entries: int = 100_000, bypass: bool = False):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # When bypassed, lookups always miss but fresh responses still refresh the cache.
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        try:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses(last_access)")
+            self._conn.commit()
+        except sqlite3.Error as e:
+            raise StorageError(f"Could not open response cache at {path}: {e}")
+        logger.info(f"Response cache opened at {path} (ttl={ttl_seconds}s, max_entries={max_entries}, bypass={bypass})")
+
+    @staticmethod
+    def nearby_key(query: NearbyQuery, page_index: int) -> str:
+        # Six decimals is ~0.1 m, enough to make float noise from tiling irrelevant.
+        return (
+            f"nearby|{query.latitude:.6f},{query.longitude:.6f}|{query.radius}|"
+            f"{query.business_type.strip().lower()}|{page_index}"
+        )
+
+    @staticmethod
+    def geocode_key(address: str) -> str:
+        return f"geocode|{' '.join(address.lower().split())}"
+
+    def _read(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute("SELECT value, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, created_at = row
+        if now - created_at > self.ttl_seconds:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+        self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        return json.loads(value)
+
+    def _evict(self) -> None:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY last_access LIMIT ?)",
+                (excess,),
+            )
+            self.evictions += excess
+            logger.debug(f"Evicted {excess} least recently used cache entries.")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns a single cached response, or None on a miss."""
+        if self.bypass:
+            self.misses += 1
+            return None
+        with self._lock, self._conn:
+            value = self._read(key, time.time())
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Stores a single response."""
+        self.put_many({key: value})
+
+    def put_many(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO responses (key, value, created_at, last_access) VALUES (?, ?, ?, ?)",
+                [(key, json.dumps(value), now, now) for key, value in entries.items()],
+            )
+            self._evict()
+
+    def get_nearby_pages(self, query: NearbyQuery) -> Optional[List[Dict[str, Any]]]:
+        """Returns every cached page of a Nearby Search query, or None unless the whole chain is fresh."""
+        if self.bypass:
+            self.misses += 1
+            return None
+        pages: List[Dict[str, Any]] = []
+        now = time.time()
+        with self._lock, self._conn:
+            while True:
+                page = self._read(self.nearby_key(query, len(pages)), now)
+                if page is None:
+                    self.misses += 1
+                    return None
+                pages.append(page)
+                if not page.get('next_page_token'):
+                    break
+            self.hits += 1
+        return pages
+
+    def put_nearby_pages(self, query: NearbyQuery, pages: List[Dict[str, Any]]) -> None:
+        """Stores the complete page chain of a Nearby Search query."""
+        self.put_many({self.nearby_key(query, index): page for index, page in enumerate(pages)})
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+        logger.info(f"Response cache closed: {self.hits} hits, {self.misses} misses, {self.evictions} evictions.")
@@ -0,0 +1,121 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.business_information_scraper.data_models import NearbyQuery
+from src.business_information_scraper.exceptions import StorageError
+
+logger = logging.getLogger(__name__)
+
+
+def query_key(query: NearbyQuery) -> str:
+    return f"{query.latitude:.6f},{query.longitude:.6f}|{query.radius}|{query.business_type}"
+
+
+class CheckpointJournal:
+    """Append-only JSON-lines journal of run progress, used to resume interrupted runs.
+
+    It records which queries (tiles) are complete, whether each tile was saturated,
+    the ``next_page_token`` of every page whose rows were stored (with the time it
+    was issued) and the number of rows flushed to storage. Page and completion
+    events are only written after the matching rows are flushed, so resuming never
+    skips data that did not reach storage.
+
+    Opening without ``resume`` starts a fresh journal, discarding the old one.
+    """
+
+    def __init__(self, path: str, resume: bool = False, token_ttl_seconds: float = 120):
+        self.path = path
+        self.token_ttl_seconds = token_ttl_seconds
+        self.rows_flushed = 0
+        self._completed: Dict[str, bool] = {}
+        self._tiles: Dict[str, bool] = {}
+        self._resume_points: Dict[str, Tuple[int, str, float]] = {}
+        self._lock = threading.Lock()
+        if resume:
+            self._load()
+        try:
+            self._file = open(path, 'a' if resume else 'w', encoding='utf-8')
+        except OSError as e:
+            raise StorageError(f"Could not open checkpoint journal {path}: {e}")
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            logger.warning(f"No checkpoint journal at {self.path}; starting from scratch.")
+            return
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    self._apply(json.loads(line))
+                except ValueError:
+                    # A crash can leave a half-written last line; everything before it is valid.
+                    logger.warning(f"Ignoring truncated checkpoint entry in {self.path}.")
+        logger.info(
+            f"Resuming from {self.path}: {len(self._completed)} queries complete, "
+            f"{len(self._resume_points)} in progress, {self.rows_flushed} rows already flushed."
+        )
+
+    def _apply(self, event: Dict[str, Any]) -> None:
+        kind = event['event']
+        if kind == 'page':
+            self._resume_points[event['query']] = (event['page_index'], event['next_page_token'], event['issued_at'])
+        elif kind == 'query_done':
+            self._completed[event['query']] = True
+            self._resume_points.pop(event['query'], None)
+        elif kind == 'tile':
+            self._tiles[event['query']] = event['saturated']
+        elif kind == 'flush':
+            self.rows_flushed += event['rows']
+
+    def _append(self, events: List[Dict[str, Any]]) -> None:
+        if not events:
+            return
+        with self._lock:
+            for event in events:
+                self._apply(event)
+                self._file.write(json.dumps(event) + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    @staticmethod
+    def page_event(query: NearbyQuery, page_index: int, next_page_token: str) -> Dict[str, Any]:
+        """Event stating that ``page_index`` is stored and the next page is reachable via the token."""
+        return {
+            'event': 'page', 'query': query_key(query),
+            'page_index': page_index + 1, 'next_page_token': next_page_token, 'issued_at': time.time(),
+        }
+
+    @staticmethod
+    def query_done_event(query: NearbyQuery) -> Dict[str, Any]:
+        return {'event': 'query_done', 'query': query_key(query)}
+
+    def record_stored(self, events: List[Dict[str, Any]], rows: int) -> None:
+        """Journals page/query events whose rows have just been flushed, plus the flush itself."""
+        self._append(events + [{'event': 'flush', 'rows': rows}])
+
+    def record_tile(self, query: NearbyQuery, saturated: bool) -> None:
+        self._append([{'event': 'tile', 'query': query_key(query), 'saturated': saturated}])
+
+    def is_completed(self, query: NearbyQuery) -> bool:
+        return query_key(query) in self._completed
+
+    def tile_saturated(self, query: NearbyQuery) -> Optional[bool]:
+        return self._tiles.get(query_key(query))
+
+    def resume_point(self, query: NearbyQuery) -> Optional[Tuple[int, str]]:
+        """Returns ``(page_index, page_token)`` to continue a query, if its token is still fresh."""
+        point = self._resume_points.get(query_key(query))
+        if point is None:
+            return None
+        page_index, token, issued_at = point
+        if time.time() - issued_at > self.token_ttl_seconds:
+            logger.info(f"Page token for {query} has expired; the query restarts from its first page.")
+            return None
+        return page_index, token
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
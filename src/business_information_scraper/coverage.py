@@ -0,0 +1,85 @@
+import logging
+import math
+from typing import Any, Dict, List, Tuple
+
+from src.business_information_scraper.data_models import CoveragePlan, SearchTile
+from src.business_information_scraper.exceptions import ApiClientError
+from src.business_information_scraper.maps_api_client import GoogleMapsClient
+from src.business_information_scraper.metrics import DEFAULT_PRICES_PER_1000
+from src.business_information_scraper.pagination import NEARBY_MAX_PAGES
+from src.business_information_scraper.tiling import EARTH_RADIUS_METERS, offset_coordinates
+
+logger = logging.getLogger(__name__)
+
+
+def area_bounds(result: Dict[str, Any]) -> Tuple[float, float, float, float]:
+    """(south, west, north, east) of a geocoding result: its bounds when it has them, else its viewport."""
+    geometry = result.get('geometry') or {}
+    box = geometry.get('bounds') or geometry.get('viewport')
+    if not box:
+        raise ApiClientError(f"Geocoding result for {result.get('formatted_address')!r} has no viewport")
+    return box['southwest']['lat'], box['southwest']['lng'], box['northeast']['lat'], box['northeast']['lng']
+
+
+def hex_cover(south: float, west: float, north: float, east: float, radius: float) -> List[SearchTile]:
+    """Circles of ``radius`` in a hexagonal packing that covers a bounding box.
+
+    Centres sit on a triangular lattice, ``radius * sqrt(3)`` apart within a row
+    and ``1.5 * radius`` between rows, every other row shifted by half a step.
+    Each circle then only has to cover its own hexagonal cell, the arrangement
+    with the least overlap: the circles' total area is about 1.21 times the area
+    covered, against 1.57 for a square grid. The lattice is centred on the box
+    and circles whose cell does not reach into it are left out.
+    """
+    if east < west:  # the box crosses the antimeridian
+        east += 360.0
+    center_latitude, center_longitude = (south + north) / 2, (west + east) / 2
+    half_height = math.radians(north - south) / 2 * EARTH_RADIUS_METERS
+    half_width = math.radians(east - west) / 2 * EARTH_RADIUS_METERS * math.cos(math.radians(center_latitude))
+    step, row_step = radius * math.sqrt(3), 1.5 * radius
+    rows = math.ceil((half_height + radius) / row_step)
+    columns = math.ceil((half_width + step) / step)
+    circles = []
+    for row in range(-rows, rows + 1):
+        north_meters = row * row_step
+        # A cell reaches radius above and below its centre, and step / 2 to either side.
+        if abs(north_meters) - radius >= half_height:
+            continue
+        shift = step / 2 if row % 2 else 0.0
+        for column in range(-columns, columns + 1):
+            east_meters = column * step + shift
+            if abs(east_meters) - step / 2 >= half_width:
+                continue
+            latitude, longitude = offset_coordinates(center_latitude, center_longitude, north_meters, east_meters)
+            if longitude > 180:
+                longitude -= 360.0
+            circles.append(SearchTile(latitude=latitude, longitude=longitude, radius=radius))
+    return circles
+
+
+def plan_coverage(client: GoogleMapsClient, area: str, radius: int, business_type: str) -> CoveragePlan:
+    """Geocodes an area and covers its bounds with search circles, without any Nearby Search call.
+
+    The geocoding result is cached with the client's response cache, so planning
+    the same area again is free. A circle takes one to NEARBY_MAX_PAGES calls,
+    depending on how many places it holds.
+    """
+    calls_before = client.api_calls
+    result = client.geocode(area)
+    south, west, north, east = area_bounds(result)
+    circles = hex_cover(south, west, north, east, radius)
+    max_calls = len(circles) * NEARBY_MAX_PAGES
+    return CoveragePlan(
+        area=result.get('formatted_address') or area,
+        south=south,
+        west=west,
+        north=north,
+        east=east,
+        radius_meters=radius,
+        business_type=business_type,
+        circles=circles,
+        geocode_calls=client.api_calls - calls_before,
+        min_nearby_calls=len(circles),
+        max_nearby_calls=max_calls,
+        max_cost_usd=max_calls * DEFAULT_PRICES_PER_1000['nearby'] / 1000,
+    )
@@ -1,5 +1,9 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt, computed_field
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
+
+# Placeholders stored when Nearby Search gave no address/phone and no details were fetched.
+UNKNOWN_ADDRESS = 'unknown_address'
+UNKNOWN_PHONE_NUMBER = 'unknown_phone_number'
 
 class BusinessInfo(BaseModel):
     place_id: str
@@ -7,3 +11,176 @@ class BusinessInfo(BaseModel):
     address: Optional[str] = None
     phone_number: Optional[str] = None
     types: List[str] = Field(default_factory=list)
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+
+class BusinessRecord(NamedTuple):
+    """Compact, tuple-backed form of ``BusinessInfo`` used inside the pipeline.
+
+    Fields match ``BusinessInfo``, so storage backends accept either. Records with
+    the same types share one tuple of interned strings. Convert with
+    ``to_model()`` where a validated pydantic model is needed.
+    """
+    place_id: str
+    name: str
+    address: Optional[str]
+    phone_number: Optional[str]
+    types: Tuple[str, ...]
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+    def to_model(self) -> BusinessInfo:
+        return BusinessInfo(
+            place_id=self.place_id,
+            name=self.name,
+            address=self.address,
+            phone_number=self.phone_number,
+            types=list(self.types),
+            latitude=self.latitude,
+            longitude=self.longitude,
+        )
+
+    def to_json_dict(self) -> dict:
+        return {**self._asdict(), 'types': list(self.types)}
+
+
+# Anything a storage backend can write: both expose the same attributes.
+BusinessRow = Union[BusinessInfo, BusinessRecord]
+
+
+class NearbyQuery(BaseModel):
+    """A single Nearby Search request, hashable so it can key scheduler state."""
+    model_config = ConfigDict(frozen=True)
+
+    latitude: float
+    longitude: float
+    radius: int
+    business_type: str
+
+
+def split_business_types(business_type: Union[str, Sequence[str]]) -> List[str]:
+    """The distinct types of a search, given as a list or a comma-separated string, in order.
+
+    Places type names never contain commas, so ``'cafe,bar'`` is two types.
+    """
+    names = business_type.split(',') if isinstance(business_type, str) else business_type
+    types = list(dict.fromkeys(name.strip() for name in names if name.strip()))
+    if not types:
+        raise ValueError(f"No business type given in {business_type!r}")
+    return types
+
+
+class SearchTile(BaseModel):
+    """A circular Nearby Search area produced by adaptive tiling."""
+    latitude: float
+    longitude: float
+    radius: float
+    depth: int = 0
+
+
+class TilingSummary(BaseModel):
+    """Coverage and cost figures for an adaptive tiling run."""
+    tiles_searched: int = 0
+    saturated_tiles: int = 0
+    truncated_tiles: int = 0
+    max_depth: int = 0
+    api_calls: int = 0
+    unique_places: int = 0
+    leaf_area: float = 0.0
+    truncated_area: float = 0.0
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def coverage_ratio(self) -> float:
+        """Share of the searched leaf area whose results were not cut off by the 60-result cap."""
+        if not self.leaf_area:
+            return 1.0
+        return 1.0 - self.truncated_area / self.leaf_area
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def places_per_call(self) -> float:
+        return self.unique_places / self.api_calls if self.api_calls else 0.0
+
+
+class SearchJob(BaseModel):
+    """One location/business type combination listed in a batch manifest."""
+    latitude: float
+    longitude: float
+    radius_meters: PositiveInt
+    business_type: str
+    name: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        return self.name or f"{self.business_type}@({self.latitude}, {self.longitude}) r={self.radius_meters}m"
+
+
+class CoveragePlan(BaseModel):
+    """Search circles covering a geocoded area, and the Nearby Search calls they will take."""
+    area: str
+    south: float
+    west: float
+    north: float
+    east: float
+    radius_meters: PositiveInt
+    business_type: str
+    circles: List[SearchTile] = Field(default_factory=list)
+    geocode_calls: int = 0
+    min_nearby_calls: int = 0
+    max_nearby_calls: int = 0
+    max_cost_usd: float = 0.0
+
+    def jobs(self) -> List['SearchJob']:
+        return [
+            SearchJob(
+                latitude=round(circle.latitude, 6),
+                longitude=round(circle.longitude, 6),
+                radius_meters=self.radius_meters,
+                business_type=self.business_type,
+                name=f"{self.area} circle {number}/{len(self.circles)}",
+            )
+            for number, circle in enumerate(self.circles, start=1)
+        ]
+
+
+class JobResult(BaseModel):
+    """Outcome of running a single SearchJob."""
+    job: SearchJob
+    succeeded: bool
+    businesses_processed: int = 0
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+
+
+class BatchReport(BaseModel):
+    """Per-job outcomes of a batch run."""
+    results: List[JobResult] = Field(default_factory=list)
+    duration_seconds: float = 0.0
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for result in self.results if result.succeeded)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+
+class EnrichmentStats(BaseModel):
+    """Concurrency and latency figures for the Place Details stage."""
+    requested: int = 0
+    deduplicated: int = 0
+    api_requests: int = 0
+    failures: int = 0
+    peak_concurrency: int = 0
+    total_latency_seconds: float = 0.0
+    max_latency_seconds: float = 0.0
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def mean_latency_seconds(self) -> float:
+        return self.total_latency_seconds / self.api_requests if self.api_requests else 0.0
@@ -0,0 +1,231 @@
+import hashlib
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.business_information_scraper.data_models import BusinessRecord
+from src.business_information_scraper.exceptions import StorageError
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings, sized for ``capacity`` items at ``error_rate``.
+
+    Probe positions come from one 128-bit BLAKE2b digest split into two hashes
+    (Kirsch-Mitzenmacher double hashing), so they are stable across processes.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+def content_hash(record: BusinessRecord) -> str:
+    """Digest of the stored fields of a record, used to tell whether a place changed."""
+    latitude = None if record.latitude is None else round(record.latitude, 6)
+    longitude = None if record.longitude is None else round(record.longitude, 6)
+    payload = json.dumps(
+        [record.name, record.address, record.phone_number, sorted(record.types), latitude, longitude]
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=12).hexdigest()
+
+
+class PlaceIndex:
+    """Persistent record of the place_ids already written to storage, across runs.
+
+    Every stored place_id is kept in SQLite with when it was last fetched and a
+    hash of its content; an in-memory bloom filter answers most lookups without
+    touching the database, and only its hits are confirmed there. The filter
+    takes about 1.8 MB per million places at the default error rate, however many
+    IDs the table holds. Its bits are snapshotted into the database on
+    ``close()`` and caught up from newer rows on open, so a crash only costs a
+    partial rebuild.
+
+    Without ``stale_after_seconds`` a stored place is skipped for good. With it,
+    places last fetched longer ago are handed out again for a refresh, and
+    ``split_changed`` tells which refreshed records differ from what was stored.
+
+    IDs returned by ``claim_new`` stay reserved until ``mark_stored`` persists
+    them or ``release`` gives them back, so a place seen twice in one run is only
+    processed once.
+    """
+
+    # Columns added after the first release; older index files get them on open.
+    _ADDED_COLUMNS = {'last_fetched': 'REAL', 'content_hash': 'TEXT'}
+
+    def __init__(
+            self,
+            path: str,
+            expected_places: int = 10_000_000,
+            error_rate: float = 0.001,
+            stale_after_seconds: Optional[float] = None,
+    ):
+        self.path = path
+        self.stale_after_seconds = stale_after_seconds
+        self.bloom = BloomFilter(expected_places, error_rate)
+        self.known = 0
+        self.false_positives = 0
+        # Reserved IDs and the content hash stored for them (None for new places).
+        self._pending: Dict[str, Optional[str]] = {}
+        # Reserved IDs that were not in the table when claimed.
+        self._new: Set[str] = set()
+        self._lock = threading.Lock()
+        try:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS places ("
+                "id INTEGER PRIMARY KEY, place_id TEXT NOT NULL UNIQUE, last_fetched REAL, content_hash TEXT)"
+            )
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(places)")}
+            for column, column_type in self._ADDED_COLUMNS.items():
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE places ADD COLUMN {column} {column_type}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS bloom_snapshot ("
+                "num_bits INTEGER NOT NULL, num_hashes INTEGER NOT NULL, last_id INTEGER NOT NULL, bits BLOB NOT NULL)"
+            )
+            self._conn.commit()
+            self._load()
+        except sqlite3.Error as e:
+            raise StorageError(f"Could not open place index at {path}: {e}")
+        if self.known > expected_places:
+            logger.warning(
+                f"Place index holds {self.known} IDs, more than the {expected_places} it is sized for; "
+                f"raise DEDUP_EXPECTED_PLACES to keep lookups fast."
+            )
+        logger.info(f"Place index opened at {path} with {self.known} known places")
+
+    def _load(self) -> None:
+        """Restores the bloom filter from its snapshot, then adds the rows written after it."""
+        last_id = 0
+        snapshot = self._conn.execute("SELECT num_bits, num_hashes, last_id, bits FROM bloom_snapshot").fetchone()
+        if snapshot is not None and snapshot[:2] == (self.bloom.num_bits, self.bloom.num_hashes):
+            last_id = snapshot[2]
+            self.bloom.bits = bytearray(snapshot[3])
+        elif snapshot is not None:
+            logger.info("Place index was snapshotted with another size; rebuilding its bloom filter.")
+        rows = self._conn.execute("SELECT place_id FROM places WHERE id > ?", (last_id,))
+        for (place_id,) in rows:
+            self.bloom.add(place_id)
+        (self.known,) = self._conn.execute("SELECT COUNT(*) FROM places").fetchone()
+
+    def _stored(self, place_ids: List[str]) -> Dict[str, Tuple[Optional[float], Optional[str]]]:
+        """Maps the stored IDs among ``place_ids`` to their last fetch time and content hash."""
+        # The IDs go in as one JSON array parameter, so any number of them fits one query.
+        rows = self._conn.execute(
+            "SELECT place_id, last_fetched, content_hash FROM places "
+            "WHERE place_id IN (SELECT value FROM json_each(?))",
+            (json.dumps(place_ids),),
+        )
+        return {place_id: (last_fetched, digest) for place_id, last_fetched, digest in rows}
+
+    def claim_new(self, place_ids: Iterable[str]) -> Tuple[List[str], int]:
+        """Returns the IDs that are new or stale and not reserved yet, reserving them, plus the number skipped."""
+        place_ids = list(place_ids)
+        stale_before = time.time() - self.stale_after_seconds if self.stale_after_seconds else None
+        with self._lock:
+            maybe_known = [place_id for place_id in place_ids if place_id in self.bloom]
+            stored = self._stored(maybe_known) if maybe_known else {}
+            self.false_positives += len(set(maybe_known) - stored.keys())
+            new: List[str] = []
+            for place_id in place_ids:
+                if place_id in self._pending:
+                    continue
+                if place_id in stored:
+                    last_fetched, digest = stored[place_id]
+                    if stale_before is None or (last_fetched is not None and last_fetched >= stale_before):
+                        continue
+                    self._pending[place_id] = digest
+                else:
+                    self._pending[place_id] = None
+                    self._new.add(place_id)
+                new.append(place_id)
+        return new, len(place_ids) - len(new)
+
+    def split_changed(self, records: Sequence[BusinessRecord]) -> Tuple[List[BusinessRecord], List[BusinessRecord]]:
+        """Splits reserved records into those whose content differs from the stored copy and those unchanged."""
+        changed: List[BusinessRecord] = []
+        unchanged: List[BusinessRecord] = []
+        with self._lock:
+            for record in records:
+                previous = self._pending.get(record.place_id)
+                if previous is not None and previous == content_hash(record):
+                    unchanged.append(record)
+                else:
+                    changed.append(record)
+        return changed, unchanged
+
+    def mark_stored(self, records: Sequence[BusinessRecord]) -> None:
+        """Persists reserved records once their rows are in storage, or were found unchanged."""
+        fetched_at = time.time()
+        rows = [(record.place_id, fetched_at, content_hash(record)) for record in records]
+        with self._lock:
+            place_ids = [place_id for place_id, _, _ in rows]
+            # New places were looked up when claimed; only IDs stored without a claim are checked here.
+            unclaimed = [place_id for place_id in place_ids if place_id not in self._pending]
+            try:
+                new = self._new.intersection(place_ids)
+                if unclaimed:
+                    new.update(set(unclaimed) - self._stored(unclaimed).keys())
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT INTO places (place_id, last_fetched, content_hash) VALUES (?, ?, ?) "
+                        "ON CONFLICT(place_id) DO UPDATE SET "
+                        "last_fetched = excluded.last_fetched, content_hash = excluded.content_hash",
+                        rows,
+                    )
+            except sqlite3.Error as e:
+                raise StorageError(f"Could not update place index at {self.path}: {e}")
+            for place_id in place_ids:
+                self._pending.pop(place_id, None)
+                self.bloom.add(place_id)
+            # Counted from the table rather than the bloom filter, whose false positives look known.
+            self.known += len(new)
+            self._new -= new
+
+    def release(self, place_ids: Iterable[str]) -> None:
+        """Gives back reserved IDs whose rows were not stored, so a later sighting retries them."""
+        with self._lock:
+            for place_id in place_ids:
+                self._pending.pop(place_id, None)
+                self._new.discard(place_id)
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                with self._conn:
+                    (last_id,) = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM places").fetchone()
+                    self._conn.execute("DELETE FROM bloom_snapshot")
+                    self._conn.execute(
+                        "INSERT INTO bloom_snapshot (num_bits, num_hashes, last_id, bits) VALUES (?, ?, ?, ?)",
+                        (self.bloom.num_bits, self.bloom.num_hashes, last_id, bytes(self.bloom.bits)),
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Could not snapshot place index at {self.path}: {e}")
+            finally:
+                self._conn.close()
+        logger.info(
+            f"Place index closed: {self.known} known places, {self.false_positives} bloom filter false positives."
+        )
@@ -0,0 +1,169 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from src.business_information_scraper.data_models import EnrichmentStats
+from src.business_information_scraper.exceptions import ApiClientError, QuotaExceededError
+from src.business_information_scraper.maps_api_client import DETAILS_FIELDS, GoogleMapsClient
+
+if TYPE_CHECKING:
+    from src.business_information_scraper.async_client import AsyncPlacesClient
+
+logger = logging.getLogger(__name__)
+
+
+class DetailsEnricher:
+    """Adds Place Details (address, phone, types) to Nearby Search results.
+
+    Lookups run on a bounded worker pool that lives as long as the enricher, so
+    concurrent batch jobs share it. A place_id already being fetched is not
+    requested again; later callers wait on the same in-flight lookup.
+    """
+
+    def __init__(self, client: GoogleMapsClient, max_workers: int = 8, fields: Optional[List[str]] = None):
+        self.client = client
+        self.fields = fields or DETAILS_FIELDS
+        self.stats = EnrichmentStats()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='details')
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._active = 0
+
+    def _fetch(self, place_id: str) -> Dict[str, Any]:
+        with self._lock:
+            self._active += 1
+            self.stats.peak_concurrency = max(self.stats.peak_concurrency, self._active)
+        started = time.perf_counter()
+        try:
+            return self.client.get_place_details(place_id, fields=self.fields)
+        finally:
+            latency = time.perf_counter() - started
+            with self._lock:
+                self._active -= 1
+                self.stats.api_requests += 1
+                self.stats.total_latency_seconds += latency
+                self.stats.max_latency_seconds = max(self.stats.max_latency_seconds, latency)
+
+    def _forget(self, place_id: str) -> None:
+        with self._lock:
+            self._in_flight.pop(place_id, None)
+
+    def _submit(self, place_id: str) -> Future:
+        with self._lock:
+            self.stats.requested += 1
+            future = self._in_flight.get(place_id)
+            if future is not None:
+                self.stats.deduplicated += 1
+                return future
+            future = self._executor.submit(self._fetch, place_id)
+            self._in_flight[place_id] = future
+        future.add_done_callback(lambda _: self._forget(place_id))
+        return future
+
+    def enrich(self, places: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Returns the places, in order, with their Place Details merged in.
+
+        A place whose lookup fails is returned unchanged so it can still be stored
+        with the fields Nearby Search provided. QuotaExceededError is raised: every
+        further lookup would fail the same way.
+        """
+        futures = [(place, self._submit(place['place_id']) if place.get('place_id') else None) for place in places]
+        enriched = []
+        for place, future in futures:
+            if future is None:
+                enriched.append(place)
+                continue
+            try:
+                enriched.append({**place, **future.result()})
+            except QuotaExceededError:
+                raise
+            except ApiClientError as e:
+                with self._lock:
+                    self.stats.failures += 1
+                logger.warning(f"Keeping Nearby Search data for {place['place_id']}; details lookup failed: {e}")
+                enriched.append(place)
+        return enriched
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        logger.info(
+            f"Details stage: {self.stats.api_requests} requests for {self.stats.requested} places "
+            f"({self.stats.deduplicated} deduplicated, {self.stats.failures} failed), "
+            f"peak concurrency {self.stats.peak_concurrency}, "
+            f"mean latency {self.stats.mean_latency_seconds * 1000:.0f} ms, "
+            f"max latency {self.stats.max_latency_seconds * 1000:.0f} ms."
+        )
+
+
+class AsyncDetailsEnricher:
+    """asyncio counterpart of ``DetailsEnricher`` for use with ``AsyncPlacesClient``.
+
+    At most ``max_concurrency`` lookups run at once; a place_id already being
+    fetched is shared with later callers, as in the threaded enricher.
+    """
+
+    def __init__(self, client: 'AsyncPlacesClient', max_concurrency: int = 8, fields: Optional[List[str]] = None):
+        self.client = client
+        self.fields = fields or DETAILS_FIELDS
+        self.stats = EnrichmentStats()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._active = 0
+
+    async def _fetch(self, place_id: str) -> Dict[str, Any]:
+        async with self._semaphore:
+            self._active += 1
+            self.stats.peak_concurrency = max(self.stats.peak_concurrency, self._active)
+            started = time.perf_counter()
+            try:
+                return await self.client.get_place_details(place_id, fields=self.fields)
+            finally:
+                latency = time.perf_counter() - started
+                self._active -= 1
+                self.stats.api_requests += 1
+                self.stats.total_latency_seconds += latency
+                self.stats.max_latency_seconds = max(self.stats.max_latency_seconds, latency)
+                self._in_flight.pop(place_id, None)
+
+    def _submit(self, place_id: str) -> asyncio.Task:
+        self.stats.requested += 1
+        task = self._in_flight.get(place_id)
+        if task is not None:
+            self.stats.deduplicated += 1
+            return task
+        task = asyncio.ensure_future(self._fetch(place_id))
+        self._in_flight[place_id] = task
+        return task
+
+    async def enrich(self, places: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Returns the places, in order, with their Place Details merged in; failed lookups keep the place unchanged."""
+        tasks = [self._submit(place['place_id']) if place.get('place_id') else None for place in places]
+        outcomes = await asyncio.gather(*(task for task in tasks if task is not None), return_exceptions=True)
+        outcome_iter = iter(outcomes)
+        enriched = []
+        for place, task in zip(places, tasks):
+            if task is None:
+                enriched.append(place)
+                continue
+            details = next(outcome_iter)
+            if isinstance(details, ApiClientError) and not isinstance(details, QuotaExceededError):
+                self.stats.failures += 1
+                logger.warning(f"Keeping Nearby Search data for {place['place_id']}; details lookup failed: {details}")
+                enriched.append(place)
+            elif isinstance(details, BaseException):
+                raise details
+            else:
+                enriched.append({**place, **details})
+        return enriched
+
+    def close(self) -> None:
+        logger.info(
+            f"Details stage: {self.stats.api_requests} requests for {self.stats.requested} places "
+            f"({self.stats.deduplicated} deduplicated, {self.stats.failures} failed), "
+            f"peak concurrency {self.stats.peak_concurrency}, "
+            f"mean latency {self.stats.mean_latency_seconds * 1000:.0f} ms, "
+            f"max latency {self.stats.max_latency_seconds * 1000:.0f} ms."
+        )
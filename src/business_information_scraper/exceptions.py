@@ -48,3 +48,21 @@ class StorageError(BusinessLocatorError):
         - Database constraint violations during insertion.
     """
     pass
+
+
+class PageTokenNotReadyError(ApiClientError):
+    """Raised when a ``next_page_token`` is used before Google has activated it.
+
+    Google issues the token a short while before it becomes valid; requests made
+    in that window fail with INVALID_REQUEST and can simply be retried.
+    """
+    pass
+
+
+class QuotaExceededError(ApiClientError):
+    """Raised when the configured daily request budget has been used up.
+
+    Unlike OVER_QUERY_LIMIT responses this is not retried: no further requests
+    are sent until the budget resets.
+    """
+    pass
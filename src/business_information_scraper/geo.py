@@ -0,0 +1,82 @@
+import logging
+from operator import attrgetter
+from typing import Dict, List, NamedTuple, Sequence
+
+from src.business_information_scraper.data_models import BusinessRecord
+from src.business_information_scraper.exceptions import ConfigurationError
+
+try:
+    import numpy as np  # type: ignore[import-not-found]
+except ImportError:  # the geo filter is optional
+    np = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Mean Earth radius (IUGG), in metres.
+EARTH_RADIUS_METERS = 6_371_008.8
+
+_place_id = attrgetter('place_id')
+_latitude = attrgetter('latitude')
+_longitude = attrgetter('longitude')
+
+
+class GeoFilterResult(NamedTuple):
+    """Records kept by ``filter_records`` and how many were dropped, by reason."""
+    records: List[BusinessRecord]
+    out_of_radius: int
+    duplicates: int
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise ConfigurationError("Radius filtering requires the 'numpy' package")
+
+
+def haversine_meters(latitude: float, longitude: float, latitudes: 'np.ndarray', longitudes: 'np.ndarray') -> 'np.ndarray':
+    """Great-circle distance in metres from one point to arrays of points."""
+    lat1 = np.radians(latitude)
+    lat2 = np.radians(latitudes)
+    half_dlat = (lat2 - lat1) / 2
+    half_dlng = np.radians(longitudes - longitude) / 2
+    a = np.sin(half_dlat) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(half_dlng) ** 2
+    return 2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def filter_records(records: Sequence[BusinessRecord], latitude: float, longitude: float, radius: float) -> GeoFilterResult:
+    """Drops records outside the search circle and keeps one copy of each place_id.
+
+    Distances to the centre are computed for the whole batch at once. Of several
+    copies of a place the one nearest the centre is kept. Records without
+    coordinates cannot be placed, so they are kept (after any located copy).
+    The kept records stay in their original order.
+    """
+    require_numpy()
+    if not records:
+        return GeoFilterResult([], 0, 0)
+
+    count = len(records)
+    # None becomes NaN in a float array.
+    latitudes = np.array(list(map(_latitude, records)), dtype=np.float64)
+    longitudes = np.array(list(map(_longitude, records)), dtype=np.float64)
+    distances = haversine_meters(latitude, longitude, latitudes, longitudes)
+
+    inside = ~(distances > radius)  # NaN (no coordinates) compares False, so it is kept
+    out_of_radius = count - int(inside.sum())
+
+    # Each place is coded by the index of its first copy: sorting ints is far cheaper than strings.
+    first_index: Dict[str, int] = {}
+    codes = list(map(first_index.setdefault, map(_place_id, records), range(count)))
+    if len(first_index) == count:
+        keep = np.flatnonzero(inside)
+    else:
+        # Sort by place, then distance (NaN last): the first of each run is the copy to keep.
+        place_codes = np.array(codes, dtype=np.intp)
+        order = np.lexsort((distances, place_codes))
+        order = order[inside[order]]
+        sorted_codes = place_codes[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = sorted_codes[1:] != sorted_codes[:-1]
+        keep = np.sort(order[first])
+    duplicates = count - out_of_radius - len(keep)
+
+    return GeoFilterResult([records[i] for i in keep.tolist()], out_of_radius, duplicates)
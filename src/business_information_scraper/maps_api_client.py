@@ -1,21 +1,342 @@
 import googlemaps
 from googlemaps.exceptions import ApiError, HTTPError, Timeout, TransportError
+from collections import deque
+import threading
 import time
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Iterator, Optional, Sequence, Set, Tuple, Union, cast
 import logging
 
-from src.business_information_scraper.exceptions import ApiClientError
+from src.business_information_scraper.cache import ResponseCache
+from src.business_information_scraper.checkpoint import CheckpointJournal
+from src.business_information_scraper.data_models import NearbyQuery, SearchTile, TilingSummary, split_business_types
+from src.business_information_scraper.exceptions import ApiClientError, PageTokenNotReadyError, QuotaExceededError
+from src.business_information_scraper.metrics import MetricsRegistry
+from src.business_information_scraper.pagination import (  # noqa: F401 - page limits are re-exported
+    NEARBY_MAX_PAGES,
+    NEARBY_MAX_RESULTS,
+    NEARBY_PAGE_SIZE,
+    NearbyPage,
+    PageTokenScheduler,
+)
+from src.business_information_scraper.rate_limiter import RateLimiter, RetryPolicy
+from src.business_information_scraper.tiling import split_tile
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BASE_URL = 'https://maps.googleapis.com'
+
+# Only the Place Details fields BusinessInfo is built from; everything else would
+# add payload and can move the request into a more expensive billing tier.
+DETAILS_FIELDS = ['place_id', 'name', 'formatted_address', 'international_phone_number', 'type']
+
+# Statuses worth retrying; quota statuses also slow down the shared rate limiter.
+QUOTA_API_STATUSES = {'OVER_QUERY_LIMIT', 'RESOURCE_EXHAUSTED'}
+TRANSIENT_API_STATUSES = QUOTA_API_STATUSES | {'UNKNOWN_ERROR'}
+
+
+class _AdaptiveTiles:
+    """Tile bookkeeping for one ``GoogleMapsClient.iter_nearby_pages_adaptive`` search."""
+
+    def __init__(
+            self,
+            summary: TilingSummary,
+            metrics: MetricsRegistry,
+            min_radius: int,
+            checkpoint: Optional[CheckpointJournal],
+    ):
+        self.summary = summary
+        self.metrics = metrics
+        self.min_radius = min_radius
+        self.checkpoint = checkpoint
+        # Per type: a place found for one type must still be reported for the others.
+        self.seen_place_ids: Dict[str, Set[str]] = {}
+        self.unique_place_ids: Set[str] = set()
+        self.tiles: Dict[NearbyQuery, SearchTile] = {}
+        self.result_counts: Dict[NearbyQuery, int] = {}
+        self.start_tokens: Dict[NearbyQuery, Tuple[int, str]] = {}
+        self.pending: deque = deque()
+
+    def enqueue(self, tile: SearchTile, business_type: str) -> None:
+        query = NearbyQuery(
+            latitude=tile.latitude, longitude=tile.longitude,
+            radius=int(round(tile.radius)), business_type=business_type
+        )
+        if self.checkpoint is not None:
+            saturated = self.checkpoint.tile_saturated(query)
+            if saturated is not None and self.checkpoint.is_completed(query):
+                self.finish_tile(tile, business_type, saturated)
+                return
+            resume_point = self.checkpoint.resume_point(query)
+            if resume_point:
+                self.start_tokens[query] = resume_point
+                # Every page before the one resumed from was full.
+                self.result_counts[query] = resume_point[0] * NEARBY_PAGE_SIZE
+        self.tiles[query] = tile
+        self.pending.append(query)
+
+    def new_places(self, page: NearbyPage) -> List[Dict[str, Any]]:
+        """Counts the page towards its tile and returns the places not yet seen for its type."""
+        self.result_counts[page.query] = self.result_counts.get(page.query, 0) + len(page.results)
+        seen = self.seen_place_ids.setdefault(page.query.business_type, set())
+        new_places = []
+        for place in page.results:
+            place_id = place.get('place_id')
+            if place_id and place_id not in seen:
+                seen.add(place_id)
+                self.unique_place_ids.add(place_id)
+                new_places.append(place)
+        self.summary.unique_places = len(self.unique_place_ids)
+        return new_places
+
+    def record_saturation(self, query: NearbyQuery) -> bool:
+        """Returns whether the finished query hit the result cap, journaling it when checkpointing."""
+        saturated = self.result_counts.pop(query) >= NEARBY_MAX_RESULTS
+        if self.checkpoint is not None:
+            self.checkpoint.record_tile(query, saturated)
+        return saturated
+
+    def finish_query(self, query: NearbyQuery, saturated: bool) -> None:
+        self.finish_tile(self.tiles.pop(query), query.business_type, saturated)
+
+    def finish_tile(self, tile: SearchTile, business_type: str, saturated: bool) -> None:
+        """Records a searched tile and queues its four sub-circles when it was saturated."""
+        summary = self.summary
+        summary.tiles_searched += 1
+        self.metrics.inc('tiles_searched_total')
+        summary.max_depth = max(summary.max_depth, tile.depth)
+        if not saturated:
+            summary.leaf_area += tile.radius ** 2
+            return
+
+        summary.saturated_tiles += 1
+        self.metrics.inc('tiles_saturated_total')
+        children = split_tile(tile)
+        if children[0].radius < self.min_radius:
+            logger.warning(
+                f"Tile ({tile.latitude:.6f}, {tile.longitude:.6f}) r={tile.radius:.0f}m is saturated "
+                f"but cannot be split below the minimum radius of {self.min_radius}m; results may be incomplete."
+            )
+            summary.truncated_tiles += 1
+            self.metrics.inc('tiles_truncated_total')
+            summary.leaf_area += tile.radius ** 2
+            summary.truncated_area += tile.radius ** 2
+            return
+        logger.debug(f"Tile at depth {tile.depth} is saturated, splitting into {len(children)} sub-circles.")
+        for child in children:
+            self.enqueue(child, business_type)
+
+
 class GoogleMapsClient:
-    def __init__(self, api_key: str, timeout: int = 10):
+    def __init__(
+            self,
+            api_key: str,
+            timeout: int = 10,
+            max_concurrent_queries: int = 8,
+            token_activation_delay: float = 1.5,
+            cache: Optional[ResponseCache] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            base_url: str = DEFAULT_BASE_URL,
+            metrics: Optional[MetricsRegistry] = None,
+    ):
+        self.api_calls = 0
+        self.cache = cache
+        self.metrics = metrics or MetricsRegistry()
+        self.rate_limiter = rate_limiter
+        # No retries unless configured, so callers see errors immediately by default.
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        self._calls_lock = threading.Lock()
         try:
-            self.client = googlemaps.Client(key=api_key, timeout=timeout)
+            # Quota errors are surfaced to _call so the shared limiter can slow down,
+            # instead of being retried blindly inside googlemaps.
+            self.client = googlemaps.Client(
+                key=api_key, timeout=timeout, retry_over_query_limit=False, base_url=base_url
+            )
             logger.info("Google Maps client initialized successfully.")
         except Exception as e:
             logger.error(f"Failed to initialize Google Maps client: {e}", exc_info=True)
             raise ApiClientError(f"Failed to initialize Google Maps client: {e}")
+        self.scheduler = PageTokenScheduler(
+            self, max_workers=max_concurrent_queries, token_activation_delay=token_activation_delay,
+            metrics=self.metrics,
+        )
+
+    def _count_call(self) -> None:
+        with self._calls_lock:
+            self.api_calls += 1
+
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        if isinstance(error, ApiError):
+            return error.status in TRANSIENT_API_STATUSES
+        if isinstance(error, HTTPError):
+            return error.status_code == 429 or error.status_code >= 500
+        return isinstance(error, (Timeout, TransportError))
+
+    @staticmethod
+    def _error_status(error: Exception) -> str:
+        """Label for a failed request in the ``api_requests_total`` metric."""
+        if isinstance(error, ApiError):
+            return str(error.status)
+        if isinstance(error, HTTPError):
+            return f"http_{error.status_code}"
+        if isinstance(error, Timeout):
+            return 'timeout'
+        if isinstance(error, TransportError):
+            return 'transport_error'
+        return 'error'
+
+    def _call(self, endpoint: str, method: Callable[..., Dict[str, Any]], **kwargs: Any) -> Dict[str, Any]:
+        """Sends one API request through the rate limiter, retrying transient failures.
+
+        ``endpoint`` ('nearby', 'details' or 'geocode') labels the request in the metrics.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve()
+                if delay > 0:
+                    self.metrics.inc('rate_limit_wait_seconds_total', delay)
+                    time.sleep(delay)
+            self._count_call()
+            started = time.perf_counter()
+            try:
+                response = method(**kwargs)
+            except Exception as e:
+                self.metrics.observe('api_request_seconds', time.perf_counter() - started, endpoint=endpoint)
+                self.metrics.inc('api_requests_total', endpoint=endpoint, status=self._error_status(e))
+                if isinstance(e, ApiError) and e.status in QUOTA_API_STATUSES and self.rate_limiter is not None:
+                    self.rate_limiter.record_quota_error()
+                if not self._is_transient(e) or attempt >= self.retry_policy.max_retries:
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                attempt += 1
+                self.metrics.inc('api_retries_total', endpoint=endpoint)
+                logger.warning(f"Transient API error ({e}); retry {attempt}/{self.retry_policy.max_retries} in {delay:.2f}s.")
+                time.sleep(delay)
+                continue
+            self.metrics.observe('api_request_seconds', time.perf_counter() - started, endpoint=endpoint)
+            self.metrics.inc('api_requests_total', endpoint=endpoint, status='ok')
+            if self.rate_limiter is not None:
+                self.rate_limiter.record_success()
+            return response
+
+    def get_cached_pages(self, query: NearbyQuery) -> Optional[List[Dict[str, Any]]]:
+        """Returns the cached page chain for a query, or None if there is no fresh copy."""
+        if self.cache is None:
+            return None
+        pages = self.cache.get_nearby_pages(query)
+        if pages is not None:
+            logger.debug(f"Cache hit for {query}: {len(pages)} pages.")
+        return pages
+
+    def cache_pages(self, query: NearbyQuery, pages: List[Dict[str, Any]]) -> None:
+        if self.cache is not None:
+            self.cache.put_nearby_pages(query, pages)
+
+    def fetch_nearby_page(self, query: NearbyQuery, page_token: Optional[str] = None) -> Dict[str, Any]:
+        """Performs a single Nearby Search request: the first page, or the page for ``page_token``."""
+        try:
+            if page_token:
+                return self._call('nearby', self.client.places_nearby, page_token=page_token)
+            logger.debug(f"Nearby Search request: {query}")
+            return self._call(
+                'nearby',
+                self.client.places_nearby,
+                location=(query.latitude, query.longitude),
+                radius=query.radius,
+                type=query.business_type
+            )
+        except QuotaExceededError:
+            raise
+        except ApiError as e:
+            if page_token and e.status == 'INVALID_REQUEST':
+                raise PageTokenNotReadyError(f"Page token not yet valid: {e}")
+            logger.error(f"Google Maps API error during Nearby Search: {e}", exc_info=True)
+            raise ApiClientError(f"API error during Nearby Search: {e}")
+        except (HTTPError, Timeout, TransportError) as e:
+            logger.error(f"Google Maps API error during Nearby Search: {e}", exc_info=True)
+            raise ApiClientError(f"API error during Nearby Search: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error during Nearby Search: {e}", exc_info=True)
+            raise ApiClientError(f"Unexpected error during Nearby Search: {e}")
+
+    def get_place_details(self, place_id: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Fetches Place Details for one place, limited to ``fields`` (DETAILS_FIELDS by default)."""
+        try:
+            response = self._call('details', self.client.place, place_id=place_id, fields=fields or DETAILS_FIELDS)
+            return response.get('result', {})
+        except QuotaExceededError:
+            raise
+        except (ApiError, HTTPError, Timeout, TransportError) as e:
+            logger.error(f"Google Maps API error during Place Details for {place_id}: {e}")
+            raise ApiClientError(f"API error during Place Details: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error during Place Details for {place_id}: {e}", exc_info=True)
+            raise ApiClientError(f"Unexpected error during Place Details: {e}")
+
+    def geocode(self, address: str) -> Dict[str, Any]:
+        """Returns the best Geocoding API match for an address, from the cache when it holds one."""
+        key = ResponseCache.geocode_key(address)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.debug(f"Cache hit for geocoding {address!r}.")
+                return cached
+        try:
+            # Unlike the Places endpoints, the Geocoding API answers with a list of matches.
+            results = cast(List[Dict[str, Any]], self._call('geocode', self.client.geocode, address=address))
+        except QuotaExceededError:
+            raise
+        except (ApiError, HTTPError, Timeout, TransportError) as e:
+            logger.error(f"Google Maps API error while geocoding {address!r}: {e}")
+            raise ApiClientError(f"API error during geocoding: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error while geocoding {address!r}: {e}", exc_info=True)
+            raise ApiClientError(f"Unexpected error during geocoding: {e}")
+        if not results:
+            raise ApiClientError(f"No geocoding result for {address!r}")
+        if self.cache is not None:
+            self.cache.put(key, results[0])
+        return results[0]
+
+    def iter_nearby_pages(
+            self,
+            latitude: float,
+            longitude: float,
+            radius: int,
+            business_type: Union[str, Sequence[str]],
+            checkpoint: Optional[CheckpointJournal] = None
+    ) -> Iterator[NearbyPage]:
+        """Yields Nearby Search results one page at a time, as soon as each page arrives.
+
+        Several business types (a list or a comma-separated string) search the same
+        circle with one query per type, run concurrently; each page tells its type
+        through ``page.query``.
+        With a checkpoint, a query already completed is skipped and one that was
+        interrupted continues from its last stored page token.
+        """
+        queries = []
+        start_tokens = {}
+        for type_name in split_business_types(business_type):
+            query = NearbyQuery(latitude=latitude, longitude=longitude, radius=radius, business_type=type_name)
+            if checkpoint is not None:
+                if checkpoint.is_completed(query):
+                    logger.info(f"Skipping Nearby Search already completed in checkpoint: {query}")
+                    continue
+                resume_point = checkpoint.resume_point(query)
+                if resume_point:
+                    start_tokens[query] = resume_point
+            queries.append(query)
+        if not queries:
+            return
+        logger.info(f"Initiating Nearby Search: location={(latitude, longitude)}, radius={radius}, type={business_type}")
+        total = 0
+        for page in self.scheduler.iter_pages(queries, start_tokens=start_tokens):
+            total += len(page.results)
+            logger.debug(f"Nearby Search page returned {len(page.results)} results.")
+            yield page
+        logger.info(f"Nearby Search completed. Found {total} total potential places.")
 
     def find_nearby_businesses(
             self,
@@ -26,33 +347,78 @@ class GoogleMapsClient:
     ) -> List[Dict[str, Any]]:
         """Finds businesses using Nearby Search, handling pagination."""
         all_results = []
-        location = (latitude, longitude)
-        try:
-            logger.info(f"Initiating Nearby Search: location={location}, radius={radius}, type={business_type}")
-            response = self.client.places_nearby(
-                location=location,
-                radius=radius,
-                type=business_type
-            )
-            all_results.extend(response.get('results', []))
-            logger.debug(f"Nearby Search initial page returned {len(response.get('results', []))} results.")
-
-            next_page_token = response.get('next_page_token')
-            while next_page_token:
-                logger.debug("Fetching next page...")
-                time.sleep(2)
-                response = self.client.places_nearby(page_token=next_page_token)
-                page_results = response.get('results', [])
-                all_results.extend(page_results)
-                logger.debug(f"Nearby Search next page returned {len(page_results)} results.")
-                next_page_token = response.get('next_page_token')
-
-            logger.info(f"Nearby Search completed. Found {len(all_results)} total potential places.")
-            return all_results
+        for page in self.iter_nearby_pages(latitude, longitude, radius, business_type):
+            all_results.extend(page.results)
+        return all_results
 
-        except (ApiError, HTTPError, Timeout, TransportError) as e:
-            logger.error(f"Google Maps API error during Nearby Search: {e}", exc_info=True)
-            raise ApiClientError(f"API error during Nearby Search: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error during Nearby Search: {e}", exc_info=True)
-            raise ApiClientError(f"Unexpected error during Nearby Search: {e}")
+    def find_nearby_businesses_many(self, queries: List[NearbyQuery]) -> Dict[NearbyQuery, List[Dict[str, Any]]]:
+        """Runs independent Nearby Search queries concurrently, overlapping their page-token waits."""
+        logger.info(f"Initiating {len(queries)} concurrent Nearby Search queries.")
+        return self.scheduler.run(queries)
+
+    def iter_nearby_pages_adaptive(
+            self,
+            latitude: float,
+            longitude: float,
+            radius: int,
+            business_type: Union[str, Sequence[str]],
+            min_radius: int,
+            summary: Optional[TilingSummary] = None,
+            checkpoint: Optional[CheckpointJournal] = None
+    ) -> Iterator[NearbyPage]:
+        """Yields pages of an adaptive search, splitting circles that hit the 60-result cap.
+
+        A saturated circle is replaced by four smaller circles covering it, until every
+        circle is unsaturated or further splitting would go below ``min_radius``.
+        Sibling circles are searched concurrently through the page-token scheduler.
+        Places already yielded by an overlapping circle are dropped from later pages.
+        Several business types share the root circle and are searched side by side;
+        each type splits only the circles where it saturates.
+        If ``summary`` is given it is filled in as the search progresses.
+
+        With a checkpoint, completed tiles are not searched again (their recorded
+        saturation still decides whether to split them) and interrupted tiles
+        continue from their last stored page token. Places stored before the
+        interruption are not remembered, so overlapping tiles may repeat a few.
+        """
+        summary = summary if summary is not None else TilingSummary()
+        calls_before = self.api_calls
+        root = SearchTile(latitude=latitude, longitude=longitude, radius=radius)
+        tiles = _AdaptiveTiles(summary, self.metrics, min_radius, checkpoint)
+        for type_name in split_business_types(business_type):
+            tiles.enqueue(root, type_name)
+        logger.info(
+            f"Initiating adaptive Nearby Search: location={(latitude, longitude)}, radius={radius}, type={business_type}"
+        )
+        for page in self.scheduler.iter_pages(tiles.pending, start_tokens=tiles.start_tokens):
+            new_page = page._replace(results=tiles.new_places(page))
+            if not page.is_last:
+                yield new_page
+                continue
+            saturated = tiles.record_saturation(page.query)
+            # Yield before splitting so the tile's rows are handled ahead of its children.
+            yield new_page
+            tiles.finish_query(page.query, saturated)
+
+        summary.api_calls = self.api_calls - calls_before
+        logger.info(
+            f"Adaptive search completed: {summary.unique_places} unique places from {summary.tiles_searched} tiles "
+            f"(max depth {summary.max_depth}, {summary.saturated_tiles} saturated, {summary.truncated_tiles} truncated) "
+            f"using {summary.api_calls} API calls; coverage={summary.coverage_ratio:.1%}, "
+            f"places/call={summary.places_per_call:.1f}."
+        )
+
+    def find_nearby_businesses_adaptive(
+            self,
+            latitude: float,
+            longitude: float,
+            radius: int,
+            business_type: str,
+            min_radius: int
+    ) -> Tuple[List[Dict[str, Any]], TilingSummary]:
+        """Finds businesses with adaptive tiling; see ``iter_nearby_pages_adaptive``."""
+        summary = TilingSummary()
+        results: List[Dict[str, Any]] = []
+        for page in self.iter_nearby_pages_adaptive(latitude, longitude, radius, business_type, min_radius, summary):
+            results.extend(page.results)
+        return results, summary
@@ -0,0 +1,234 @@
+import bisect
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Prefix of every metric in the Prometheus exposition.
+NAMESPACE = 'business_scraper'
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+RESULTS_PER_PAGE_BUCKETS = (0, 1, 5, 10, 15, 19, 20)
+
+# USD per 1000 billable requests, from the Places API (legacy) and Geocoding API price
+# lists. Details requests for the contact fields in DETAILS_FIELDS bill at the Basic +
+# Contact SKUs.
+DEFAULT_PRICES_PER_1000 = {'nearby': 32.0, 'details': 20.0, 'geocode': 5.0}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # the last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile by interpolating inside the bucket that contains it."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else lower
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.buckets[-1]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else 0.0,
+            'p50': round(self.quantile(0.5), 6),
+            'p95': round(self.quantile(0.95), 6),
+            'p99': round(self.quantile(0.99), 6),
+        }
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _series_name(name: str, labels: LabelKey) -> str:
+    if not labels:
+        return name
+    return name + '{' + ','.join(f'{key}="{value}"' for key, value in labels) + '}'
+
+
+class MetricsRegistry:
+    """Thread-safe counters and histograms shared by the client, processor and storage.
+
+    Series are identified by a metric name plus keyword labels, e.g.
+    ``inc('api_requests_total', endpoint='nearby', status='ok')``. The registry
+    can be dumped as a JSON run report or in the Prometheus text format, written
+    to a file or served over HTTP.
+    """
+
+    def __init__(self, prices_per_1000: Optional[Dict[str, float]] = None):
+        self.prices_per_1000 = prices_per_1000 or DEFAULT_PRICES_PER_1000
+        self.started_at = time.time()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = LATENCY_BUCKETS, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels: Any) -> Iterator[None]:
+        """Observes the duration of the ``with`` block in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def counter_value(self, name: str, **labels: Any) -> float:
+        """Sums every series of a counter whose labels include ``labels``."""
+        wanted = set(_label_key(labels))
+        with self._lock:
+            return sum(value for key, value in self._counters.get(name, {}).items() if wanted <= set(key))
+
+    def histogram(self, name: str, **labels: Any) -> Optional[Histogram]:
+        with self._lock:
+            return self._histograms.get(name, {}).get(_label_key(labels))
+
+    def estimated_cost_usd(self) -> float:
+        """Cost of the successful requests so far at ``prices_per_1000``."""
+        return sum(
+            self.counter_value('api_requests_total', endpoint=endpoint, status='ok') * price / 1000
+            for endpoint, price in self.prices_per_1000.items()
+        )
+
+    def report(self) -> Dict[str, Any]:
+        """Returns every series plus derived run figures as a JSON-serialisable dict."""
+        with self._lock:
+            counters = {
+                _series_name(name, key): value
+                for name, series in sorted(self._counters.items()) for key, value in sorted(series.items())
+            }
+            histograms = {
+                _series_name(name, key): histogram.summary()
+                for name, histograms_by_key in sorted(self._histograms.items())
+                for key, histogram in sorted(histograms_by_key.items())
+            }
+            stage_seconds = {
+                dict(key).get('stage', ''): value
+                for key, value in self._counters.get('stage_seconds_total', {}).items()
+            }
+        queries = self.counter_value('nearby_queries_total')
+        elapsed = time.time() - self.started_at
+        saturated = self.counter_value('nearby_queries_saturated_total')
+        processed = self.counter_value('businesses_processed_total')
+        return {
+            'elapsed_seconds': round(elapsed, 3),
+            'derived': {
+                'api_requests': self.counter_value('api_requests_total'),
+                'estimated_cost_usd': round(self.estimated_cost_usd(), 4),
+                'known_places_skipped': self.counter_value('places_skipped_total', reason='already_stored'),
+                'unchanged_places_skipped': self.counter_value('places_unchanged_total'),
+                'saturation_rate': round(saturated / queries, 4) if queries else 0.0,
+                'businesses_per_second': round(processed / elapsed, 2) if elapsed else 0.0,
+                # The stage with the largest share of wall time bounds throughput.
+                'slowest_stage': max(stage_seconds, key=lambda stage: stage_seconds[stage]) if stage_seconds else None,
+            },
+            'counters': counters,
+            'histograms': histograms,
+        }
+
+    def to_prometheus(self) -> str:
+        """Renders every series in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                full_name = f"{NAMESPACE}_{name}"
+                lines.append(f"# TYPE {full_name} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{_series_name(full_name, key)} {_format_value(value)}")
+            for name, histograms_by_key in sorted(self._histograms.items()):
+                full_name = f"{NAMESPACE}_{name}"
+                lines.append(f"# TYPE {full_name} histogram")
+                for key, histogram in sorted(histograms_by_key.items()):
+                    cumulative = 0
+                    for bound, bucket_count in zip(histogram.buckets + (float('inf'),), histogram.counts):
+                        cumulative += bucket_count
+                        le = '+Inf' if bound == float('inf') else f"{bound:g}"
+                        lines.append(f"{_series_name(full_name + '_bucket', key + (('le', le),))} {cumulative}")
+                    lines.append(f"{_series_name(full_name + '_sum', key)} {_format_value(histogram.sum)}")
+                    lines.append(f"{_series_name(full_name + '_count', key)} {histogram.count}")
+        lines.append(f"# TYPE {NAMESPACE}_estimated_cost_usd gauge")
+        lines.append(f"{NAMESPACE}_estimated_cost_usd {_format_value(self.estimated_cost_usd())}")
+        return '\n'.join(lines) + '\n'
+
+    def write_report(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+        logger.info(f"Run report written to {path}")
+
+    def write_prometheus(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        logger.info(f"Prometheus metrics written to {path}")
+
+    def serve(self, port: int, host: str = '127.0.0.1') -> None:
+        """Serves the Prometheus text format at ``/metrics`` from a background thread."""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                payload = registry.to_prometheus().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, name='metrics-http', daemon=True).start()
+        logger.info(f"Serving Prometheus metrics on http://{host}:{self._server.server_address[1]}/metrics")
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
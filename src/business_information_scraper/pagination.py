@@ -0,0 +1,195 @@
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.business_information_scraper.data_models import NearbyQuery
+from src.business_information_scraper.exceptions import ApiClientError, PageTokenNotReadyError
+from src.business_information_scraper.metrics import RESULTS_PER_PAGE_BUCKETS, MetricsRegistry
+
+if TYPE_CHECKING:
+    from src.business_information_scraper.maps_api_client import GoogleMapsClient
+
+logger = logging.getLogger(__name__)
+
+# Nearby Search never returns more than 3 pages of 20 results for one query.
+NEARBY_PAGE_SIZE = 20
+NEARBY_MAX_PAGES = 3
+NEARBY_MAX_RESULTS = NEARBY_PAGE_SIZE * NEARBY_MAX_PAGES
+
+
+class NearbyPage(NamedTuple):
+    """One page of Nearby Search results and where it sits in its query's page chain."""
+    query: NearbyQuery
+    results: List[Dict[str, Any]]
+    page_index: int
+    next_page_token: Optional[str]
+
+    @property
+    def is_last(self) -> bool:
+        return not self.next_page_token
+
+
+class _PageChains:
+    """Bookkeeping for one ``PageTokenScheduler.iter_pages`` run."""
+
+    def __init__(self, caching: bool):
+        # Heap entries: (ready_at, sequence, query, page_index, page_token, attempt)
+        self.waiting_tokens: List[Tuple[float, int, NearbyQuery, int, Optional[str], int]] = []
+        self.sequence = itertools.count()
+        self.in_flight: Dict[Future, Tuple[NearbyQuery, int, Optional[str], int]] = {}
+        # Live pages are kept per query until its chain is complete, then cached together.
+        # Resumed queries are not cached since their first pages are missing.
+        self.caching = caching
+        self.fetched_pages: Dict[NearbyQuery, List[Dict[str, Any]]] = {}
+        # Results seen so far per query, to tell which queries hit the 60-result cap.
+        self.result_counts: Dict[NearbyQuery, int] = {}
+
+    def wait_for(self, ready_at: float, query: NearbyQuery, page_index: int, token: Optional[str], attempt: int = 0) -> None:
+        heapq.heappush(self.waiting_tokens, (ready_at, next(self.sequence), query, page_index, token, attempt))
+
+    def seconds_to_next_token(self, now: float) -> Optional[float]:
+        return max(0.0, self.waiting_tokens[0][0] - now) if self.waiting_tokens else None
+
+
+class PageTokenScheduler:
+    """Runs many Nearby Search queries concurrently and interleaves their page-token waits.
+
+    Instead of sleeping a fixed time before each ``next_page_token`` request, every
+    token is scheduled for its expected activation time and retried at short
+    intervals until Google accepts it. While one query waits for its token, the
+    worker pool keeps serving the other queries. Queries whose pages are in the
+    client's response cache are answered without any request.
+    """
+
+    def __init__(
+            self,
+            client: 'GoogleMapsClient',
+            max_workers: int = 8,
+            token_activation_delay: float = 1.5,
+            token_retry_interval: float = 0.25,
+            max_token_retries: int = 20,
+            metrics: Optional[MetricsRegistry] = None,
+    ):
+        self.client = client
+        self.metrics = metrics or MetricsRegistry()
+        self.max_workers = max_workers
+        self.token_activation_delay = token_activation_delay
+        self.token_retry_interval = token_retry_interval
+        self.max_token_retries = max_token_retries
+
+    def iter_pages(
+            self,
+            queries: Iterable[NearbyQuery],
+            start_tokens: Optional[Dict[NearbyQuery, Tuple[int, str]]] = None,
+    ) -> Iterator[NearbyPage]:
+        """Yields each page as soon as it arrives.
+
+        If ``queries`` is a deque, the caller may append further queries to it while
+        iterating; they are picked up before the scheduler runs dry. A query listed in
+        ``start_tokens`` as ``(page_index, page_token)`` resumes from that page
+        instead of requesting its first page.
+        """
+        pending: Deque[NearbyQuery] = queries if isinstance(queries, deque) else deque(queries)
+        start_tokens = start_tokens or {}
+        chains = _PageChains(caching=self.client.cache is not None)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='nearby')
+        try:
+            while pending or chains.waiting_tokens or chains.in_flight:
+                # Activated tokens go first so a query never waits behind fresh queries.
+                now = time.monotonic()
+                while chains.waiting_tokens and chains.waiting_tokens[0][0] <= now:
+                    _, _, query, page_index, token, attempt = heapq.heappop(chains.waiting_tokens)
+                    future = executor.submit(self.client.fetch_nearby_page, query, token)
+                    chains.in_flight[future] = (query, page_index, token, attempt)
+
+                while pending and len(chains.in_flight) < self.max_workers:
+                    yield from self._start_query(pending.popleft(), start_tokens, chains, executor, now)
+
+                timeout = chains.seconds_to_next_token(now)
+                if not chains.in_flight:
+                    if timeout is not None:
+                        time.sleep(timeout)
+                    continue
+
+                done, _ = wait(chains.in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page = self._finish_request(future, chains)
+                    if page is not None:
+                        yield page
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _start_query(
+            self,
+            query: NearbyQuery,
+            start_tokens: Dict[NearbyQuery, Tuple[int, str]],
+            chains: _PageChains,
+            executor: ThreadPoolExecutor,
+            now: float,
+    ) -> Iterator[NearbyPage]:
+        """Resumes the query from its start token, yields its cached pages, or requests its first page."""
+        if query in start_tokens:
+            page_index, token = start_tokens[query]
+            logger.info(f"Resuming {query} at page {page_index + 1}.")
+            # Every page before the one resumed from was full.
+            chains.result_counts[query] = page_index * NEARBY_PAGE_SIZE
+            chains.wait_for(now, query, page_index, token)
+            return
+        cached_pages = self.client.get_cached_pages(query)
+        if cached_pages is not None:
+            for index, response in enumerate(cached_pages):
+                page = NearbyPage(query, response.get('results', []), index, response.get('next_page_token'))
+                self._record_page(page, 'cache', chains.result_counts)
+                yield page
+            return
+        if chains.caching:
+            chains.fetched_pages[query] = []
+        chains.in_flight[executor.submit(self.client.fetch_nearby_page, query)] = (query, 0, None, 0)
+
+    def _finish_request(self, future: Future, chains: _PageChains) -> Optional[NearbyPage]:
+        """Turns a completed request into its page, or schedules a retry when the page token was not ready."""
+        query, page_index, token, attempt = chains.in_flight.pop(future)
+        try:
+            response = future.result()
+        except PageTokenNotReadyError:
+            if attempt >= self.max_token_retries:
+                raise ApiClientError(
+                    f"Page token for {query} did not become valid after {attempt} retries"
+                )
+            logger.debug(f"Page token for {query} not ready yet, retrying (attempt {attempt + 1}).")
+            self.metrics.inc('page_token_retries_total')
+            chains.wait_for(time.monotonic() + self.token_retry_interval, query, page_index, token, attempt + 1)
+            return None
+
+        next_page_token: Optional[str] = response.get('next_page_token')
+        if query in chains.fetched_pages:
+            chains.fetched_pages[query].append(response)
+            if not next_page_token:
+                self.client.cache_pages(query, chains.fetched_pages.pop(query))
+        if next_page_token:
+            chains.wait_for(time.monotonic() + self.token_activation_delay, query, page_index + 1, next_page_token)
+        page = NearbyPage(query, response.get('results', []), page_index, next_page_token)
+        self._record_page(page, 'api', chains.result_counts)
+        return page
+
+    def _record_page(self, page: NearbyPage, source: str, result_counts: Dict[NearbyQuery, int]) -> None:
+        self.metrics.inc('nearby_pages_total', source=source)
+        self.metrics.observe('nearby_results_per_page', len(page.results), buckets=RESULTS_PER_PAGE_BUCKETS)
+        total = result_counts.pop(page.query, 0) + len(page.results)
+        if not page.is_last:
+            result_counts[page.query] = total
+            return
+        self.metrics.inc('nearby_queries_total')
+        if total >= NEARBY_MAX_RESULTS:
+            self.metrics.inc('nearby_queries_saturated_total')
+
+    def run(self, queries: Iterable[NearbyQuery]) -> Dict[NearbyQuery, List[Dict[str, Any]]]:
+        """Runs all queries to completion and returns their results keyed by query."""
+        results: Dict[NearbyQuery, List[Dict[str, Any]]] = {}
+        for page in self.iter_pages(queries):
+            results.setdefault(page.query, []).extend(page.results)
+        return results
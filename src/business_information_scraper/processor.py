@@ -1,85 +1,543 @@
+import asyncio
 import logging
-from typing import List, Optional
+import time
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence, Tuple, Union, cast
 
-from business_information_scraper.maps_api_client import GoogleMapsClient
-from business_information_scraper.data_models import BusinessInfo
-from business_information_scraper.storage import DataStorage
-from business_information_scraper.exceptions import ApiClientError
+from src.business_information_scraper.checkpoint import CheckpointJournal
+from src.business_information_scraper.maps_api_client import GoogleMapsClient
+from src.business_information_scraper.pagination import NearbyPage
+from src.business_information_scraper.data_models import BusinessInfo, BusinessRecord, split_business_types
+from src.business_information_scraper.dedup import PlaceIndex
+from src.business_information_scraper.enrichment import AsyncDetailsEnricher, DetailsEnricher
+from src.business_information_scraper.geo import filter_records, require_numpy
+from src.business_information_scraper.metrics import MetricsRegistry
+from src.business_information_scraper.profiling import StageProfiler
+from src.business_information_scraper.spatial import SpatialIndex
+from src.business_information_scraper.storage import DataStorage
+from src.business_information_scraper.transform import combine_types, merge_places, to_records
+from src.business_information_scraper.exceptions import ApiClientError, ConfigurationError, StorageError
+
+if TYPE_CHECKING:
+    from src.business_information_scraper.async_client import AsyncPlacesClient
 
 logger = logging.getLogger(__name__)
 
 class BusinessDataProcessor:
-    def __init__(self, api_client: GoogleMapsClient, storage: DataStorage, batch_size: int):
+    def __init__(
+            self,
+            api_client: Union[GoogleMapsClient, 'AsyncPlacesClient'],
+            storage: DataStorage,
+            batch_size: int,
+            min_tile_radius: Optional[int] = None,
+            enricher: Optional[Union[DetailsEnricher, AsyncDetailsEnricher]] = None,
+            checkpoint: Optional[CheckpointJournal] = None,
+            metrics: Optional[MetricsRegistry] = None,
+            profiler: Optional[StageProfiler] = None,
+            geo_filter: bool = False,
+            place_index: Optional[PlaceIndex] = None,
+            spatial_index: Optional[SpatialIndex] = None,
+    ):
         self.api_client = api_client
         self.storage = storage
         self.batch_size = batch_size
+        # When set, searches are split adaptively until no circle hits the 60-result cap.
+        self.min_tile_radius = min_tile_radius
+        # Nearby Search has no address or phone number; the enricher adds them from Place Details.
+        self.enricher = enricher
+        self.checkpoint = checkpoint
+        # Share the client's registry so one run report covers every stage.
+        self.metrics = metrics or MetricsRegistry()
+        self.profiler = profiler
+        # Drop places outside the search circle and duplicate copies before storage (needs numpy).
+        if geo_filter:
+            require_numpy()
+        self.geo_filter = geo_filter
+        # Places already stored by this or an earlier run skip the details and storage stages.
+        self.place_index = place_index
+        # Saved batches are also indexed locally for radius/box/nearest queries.
+        self.spatial_index = spatial_index
+
+    # process_location needs the blocking client and enricher, process_location_async the
+    # asyncio ones; main builds the matching pair. These views give each side its types.
+    @property
+    def _client(self) -> GoogleMapsClient:
+        return cast(GoogleMapsClient, self.api_client)
+
+    @property
+    def _async_client(self) -> 'AsyncPlacesClient':
+        return cast('AsyncPlacesClient', self.api_client)
+
+    @property
+    def _enricher(self) -> Optional[DetailsEnricher]:
+        return cast(Optional[DetailsEnricher], self.enricher)
+
+    @property
+    def _async_enricher(self) -> Optional[AsyncDetailsEnricher]:
+        return cast(Optional[AsyncDetailsEnricher], self.enricher)
 
     @staticmethod
     def _transform_details_to_model(details: Optional[dict]) -> Optional[BusinessInfo]:
         """Transforms raw API detail response into our Pydantic model."""
         if not details or 'place_id' not in details:
             return None
+        records, _ = to_records([details])
+        return records[0].to_model() if records else None
 
-        try:
-            business = BusinessInfo(
-                place_id=details['place_id'],
-                name=details.get('name', 'N/A'),
-                address=details.get('formatted_address', 'unknown_address'),
-                phone_number=details.get('international_phone_number', 'unknown_phone_number'),
-                types=details.get('types', []),
+    @contextmanager
+    def _stage(self, name: str) -> Iterator[None]:
+        """Times a pipeline stage into the metrics and, when profiling, tags its samples."""
+        started = time.perf_counter()
+        with self.profiler.stage(name) if self.profiler is not None else nullcontext():
+            try:
+                yield
+            finally:
+                self.metrics.inc('stage_seconds_total', time.perf_counter() - started, stage=name)
+
+    def _transform_places(self, places: List[dict], offset: int = 0) -> Tuple[List[BusinessRecord], int]:
+        """Transforms one page of places, returning the records and how many places failed to transform.
+
+        The page is validated in a single pass into compact ``BusinessRecord`` tuples;
+        ``offset`` is the number of places seen before this page, used in log messages.
+        """
+        with self._stage('transform'):
+            valid_places = []
+            for number, place in enumerate(places, start=offset + 1):
+                if place.get('place_id'):
+                    valid_places.append(place)
+                else:
+                    logger.warning(f"Skipping place {number} without place_id: {place.get('name', 'Unknown Name')}")
+                    self.metrics.inc('places_skipped_total', reason='missing_place_id')
+            businesses, failed = to_records(valid_places)
+        self.metrics.inc('businesses_processed_total', len(businesses))
+        if failed:
+            self.metrics.inc('transform_failures_total', failed)
+        return businesses, failed
+
+    def _skip_known_places(self, places: List[dict]) -> List[dict]:
+        """Drops places the index has already stored, or reserved earlier in this run."""
+        if self.place_index is None:
+            return places
+        with self._stage('dedup'):
+            new_ids, skipped = self.place_index.claim_new(place['place_id'] for place in places if place.get('place_id'))
+            new = set(new_ids)
+            kept = []
+            for place in places:
+                place_id = place.get('place_id')
+                if not place_id:
+                    kept.append(place)  # logged and counted by the transform stage
+                elif place_id in new:
+                    new.discard(place_id)
+                    kept.append(place)
+        if skipped:
+            self.metrics.inc('places_skipped_total', skipped, reason='already_stored')
+        return kept
+
+    def _drop_unchanged(self, businesses: List[BusinessRecord]) -> List[BusinessRecord]:
+        """Drops refreshed records identical to the stored copy, recording that they were fetched."""
+        if self.place_index is None or not businesses:
+            return businesses
+        with self._stage('dedup'):
+            changed, unchanged = self.place_index.split_changed(businesses)
+            if unchanged:
+                self.place_index.mark_stored(unchanged)
+        if unchanged:
+            self.metrics.inc('places_unchanged_total', len(unchanged))
+        return changed
+
+    def _filter_buffer(
+            self, buffer: List[BusinessRecord], latitude: float, longitude: float, radius: int,
+    ) -> List[BusinessRecord]:
+        """Applies the radius and duplicate filter to the buffered records when enabled."""
+        if not self.geo_filter or not buffer:
+            return buffer
+        with self._stage('geo'):
+            result = filter_records(buffer, latitude, longitude, radius)
+        if self.place_index is not None and len(result.records) < len(buffer):
+            # A place outside this circle may still belong to another job's search.
+            kept_ids = {record.place_id for record in result.records}
+            self.place_index.release(record.place_id for record in buffer if record.place_id not in kept_ids)
+        if result.out_of_radius:
+            self.metrics.inc('places_filtered_total', result.out_of_radius, reason='out_of_radius')
+        if result.duplicates:
+            self.metrics.inc('places_filtered_total', result.duplicates, reason='duplicate')
+        return result.records
+
+    def _iter_nearby_pages(
+            self, latitude: float, longitude: float, radius: int, business_type: Union[str, Sequence[str]],
+    ) -> Iterator[NearbyPage]:
+        if self.min_tile_radius:
+            return self._client.iter_nearby_pages_adaptive(
+                latitude, longitude, radius, business_type, self.min_tile_radius, checkpoint=self.checkpoint
             )
-            return business
+        return self._client.iter_nearby_pages(latitude, longitude, radius, business_type, checkpoint=self.checkpoint)
+
+    def _save_batch(self, batch: List[BusinessRecord], checkpoint_events: Optional[List[dict]] = None) -> bool:
+        """Saves a batch and, when checkpointing, journals the events it makes durable.
+
+        Returns False if the batch could not be saved.
+        """
+        started = time.perf_counter()
+        try:
+            with self._stage('storage'):
+                if batch:
+                    logger.info(f"Saving batch of {len(batch)} processed businesses...")
+                    self.storage.save(batch)
+                    self.metrics.inc('storage_rows_total', len(batch))
+                journal = self.checkpoint if checkpoint_events is not None else None
+                # The journal and the place index may only vouch for rows that reached storage:
+                # a background writer or a file buffer still holds them until flushed.
+                if journal is not None or (self.place_index is not None and batch):
+                    self.storage.flush()
+                if journal is not None and checkpoint_events is not None:
+                    journal.record_stored(checkpoint_events, len(batch))
+            if self.place_index is not None:
+                self.place_index.mark_stored(batch)
         except Exception as e:
-             logger.error(f"Error transforming details for place_id {details.get('place_id', 'UNKNOWN')}: {e}", exc_info=True)
-             return None
+            logger.error(f"Failed to save data batch: {e}. Continuing processing, but data may be lost.", exc_info=True)
+            self.metrics.inc('storage_failed_rows_total', len(batch))
+            if self.place_index is not None:
+                self.place_index.release(record.place_id for record in batch)
+            return False
+        finally:
+            self.metrics.observe('storage_batch_seconds', time.perf_counter() - started)
+        if self.spatial_index is not None and batch:
+            self._add_to_spatial_index(self.spatial_index, batch)
+        return True
+
+    def _add_to_spatial_index(self, spatial_index: SpatialIndex, batch: List[BusinessRecord]) -> None:
+        """Indexes a stored batch. The rows are safe in storage by now, so a failure is only logged."""
+        try:
+            with self._stage('spatial_index'):
+                spatial_index.add(batch)
+        except StorageError as e:
+            logger.error(f"Failed to add {len(batch)} saved businesses to the spatial index: {e}")
+            self.metrics.inc('spatial_index_failed_rows_total', len(batch))
+
+    def _merge_search_results(self, places: List[dict]) -> List[dict]:
+        """Merges the places found by several per-type searches and drops those already stored."""
+        merged = merge_places(places)
+        logger.info(f"Merged {len(places)} search results into {len(merged)} places.")
+        if len(merged) < len(places):
+            self.metrics.inc('places_merged_total', len(places) - len(merged))
+        return self._skip_known_places(merged)
+
+    def _to_businesses(self, places: List[dict], latitude: float, longitude: float, radius: int) -> List[BusinessRecord]:
+        businesses, failed = self._transform_places(places)
+        if failed:
+            logger.info(f"Failed to fetch or process details for: {failed} places.")
+        businesses = self._drop_unchanged(businesses)
+        return self._filter_buffer(businesses, latitude, longitude, radius)
+
+    def _save_all(self, businesses: List[BusinessRecord], checkpoint_events: Optional[List[dict]] = None) -> None:
+        """Saves merged businesses in ``batch_size`` batches, journaling the checkpoint events with the last one."""
+        batches = [businesses[start:start + self.batch_size] for start in range(0, len(businesses), self.batch_size)]
+        if not batches and not checkpoint_events:
+            return
+        for number, batch in enumerate(batches or [[]], start=1):
+            if not self._save_batch(batch, checkpoint_events if number == max(len(batches), 1) else None):
+                if checkpoint_events is not None:
+                    logger.warning("Checkpointing stopped for this location after a failed save.")
+                checkpoint_events = None
+
+    def _save_journaled(self, batch: List[BusinessRecord], checkpoint_events: Optional[List[dict]]) -> Optional[List[dict]]:
+        """Saves a batch with the checkpoint events it completes and returns the list for the next events.
+
+        After a failed save nothing more is journaled, so a resume re-fetches the lost rows.
+        """
+        if self._save_batch(batch, checkpoint_events):
+            return [] if checkpoint_events is not None else None
+        if checkpoint_events is not None:
+            logger.warning("Checkpointing stopped for this location after a failed save.")
+        return None
+
+    @staticmethod
+    def _queue_page_event(checkpoint_events: Optional[List[dict]], page: NearbyPage) -> None:
+        """Queues the checkpoint event for a fetched page, or for its finished query on the last page."""
+        if checkpoint_events is None:
+            return
+        if page.next_page_token:
+            checkpoint_events.append(CheckpointJournal.page_event(page.query, page.page_index, page.next_page_token))
+        else:
+            checkpoint_events.append(CheckpointJournal.query_done_event(page.query))
+
+    def _buffer_page(
+            self, buffer: List[BusinessRecord], places: List[dict], offset: int,
+            latitude: float, longitude: float, radius: int,
+    ) -> Tuple[List[List[BusinessRecord]], int]:
+        """Adds one page's places to the buffer and takes out every full batch that is ready to save.
+
+        ``offset`` is the number of places seen before this page. Returns the batches
+        and how many places failed to transform.
+        """
+        businesses, failed = self._transform_places(places, offset)
+        buffer.extend(self._drop_unchanged(businesses))
+        if len(buffer) >= self.batch_size:
+            buffer[:] = self._filter_buffer(buffer, latitude, longitude, radius)
+        batches = []
+        while len(buffer) >= self.batch_size:
+            batches.append(buffer[:self.batch_size])
+            del buffer[:self.batch_size]
+        return batches, failed
 
+    def _store_remaining(
+            self, buffer: List[BusinessRecord], checkpoint_events: Optional[List[dict]],
+            latitude: float, longitude: float, radius: int,
+    ) -> int:
+        """Stores what is left in the buffer with the events still waiting; returns how many rows were handed over."""
+        buffer = self._filter_buffer(buffer, latitude, longitude, radius)
+        if buffer or checkpoint_events:
+            self._save_journaled(buffer, checkpoint_events)
+        return len(buffer)
 
-    def process_location(self, latitude: float, longitude: float, radius: int, business_type: str):
-        """Fetches, processes, and stores business data for a location."""
-        logger.info(f"Starting business data processing for location ({latitude}, {longitude}), radius={radius}, type={business_type}")
+    def _enrich(self, places: List[dict]) -> List[dict]:
+        if self._enricher is None:
+            return places
+        with self._stage('details'):
+            return self._enricher.enrich(places)
 
+    async def _enrich_async(self, places: List[dict]) -> List[dict]:
+        if self._async_enricher is None:
+            return places
+        with self._stage('details'):
+            return await self._async_enricher.enrich(places)
+
+    def _process_location_types(self, latitude: float, longitude: float, radius: int, business_types: List[str]) -> int:
+        """Searches one area for several business types and stores every place once.
+
+        The per-type queries share the search circle and run concurrently through
+        the client's page-token scheduler. Their results are merged in memory by
+        place_id, combining the types of each copy, so a place found for several
+        types costs one Place Details request and one row.
+        """
+        logger.info(
+            f"Starting business data processing for location ({latitude}, {longitude}), radius={radius}, "
+            f"types={','.join(business_types)}"
+        )
+        places: List[dict] = []
+        calls_before = self._client.api_calls
+        started = time.perf_counter()
+        checkpoint_events: Optional[List[dict]] = [] if self.checkpoint is not None else None
+        search_error: Optional[ApiClientError] = None
         try:
-            nearby_places = self.api_client.find_nearby_businesses(latitude, longitude, radius, business_type)
+            with self._stage('search'):
+                for page in self._iter_nearby_pages(latitude, longitude, radius, business_types):
+                    places.extend(page.results)
+                    self._queue_page_event(checkpoint_events, page)
         except ApiClientError as e:
+            # What was found so far is still stored, as a single-type search would.
             logger.error(f"Failed to fetch nearby places: {e}. Aborting process for this location.")
-            raise ApiClientError from e
+            search_error = e
+        logger.info(
+            f"Search stage: {len(places)} places for {len(business_types)} types from "
+            f"{self._client.api_calls - calls_before} API calls in {time.perf_counter() - started:.2f}s."
+        )
+
+        merged = self._merge_search_results(places)
+        if self._enricher is not None:
+            with self._stage('details'):
+                # Details carry a single types list; keep the one combined from every search.
+                merged = [combine_types(details, place) for details, place in zip(self._enricher.enrich(merged), merged)]
+        businesses = self._to_businesses(merged, latitude, longitude, radius)
+        self._save_all(businesses, checkpoint_events)
+        if search_error is not None:
+            raise ApiClientError from search_error
+        logger.info(
+            f"Processing complete for location ({latitude}, {longitude}): "
+            f"{len(businesses)} businesses handed to storage."
+        )
+        return len(businesses)
+
+    def process_location(
+            self, latitude: float, longitude: float, radius: int, business_type: Union[str, Sequence[str]],
+    ) -> int:
+        """Fetches, processes, and stores business data for a location.
 
-        processed_businesses: List[BusinessInfo] = []
+        Pages are consumed as the client yields them and flushed to storage every
+        ``batch_size`` businesses, so memory stays bounded by one batch plus one page.
+        With a checkpoint journal, each flush also records which pages and queries
+        are now fully stored, so an interrupted run can resume after them.
+        With ``geo_filter``, the buffer is cleared of out-of-radius places and duplicate
+        copies before each flush. With a ``place_index``, places stored before are
+        dropped right after the search, before details and storage; in refresh mode
+        stale places go through again but are only written if their content changed.
+        Several business types, as a list or a comma-separated string, are searched
+        together and merged; see ``_process_location_types``.
+        Returns the number of businesses processed and handed to storage.
+        """
+        business_types = split_business_types(business_type)
+        if len(business_types) > 1:
+            return self._process_location_types(latitude, longitude, radius, business_types)
+        business_type = business_types[0]
+        logger.info(
+            f"Starting business data processing for location ({latitude}, {longitude}), radius={radius}, "
+            f"type={business_type}"
+        )
+
+        processed_businesses: List[BusinessRecord] = []
         processed_count = 0
         failed_detail_fetches = 0
+        places_seen = 0
+        places_known = 0
+        search_seconds = 0.0
+        details_seconds = 0.0
+        calls_before = self._client.api_calls
+        # Checkpoint events wait here until the rows they cover are flushed.
+        checkpoint_events: Optional[List[dict]] = [] if self.checkpoint is not None else None
+        search_error: Optional[ApiClientError] = None
 
-        for i, place in enumerate(nearby_places):
-            place_id = place.get('place_id')
-            place_name = place.get('name', 'Unknown Name')
-            if not place_id:
-                logger.warning(f"Skipping place without place_id: {place_name}")
-                continue
-
-            logger.debug(f"Processing place {i+1}/{len(nearby_places)}: {place_name} ({place_id})")
-
-            business_info = self._transform_details_to_model(place)
-            if business_info:
-                processed_businesses.append(business_info)
-                processed_count += 1
-            else:
-                failed_detail_fetches += 1
-
-            if len(processed_businesses) >= 50:
-                logger.info(f"Saving batch of {len(processed_businesses)} processed businesses...")
-                try:
-                    self.storage.save(processed_businesses)
-                    processed_businesses = []
-                except Exception as e:
-                    logger.error(f"Failed to save data batch: {e}. Continuing processing, but data may be lost.", exc_info=True)
-
-        if processed_businesses:
-            logger.info(f"Saving final batch of {len(processed_businesses)} processed businesses...")
+        pages = self._iter_nearby_pages(latitude, longitude, radius, business_type)
+        while True:
+            search_started = time.perf_counter()
             try:
-                self.storage.save(processed_businesses)
-            except Exception as e:
-                 logger.error(f"Failed to save final data batch: {e}.", exc_info=True)
+                with self._stage('search'):
+                    page = next(pages, None)
+            except ApiClientError as e:
+                # The buffer is still stored below before the error is raised.
+                logger.error(f"Failed to fetch nearby places: {e}. Aborting process for this location.")
+                search_error = e
+                break
+            finally:
+                search_seconds += time.perf_counter() - search_started
+            if page is None:
+                break
+
+            places = self._skip_known_places(page.results)
+            places_known += len(page.results) - len(places)
+            details_started = time.perf_counter()
+            places = self._enrich(places)
+            details_seconds += time.perf_counter() - details_started
+
+            batches, failed = self._buffer_page(processed_businesses, places, places_seen, latitude, longitude, radius)
+            places_seen += len(page.results)
+            failed_detail_fetches += failed
+            for batch in batches:
+                processed_count += len(batch)
+                checkpoint_events = self._save_journaled(batch, checkpoint_events)
+            self._queue_page_event(checkpoint_events, page)
+
+        processed_count += self._store_remaining(processed_businesses, checkpoint_events, latitude, longitude, radius)
+        if search_error is not None:
+            raise ApiClientError from search_error
+
+        logger.info(f"Processing complete for location ({latitude}, {longitude}).")
+        logger.info(
+            f"Search stage: {places_seen} places from {self._client.api_calls - calls_before} "
+            f"API calls in {search_seconds:.2f}s."
+        )
+        if self.enricher is not None:
+            logger.info(f"Details stage: enriched {places_seen - places_known} places in {details_seconds:.2f}s.")
+        if self.place_index is not None:
+            logger.info(f"Skipped {places_known} places already stored.")
+        logger.info(f"Successfully processed and attempted to save: {processed_count} businesses.")
+        logger.info(f"Failed to fetch or process details for: {failed_detail_fetches} places.")
+        return processed_count
+
+    async def _process_location_types_async(
+            self, latitude: float, longitude: float, radius: int, business_types: List[str],
+    ) -> int:
+        """Async variant of ``_process_location_types``: one concurrent task per business type."""
+        logger.info(
+            f"Starting async business data processing for location ({latitude}, {longitude}), radius={radius}, "
+            f"types={','.join(business_types)}"
+        )
+        calls_before = self._async_client.api_calls
+        started = time.perf_counter()
+
+        async def search(business_type: str) -> List[dict]:
+            found: List[dict] = []
+            async for page in self._async_client.iter_nearby_pages(latitude, longitude, radius, business_type):
+                found.extend(page.results)
+            return found
+
+        with self._stage('search'):
+            outcomes = await asyncio.gather(*(search(name) for name in business_types), return_exceptions=True)
+        places = [place for outcome in outcomes if isinstance(outcome, list) for place in outcome]
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        for error in errors:
+            if not isinstance(error, ApiClientError):
+                raise error
+            logger.error(f"Failed to fetch nearby places: {error}. Storing the other types' results.")
+        logger.info(
+            f"Async search: {len(places)} places for {len(business_types)} types from "
+            f"{self._async_client.api_calls - calls_before} API calls in {time.perf_counter() - started:.2f}s."
+        )
+
+        merged = self._merge_search_results(places)
+        if self._async_enricher is not None:
+            with self._stage('details'):
+                enriched = await self._async_enricher.enrich(merged)
+                merged = [combine_types(details, place) for details, place in zip(enriched, merged)]
+        businesses = self._to_businesses(merged, latitude, longitude, radius)
+        await asyncio.to_thread(self._save_all, businesses)
+        if errors:
+            raise ApiClientError from errors[0]
+        logger.info(
+            f"Processing complete for location ({latitude}, {longitude}): "
+            f"{len(businesses)} businesses handed to storage."
+        )
+        return len(businesses)
+
+    async def process_location_async(
+            self, latitude: float, longitude: float, radius: int, business_type: Union[str, Sequence[str]],
+    ) -> int:
+        """Async variant of ``process_location`` for an ``AsyncPlacesClient``.
+
+        Pages and Place Details are fetched on the event loop; storage writes run in
+        a worker thread so they do not stall in-flight requests. Adaptive tiling and
+        checkpointing are only available through ``process_location``.
+        Returns the number of businesses processed and handed to storage.
+        """
+        if self.min_tile_radius or self.checkpoint is not None:
+            raise ConfigurationError("Adaptive tiling and checkpointing are not supported by the async client")
+        business_types = split_business_types(business_type)
+        if len(business_types) > 1:
+            return await self._process_location_types_async(latitude, longitude, radius, business_types)
+        business_type = business_types[0]
+        logger.info(
+            f"Starting async business data processing for location ({latitude}, {longitude}), radius={radius}, "
+            f"type={business_type}"
+        )
+
+        processed_businesses: List[BusinessRecord] = []
+        processed_count = 0
+        failed_detail_fetches = 0
+        places_seen = 0
+        calls_before = self._async_client.api_calls
+        started = time.perf_counter()
+        search_error: Optional[ApiClientError] = None
+
+        pages = self._async_client.iter_nearby_pages(latitude, longitude, radius, business_type)
+        try:
+            while True:
+                with self._stage('search'):
+                    page = await anext(pages, None)
+                if page is None:
+                    break
+
+                places = await self._enrich_async(self._skip_known_places(page.results))
+
+                batches, failed = self._buffer_page(processed_businesses, places, places_seen, latitude, longitude, radius)
+                places_seen += len(page.results)
+                failed_detail_fetches += failed
+                for batch in batches:
+                    processed_count += len(batch)
+                    await asyncio.to_thread(self._save_batch, batch)
+        except ApiClientError as e:
+            logger.error(f"Failed to fetch nearby places: {e}. Aborting process for this location.")
+            search_error = e
 
+        processed_count += await asyncio.to_thread(
+            self._store_remaining, processed_businesses, None, latitude, longitude, radius
+        )
+        if search_error is not None:
+            raise ApiClientError from search_error
 
         logger.info(f"Processing complete for location ({latitude}, {longitude}).")
+        logger.info(
+            f"Async run: {places_seen} places from {self._async_client.api_calls - calls_before} "
+            f"API calls in {time.perf_counter() - started:.2f}s."
+        )
         logger.info(f"Successfully processed and attempted to save: {processed_count} businesses.")
         logger.info(f"Failed to fetch or process details for: {failed_detail_fetches} places.")
+        return processed_count
@@ -0,0 +1,162 @@
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from types import FrameType
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Pool threads are named e.g. 'nearby_3' or 'Thread-7 (worker)'; group them by prefix.
+_THREAD_SUFFIX = re.compile(r'([-_]?\d+)?( \(.*\))?$')
+
+
+class StageProfiler:
+    """Low-overhead sampling profiler that attributes samples to pipeline stages.
+
+    A daemon thread snapshots every thread's stack with ``sys._current_frames()``
+    every ``interval`` seconds (100 Hz by default), so the profiled code runs
+    unmodified. Code wrapped in ``stage(name)`` is reported under that stage as
+    the root frame; other threads are grouped by their thread name (e.g.
+    ``nearby`` for the Nearby Search workers). ``stage()`` also accumulates wall
+    and CPU time per stage. Stacks are written in the collapsed format read by
+    flamegraph.pl, speedscope and similar tools.
+
+    A stage's CPU time is that of the thread that entered it. Stages that hand
+    their work to a thread pool, like ``search`` and ``details`` with the
+    ``nearby`` and ``details`` pools, mostly wait on that pool, so their
+    ``cpu_utilisation`` stays near zero however busy the pool is. The pool's own
+    work shows up in the samples under the pool's thread name.
+    """
+
+    def __init__(self, interval: float = 0.01, max_depth: int = 128):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples: Counter = Counter()
+        self.stage_times: Dict[str, Dict[str, float]] = {}
+        self._thread_stages: Dict[int, List[str]] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._started_wall = 0.0
+        self._started_cpu = 0.0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+
+    def start(self) -> 'StageProfiler':
+        self._started_wall = time.perf_counter()
+        self._started_cpu = time.process_time()
+        self._stopped.clear()
+        self._sampler = threading.Thread(target=self._run, name='stage-profiler', daemon=True)
+        self._sampler.start()
+        return self
+
+    def stop(self) -> None:
+        if self._sampler is None:
+            return
+        self._stopped.set()
+        self._sampler.join()
+        self._sampler = None
+        self.wall_seconds = time.perf_counter() - self._started_wall
+        self.cpu_seconds = time.process_time() - self._started_cpu
+
+    def __enter__(self) -> 'StageProfiler':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Attributes the calling thread's samples and wall/CPU time to ``name``.
+
+        CPU time is measured with ``time.thread_time()``, so work the stage hands
+        to other threads is not included.
+        """
+        ident = threading.get_ident()
+        stack = self._thread_stages.setdefault(ident, [])
+        stack.append(name)
+        wall_started = time.perf_counter()
+        cpu_started = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_started
+            cpu = time.thread_time() - cpu_started
+            stack.pop()
+            with self._lock:
+                totals = self.stage_times.setdefault(name, {'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0})
+                totals['calls'] += 1
+                totals['wall_seconds'] += wall
+                totals['cpu_seconds'] += cpu
+
+    @staticmethod
+    def _frame_label(frame: Any) -> str:
+        code = frame.f_code
+        location = f"{os.path.basename(os.path.dirname(code.co_filename))}/{os.path.basename(code.co_filename)}"
+        return f"{code.co_name} ({location}:{code.co_firstlineno})".replace(';', ':')
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, top in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                labels: List[str] = []
+                frame: Optional[FrameType] = top
+                while frame is not None and len(labels) < self.max_depth:
+                    labels.append(self._frame_label(frame))
+                    frame = frame.f_back
+                # Copied: the profiled thread may pop its stage between the check and the index.
+                stages = list(self._thread_stages.get(ident, ()))
+                root = stages[-1] if stages else _THREAD_SUFFIX.sub('', names.get(ident, 'thread'), count=1)
+                labels.append(root)
+                self.samples[';'.join(reversed(labels))] += 1
+
+    def stage_report(self) -> Dict[str, Any]:
+        """Wall/CPU seconds per stage, plus sample counts per root for the whole run."""
+        roots: Counter = Counter()
+        for stack, count in self.samples.items():
+            roots[stack.split(';', 1)[0]] += count
+        with self._lock:
+            stages = {
+                name: {
+                    'calls': int(totals['calls']),
+                    'wall_seconds': round(totals['wall_seconds'], 4),
+                    'cpu_seconds': round(totals['cpu_seconds'], 4),
+                    # Low values mean the stage mostly waits (network, page tokens, locks, or
+                    # worker pools, whose CPU time is not counted here).
+                    'cpu_utilisation': (
+                        round(totals['cpu_seconds'] / totals['wall_seconds'], 3) if totals['wall_seconds'] else 0.0
+                    ),
+                }
+                for name, totals in sorted(self.stage_times.items())
+            }
+        return {
+            'wall_seconds': round(self.wall_seconds, 4),
+            'cpu_seconds': round(self.cpu_seconds, 4),
+            'sample_interval_seconds': self.interval,
+            'stages': stages,
+            'samples_by_root': dict(roots.most_common()),
+        }
+
+    def write(self, directory: str) -> None:
+        """Writes ``stacks.collapsed`` and ``stages.json`` into ``directory``."""
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, 'stacks.collapsed'), 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.samples.items()):
+                f.write(f"{stack} {count}\n")
+        report = self.stage_report()
+        with open(os.path.join(directory, 'stages.json'), 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        breakdown = ', '.join(
+            f"{name} {totals['wall_seconds']:.2f}s wall/{totals['cpu_seconds']:.2f}s CPU"
+            for name, totals in report['stages'].items()
+        )
+        logger.info(f"Profile written to {directory} ({sum(self.samples.values())} samples): {breakdown or 'no stages'}.")
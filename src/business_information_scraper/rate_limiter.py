@@ -0,0 +1,92 @@
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from src.business_information_scraper.exceptions import QuotaExceededError
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token-bucket limiter shared by every thread that talks to the Places API.
+
+    Requests reserve a token and wait until it is due, so callers are served in
+    order at no more than the current rate. The rate halves whenever Google
+    answers with a quota error and creeps back towards ``max_qps`` with each
+    success. An optional ``daily_budget`` caps requests per UTC day.
+    """
+
+    def __init__(
+            self,
+            max_qps: float,
+            burst: Optional[int] = None,
+            daily_budget: Optional[int] = None,
+            min_qps: float = 0.5,
+    ):
+        self.max_qps = max_qps
+        self.min_qps = min(min_qps, max_qps)
+        self.rate = max_qps
+        self.capacity = burst or max(1, int(max_qps))
+        self.daily_budget = daily_budget
+        self.requests_today = 0
+        self.throttle_events = 0
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._day = datetime.now(timezone.utc).date()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Reserves one request and returns how many seconds to wait before sending it."""
+        with self._lock:
+            today = datetime.now(timezone.utc).date()
+            if today != self._day:
+                self._day = today
+                self.requests_today = 0
+            if self.daily_budget is not None and self.requests_today >= self.daily_budget:
+                raise QuotaExceededError(f"Daily budget of {self.daily_budget} API requests exhausted")
+            self.requests_today += 1
+
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Blocks until the caller may send one request."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def record_success(self) -> None:
+        if self.rate < self.max_qps:
+            with self._lock:
+                self.rate = min(self.max_qps, self.rate + self.max_qps * 0.05)
+
+    def record_quota_error(self) -> None:
+        """Halves the rate and drains the bucket so every worker backs off at once."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_qps, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            self.throttle_events += 1
+        logger.warning(f"Quota error from Google; request rate lowered to {self.rate:.2f} QPS.")
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient API errors."""
+
+    def __init__(self, max_retries: int = 5, base_delay: float = 0.5, max_delay: float = 30.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt + 1``."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))  # nosec B311
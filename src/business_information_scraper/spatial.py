@@ -0,0 +1,255 @@
+import logging
+import math
+import sqlite3
+import threading
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.business_information_scraper.data_models import BusinessRecord
+from src.business_information_scraper.exceptions import StorageError
+from src.business_information_scraper.geo import EARTH_RADIUS_METERS
+from src.business_information_scraper.transform import intern_types
+
+logger = logging.getLogger(__name__)
+
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+# Stored geohashes are ~4.8 m x 4.8 m cells; queries scan coarser prefixes of them.
+STORED_PRECISION = 9
+# Above this many cells a query drops to the next coarser prefix length.
+MAX_QUERY_CELLS = 64
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS_METERS / 180
+# kNN searches give up beyond this radius.
+MAX_NEAREST_RADIUS_METERS = 50_000
+
+_INSERT = (
+    "INSERT OR REPLACE INTO places (place_id, name, address, phone_number, types, latitude, longitude, geohash) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+# '~' sorts after every geohash character, so the geohash range is a prefix scan. The
+# box test drops the cell's corners in SQLite before any row reaches Python.
+_SELECT_IN_CELL = (
+    "SELECT place_id, name, address, phone_number, types, latitude, longitude FROM places "
+    "WHERE geohash >= ? AND geohash < ? AND latitude BETWEEN ? AND ? AND longitude BETWEEN ? AND ?"
+)
+
+
+class PlaceMatch(NamedTuple):
+    """A stored business returned by a query, with its distance from the query point when there is one."""
+    record: BusinessRecord
+    distance_meters: Optional[float] = None
+
+    def to_json_dict(self) -> dict:
+        result = self.record.to_json_dict()
+        if self.distance_meters is not None:
+            result['distance_meters'] = round(self.distance_meters, 1)
+        return result
+
+
+def _spread_bits(value: int) -> int:
+    """Moves bit i of a 32-bit integer to bit 2i."""
+    value &= 0xFFFFFFFF
+    value = (value | (value << 16)) & 0x0000FFFF0000FFFF
+    value = (value | (value << 8)) & 0x00FF00FF00FF00FF
+    value = (value | (value << 4)) & 0x0F0F0F0F0F0F0F0F
+    value = (value | (value << 2)) & 0x3333333333333333
+    return (value | (value << 1)) & 0x5555555555555555
+
+
+def _grid_bits(precision: int) -> Tuple[int, int]:
+    """Latitude and longitude bits of a geohash of ``precision`` characters (longitude gets the odd one)."""
+    total_bits = 5 * precision
+    return total_bits // 2, (total_bits + 1) // 2
+
+
+def _cell_geohash(row: int, col: int, precision: int) -> str:
+    """Geohash of the cell at grid ``row``/``col``, counted from the south-west corner."""
+    lat_bits, lng_bits = _grid_bits(precision)
+    if lat_bits == lng_bits:
+        value = _spread_bits(col) << 1 | _spread_bits(row)
+    else:
+        value = _spread_bits(col) | _spread_bits(row) << 1
+    return ''.join(GEOHASH_ALPHABET[(value >> shift) & 31] for shift in range(5 * precision - 5, -1, -5))
+
+
+def _cell_size_degrees(precision: int) -> Tuple[float, float]:
+    """Height and width in degrees of a geohash cell of ``precision`` characters."""
+    lat_bits, lng_bits = _grid_bits(precision)
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def geohash_encode(latitude: float, longitude: float, precision: int = STORED_PRECISION) -> str:
+    """Standard base32 geohash of a point."""
+    height, width = _cell_size_degrees(precision)
+    lat_bits, lng_bits = _grid_bits(precision)
+    row = min(int((latitude + 90) / height), (1 << lat_bits) - 1)
+    col = min(int((longitude + 180) / width), (1 << lng_bits) - 1)
+    return _cell_geohash(row, col, precision)
+
+
+def longitude_ranges(west: float, east: float) -> List[Tuple[float, float]]:
+    """Splits a box's longitude span into ranges within [-180, 180].
+
+    A box crosses the antimeridian when ``west > east`` (179 to -179) or when a
+    bound lies beyond it (179 to 181); it then becomes two ranges, one ending at
+    180 and one starting at -180.
+    """
+    if east - west >= 360:
+        return [(-180.0, 180.0)]
+    span = (east - west) % 360
+    west = (west + 180) % 360 - 180
+    east = west + span
+    if east <= 180:
+        return [(west, east)]
+    return [(west, 180.0), (-180.0, east - 360)]
+
+
+def covering_cells(south: float, west: float, north: float, east: float) -> List[str]:
+    """The geohash prefixes, as fine as possible within MAX_QUERY_CELLS, that cover a bounding box."""
+    south, north = max(south, -90.0), min(north, 90.0)
+    ranges = longitude_ranges(west, east)
+    for precision in range(STORED_PRECISION, 0, -1):
+        height, width = _cell_size_degrees(precision)
+        first_row, last_row = math.floor((south + 90) / height), math.floor((north + 90) / height)
+        column_spans = [(math.floor((w + 180) / width), math.floor((e + 180) / width)) for w, e in ranges]
+        columns = sum(last - first + 1 for first, last in column_spans)
+        if (last_row - first_row + 1) * columns <= MAX_QUERY_CELLS or precision == 1:
+            break
+    lat_bits, lng_bits = _grid_bits(precision)
+    return sorted({
+        # Rows are clamped at the poles and columns at the antimeridian.
+        _cell_geohash(min(row, (1 << lat_bits) - 1), min(col, (1 << lng_bits) - 1), precision)
+        for row in range(first_row, last_row + 1)
+        for first_col, last_col in column_spans
+        for col in range(first_col, last_col + 1)
+    })
+
+
+def haversine_meters(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lng2 - lng1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_METERS * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def bounding_box(latitude: float, longitude: float, radius: float) -> Tuple[float, float, float, float]:
+    """(south, west, north, east) of the box around a circle."""
+    lat_span = radius / METERS_PER_DEGREE
+    lng_span = radius / (METERS_PER_DEGREE * max(math.cos(math.radians(latitude)), 1e-6))
+    return latitude - lat_span, longitude - lng_span, latitude + lat_span, longitude + lng_span
+
+
+class SpatialIndex:
+    """Local geohash index of collected businesses for radius, bounding-box and nearest queries.
+
+    Each business with coordinates is stored once per place_id in SQLite, keyed
+    by a 9-character geohash. A query covers its area with up to
+    MAX_QUERY_CELLS geohash prefixes, range-scans the index for each and filters
+    the candidates exactly, so it reads little more than the matching rows and
+    needs no API request. Batches are added as they are saved, so the index
+    grows with every run.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # types are stored comma-separated: Places type names never contain commas.
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS places ("
+                "place_id TEXT PRIMARY KEY, name TEXT NOT NULL, address TEXT, phone_number TEXT, "
+                "types TEXT NOT NULL, latitude REAL NOT NULL, longitude REAL NOT NULL, geohash TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS places_geohash ON places(geohash)")
+            self._conn.commit()
+        except sqlite3.Error as e:
+            raise StorageError(f"Could not open spatial index at {path}: {e}")
+        logger.info(f"Spatial index opened at {path}")
+
+    def add(self, records: Iterable[BusinessRecord]) -> int:
+        """Inserts or replaces the records that have coordinates; returns how many were indexed."""
+        rows = [
+            (record.place_id, record.name, record.address, record.phone_number, ','.join(record.types),
+             record.latitude, record.longitude, geohash_encode(record.latitude, record.longitude))
+            for record in records if record.latitude is not None and record.longitude is not None
+        ]
+        if not rows:
+            return 0
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(_INSERT, rows)
+            except sqlite3.Error as e:
+                raise StorageError(f"Could not update spatial index at {self.path}: {e}")
+        return len(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM places").fetchone()[0]
+
+    def _candidates(
+            self, south: float, west: float, north: float, east: float, types: Sequence[str],
+    ) -> Iterator[Tuple[BusinessRecord, float, float]]:
+        """Yields each record in the box's cells with its coordinates, which are never NULL in the table."""
+        wanted = set(types)
+        with self._lock:
+            rows: List[Tuple[str, str, Optional[str], Optional[str], str, float, float]] = []
+            # A box crossing the antimeridian is queried as its two halves.
+            for lng_min, lng_max in longitude_ranges(west, east):
+                for cell in covering_cells(south, lng_min, north, lng_max):
+                    rows.extend(self._conn.execute(
+                        _SELECT_IN_CELL, (cell, cell + '~', south, north, lng_min, lng_max)
+                    ))
+        for place_id, name, address, phone_number, types_text, latitude, longitude in rows:
+            place_types = intern_types(types_text.split(',')) if types_text else ()
+            if wanted and wanted.isdisjoint(place_types):
+                continue
+            yield BusinessRecord(place_id, name, address, phone_number, place_types, latitude, longitude), latitude, longitude
+
+    def within_radius(
+            self, latitude: float, longitude: float, radius: float, types: Sequence[str] = (), limit: Optional[int] = None,
+    ) -> List[PlaceMatch]:
+        """Businesses within ``radius`` metres, nearest first, optionally having any of ``types``."""
+        found: List[Tuple[float, BusinessRecord]] = []
+        for record, place_latitude, place_longitude in self._candidates(*bounding_box(latitude, longitude, radius), types):
+            distance = haversine_meters(latitude, longitude, place_latitude, place_longitude)
+            if distance <= radius:
+                found.append((distance, record))
+        found.sort(key=lambda item: item[0])
+        matches = [PlaceMatch(record, distance) for distance, record in found]
+        return matches[:limit] if limit else matches
+
+    def within_box(
+            self, south: float, west: float, north: float, east: float, types: Sequence[str] = (), limit: Optional[int] = None,
+    ) -> List[PlaceMatch]:
+        """Businesses inside a bounding box, optionally having any of ``types``.
+
+        The box may cross the antimeridian, given either as ``west > east`` or with
+        ``east`` beyond 180.
+        """
+        ranges = longitude_ranges(west, east)
+        matches = [
+            PlaceMatch(record)
+            for record, place_latitude, place_longitude in self._candidates(south, west, north, east, types)
+            if south <= place_latitude <= north and any(w <= place_longitude <= e for w, e in ranges)
+        ]
+        matches.sort(key=lambda match: match.record.place_id)
+        return matches[:limit] if limit else matches
+
+    def nearest(
+            self, latitude: float, longitude: float, k: int, types: Sequence[str] = (),
+            max_radius: float = MAX_NEAREST_RADIUS_METERS,
+    ) -> List[PlaceMatch]:
+        """The ``k`` businesses nearest a point, searching circles that double in size up to ``max_radius``."""
+        radius = 100.0
+        while True:
+            matches = self.within_radius(latitude, longitude, radius, types)
+            # Anything closer than the k-th match would be inside this circle already.
+            if len(matches) >= k or radius >= max_radius:
+                return matches[:k]
+            radius = min(radius * 2, max_radius)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+        logger.info(f"Spatial index closed: {self.path}")
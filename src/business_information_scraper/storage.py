@@ -1,17 +1,38 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import IO, TYPE_CHECKING, List, Optional, Sequence
 import csv
+import json
 import logging
+import os
+import sqlite3
+import threading
 
-from src.business_information_scraper.data_models import BusinessInfo
+from src.business_information_scraper.data_models import UNKNOWN_ADDRESS, UNKNOWN_PHONE_NUMBER, BusinessInfo, BusinessRow
+from src.business_information_scraper.exceptions import ConfigurationError, StorageError
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # Parquet output is optional
+    pa = None  # type: ignore[assignment]
+    pq = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    import _csv
 
 logger = logging.getLogger(__name__)
 
+# Column order of every tabular output; rows are read from these attributes directly.
+BUSINESS_COLUMNS = tuple(BusinessInfo.model_fields.keys())
+_TYPES_COLUMN = BUSINESS_COLUMNS.index('types')
+
 
 class DataStorage(ABC):
     """Defines the interface for data storage implementations."""
     @abstractmethod
-    def save(self, data: List[BusinessInfo]) -> None:
+    def save(self, data: Sequence[BusinessRow]) -> None:
         raise NotImplementedError
 
     @abstractmethod
@@ -19,37 +40,294 @@ class DataStorage(ABC):
          """Perform any setup needed."""
          raise NotImplementedError
 
+    def flush(self) -> None:
+        """Push buffered records to the underlying medium."""
+
+    def close(self) -> None:
+        """Flush and release any resources acquired in setup()."""
+
 
 class CsvStorage(DataStorage):
-    def __init__(self, file_path: str):
+    """Appends businesses to a CSV file through one buffered handle kept open for the run.
+
+    ``setup()`` opens the file (writing the header if it is empty) and ``close()``
+    flushes and closes it. Write failures raise StorageError. An existing file
+    whose header has other columns, e.g. one written before coordinates were
+    added, is rejected with ConfigurationError rather than appended to.
+    """
+
+    def __init__(self, file_path: str, buffer_size: int = 1 << 20):
         self.file_path = file_path
+        self.buffer_size = buffer_size
+        self._file: Optional[IO[str]] = None
+        self._writer: Optional['_csv.Writer'] = None
+        self._columns = attrgetter(*BUSINESS_COLUMNS)
+        # Batch jobs share one storage instance across worker threads.
+        self._lock = threading.Lock()
         logger.info(f"Initializing CSV storage at: {self.file_path}")
 
+    def _check_header(self) -> None:
+        """Raises ConfigurationError if the file already holds rows with other columns."""
+        if not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0:
+            return
+        with open(self.file_path, newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), [])
+        if tuple(header) != BUSINESS_COLUMNS:
+            raise ConfigurationError(
+                f"CSV file {self.file_path} has columns {header}, not {list(BUSINESS_COLUMNS)}; "
+                f"set OUTPUT_FILE_PATH to a new file or use SQLite output, which migrates older files"
+            )
+
     def setup(self) -> None:
+        self._check_header()
         # Write header if file doesn't exist or is empty
         try:
-            with open(self.file_path, 'a', newline='', encoding='utf-8') as f:
-                if f.tell() == 0:
-                    writer = csv.writer(f)
-                    # Get headers from Pydantic model
-                    writer.writerow(BusinessInfo.model_fields.keys())
-                    logger.info(f"CSV header written to {self.file_path}")
+            self._file = open(self.file_path, 'a', newline='', encoding='utf-8', buffering=self.buffer_size)
+            self._writer = csv.writer(self._file)
+            if self._file.tell() == 0:
+                self._writer.writerow(BUSINESS_COLUMNS)
+                logger.info(f"CSV header written to {self.file_path}")
         except IOError as e:
              logger.error(f"Error during CSV setup for {self.file_path}: {e}", exc_info=True)
              raise e
 
-    def save(self, data: List[BusinessInfo]) -> None:
+    def _row(self, item: BusinessRow) -> tuple:
+        # Records carry types as a tuple; write the list repr either way so the file format is unchanged.
+        row = self._columns(item)
+        if isinstance(row[_TYPES_COLUMN], list):
+            return row
+        return (*row[:_TYPES_COLUMN], list(row[_TYPES_COLUMN]), *row[_TYPES_COLUMN + 1:])
+
+    def save(self, data: Sequence[BusinessRow]) -> None:
+        if self._writer is None:
+            raise StorageError(f"CSV storage for {self.file_path} used before setup()")
         logger.info(f"Saving {len(data)} records to CSV: {self.file_path}")
         try:
-            with open(self.file_path, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                for item in data:
-                    writer.writerow(item.model_dump(mode='python').values())
+            with self._lock:
+                self._writer.writerows(map(self._row, data))
             logger.info(f"Successfully saved {len(data)} records.")
         except IOError as e:
             logger.error(f"Error saving data to CSV {self.file_path}: {e}", exc_info=True)
+            raise StorageError(f"Error saving data to CSV {self.file_path}: {e}") from e
         except Exception as e:
-             logger.error(f"Unexpected error saving to CSV: {e}", exc_info=True)
+            logger.error(f"Unexpected error saving to CSV: {e}", exc_info=True)
+            raise StorageError(f"Unexpected error saving to CSV {self.file_path}: {e}") from e
+
+    def flush(self) -> None:
+        if self._file is None:
+            return
+        try:
+            with self._lock:
+                self._file.flush()
+        except IOError as e:
+            raise StorageError(f"Error flushing CSV {self.file_path}: {e}") from e
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        try:
+            with self._lock:
+                self._file.close()
+            logger.info(f"CSV storage closed: {self.file_path}")
+        except IOError as e:
+            raise StorageError(f"Error closing CSV {self.file_path}: {e}") from e
+        finally:
+            self._file = None
+            self._writer = None
+
+
+class SqliteStorage(DataStorage):
+    """Stores businesses in a SQLite database (WAL mode), one row per place_id.
+
+    Each batch is upserted with a single ``executemany`` inside one transaction,
+    so overlapping searches and reruns update rows instead of duplicating them.
+    ``types`` are merged with the stored ones, known address/phone values are not
+    replaced by placeholders, coordinates are only filled in, never cleared, and
+    ``first_seen``/``last_seen`` record when the place was first and most recently
+    written.
+    """
+
+    _CREATE_TABLE = """
+        CREATE TABLE IF NOT EXISTS businesses (
+            place_id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            address TEXT,
+            phone_number TEXT,
+            types TEXT NOT NULL DEFAULT '[]',
+            first_seen TEXT NOT NULL,
+            last_seen TEXT NOT NULL,
+            latitude REAL,
+            longitude REAL
+        )
+    """
+    # Columns added after the first release; older databases get them on setup().
+    _ADDED_COLUMNS = {'latitude': 'REAL', 'longitude': 'REAL'}
+    # The placeholder address and phone number are bound as ?10 and ?11.
+    _UPSERT = """
+        INSERT INTO businesses (place_id, name, address, phone_number, types, first_seen, last_seen, latitude, longitude)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(place_id) DO UPDATE SET
+            name = excluded.name,
+            address = COALESCE(NULLIF(excluded.address, ?10), businesses.address, excluded.address),
+            phone_number = COALESCE(
+                NULLIF(excluded.phone_number, ?11), businesses.phone_number, excluded.phone_number
+            ),
+            types = (
+                SELECT json_group_array(value) FROM (
+                    SELECT value FROM json_each(businesses.types)
+                    UNION
+                    SELECT value FROM json_each(excluded.types)
+                )
+            ),
+            last_seen = excluded.last_seen,
+            latitude = COALESCE(excluded.latitude, businesses.latitude),
+            longitude = COALESCE(excluded.longitude, businesses.longitude)
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._conn: Optional[sqlite3.Connection] = None
+        # Batch jobs share one storage instance across worker threads.
+        self._lock = threading.Lock()
+        logger.info(f"Initializing SQLite storage at: {self.file_path}")
+
+    def setup(self) -> None:
+        try:
+            self._conn = sqlite3.connect(self.file_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # With WAL, NORMAL only risks the last transactions on power loss, never corruption.
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(self._CREATE_TABLE)
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(businesses)")}
+            for column, column_type in self._ADDED_COLUMNS.items():
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE businesses ADD COLUMN {column} {column_type}")
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error during SQLite setup for {self.file_path}: {e}", exc_info=True)
+            raise StorageError(f"Error during SQLite setup for {self.file_path}: {e}") from e
+
+    def save(self, data: Sequence[BusinessRow]) -> None:
+        if self._conn is None:
+            raise StorageError(f"SQLite storage for {self.file_path} used before setup()")
+        seen_at = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (item.place_id, item.name, item.address, item.phone_number, json.dumps(list(item.types)), seen_at, seen_at,
+             item.latitude, item.longitude, UNKNOWN_ADDRESS, UNKNOWN_PHONE_NUMBER)
+            for item in data
+        ]
+        logger.info(f"Upserting {len(rows)} records into SQLite: {self.file_path}")
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(self._UPSERT, rows)
+        except sqlite3.Error as e:
+            logger.error(f"Error saving data to SQLite {self.file_path}: {e}", exc_info=True)
+            raise StorageError(f"Error saving data to SQLite {self.file_path}: {e}") from e
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        with self._lock:
+            self._conn.close()
+            self._conn = None
+        logger.info(f"SQLite storage closed: {self.file_path}")
+
+
+class ParquetStorage(DataStorage):
+    """Writes businesses to a columnar Parquet file (requires ``pyarrow``).
+
+    Each saved batch becomes an Arrow record batch; batches are accumulated and
+    written as one compressed row group once ``row_group_size`` rows are pending.
+    ``types`` is a native ``list<string>`` column. Parquet files cannot be appended
+    to, so ``setup()`` replaces any existing file and ``close()`` must be called to
+    write the footer.
+    """
+
+    def __init__(self, file_path: str, row_group_size: int = 100_000, compression: str = 'zstd'):
+        if pa is None:
+            raise ConfigurationError("Parquet storage requires the 'pyarrow' package")
+        self.file_path = file_path
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self.schema = pa.schema([
+            ('place_id', pa.string()),
+            ('name', pa.string()),
+            ('address', pa.string()),
+            ('phone_number', pa.string()),
+            ('types', pa.list_(pa.string())),
+            ('latitude', pa.float64()),
+            ('longitude', pa.float64()),
+        ])
+        self._writer: Optional['pq.ParquetWriter'] = None
+        self._pending: List = []
+        self._pending_rows = 0
+        # Batch jobs share one storage instance across worker threads.
+        self._lock = threading.Lock()
+        logger.info(f"Initializing Parquet storage at: {self.file_path}")
+
+    def setup(self) -> None:
+        try:
+            self._writer = pq.ParquetWriter(self.file_path, self.schema, compression=self.compression)
+        except (OSError, pa.ArrowException) as e:
+            logger.error(f"Error during Parquet setup for {self.file_path}: {e}", exc_info=True)
+            raise StorageError(f"Error during Parquet setup for {self.file_path}: {e}") from e
+
+    def _to_record_batch(self, data: Sequence[BusinessRow]):
+        return pa.RecordBatch.from_arrays([
+            pa.array([item.place_id for item in data], pa.string()),
+            pa.array([item.name for item in data], pa.string()),
+            pa.array([item.address for item in data], pa.string()),
+            pa.array([item.phone_number for item in data], pa.string()),
+            pa.array([list(item.types) for item in data], pa.list_(pa.string())),
+            pa.array([item.latitude for item in data], pa.float64()),
+            pa.array([item.longitude for item in data], pa.float64()),
+        ], schema=self.schema)
+
+    def _write_pending(self, writer: 'pq.ParquetWriter') -> None:
+        if not self._pending:
+            return
+        table = pa.Table.from_batches(self._pending, schema=self.schema)
+        writer.write_table(table, row_group_size=self.row_group_size)
+        logger.info(f"Wrote row group of {self._pending_rows} records to Parquet: {self.file_path}")
+        self._pending = []
+        self._pending_rows = 0
+
+    def save(self, data: Sequence[BusinessRow]) -> None:
+        if self._writer is None:
+            raise StorageError(f"Parquet storage for {self.file_path} used before setup()")
+        try:
+            batch = self._to_record_batch(data)
+            with self._lock:
+                self._pending.append(batch)
+                self._pending_rows += batch.num_rows
+                if self._pending_rows >= self.row_group_size:
+                    self._write_pending(self._writer)
+        except (OSError, pa.ArrowException) as e:
+            logger.error(f"Error saving data to Parquet {self.file_path}: {e}", exc_info=True)
+            raise StorageError(f"Error saving data to Parquet {self.file_path}: {e}") from e
+
+    def flush(self) -> None:
+        """Writes pending batches as a (possibly short) row group."""
+        if self._writer is None:
+            return
+        try:
+            with self._lock:
+                self._write_pending(self._writer)
+        except (OSError, pa.ArrowException) as e:
+            raise StorageError(f"Error flushing Parquet {self.file_path}: {e}") from e
+
+    def close(self) -> None:
+        if self._writer is None:
+            return
+        try:
+            with self._lock:
+                self._write_pending(self._writer)
+                self._writer.close()
+            logger.info(f"Parquet storage closed: {self.file_path}")
+        except (OSError, pa.ArrowException) as e:
+            raise StorageError(f"Error closing Parquet {self.file_path}: {e}") from e
+        finally:
+            self._writer = None
 
 
 def get_storage_strategy(storage_type: str, **kwargs) -> DataStorage:
@@ -58,5 +336,14 @@ def get_storage_strategy(storage_type: str, **kwargs) -> DataStorage:
         if 'file_path' not in kwargs:
             raise ValueError("Missing 'file_path' for CSV storage")
         return CsvStorage(kwargs['file_path'])
+    elif storage_type.lower() == 'sqlite':
+        if not kwargs.get('file_path'):
+            raise ValueError("Missing 'file_path' for SQLite storage")
+        return SqliteStorage(kwargs['file_path'])
+    elif storage_type.lower() == 'parquet':
+        if not kwargs.get('file_path'):
+            raise ValueError("Missing 'file_path' for Parquet storage")
+        options = {k: kwargs[k] for k in ('row_group_size', 'compression') if kwargs.get(k) is not None}
+        return ParquetStorage(kwargs['file_path'], **options)
     else:
         raise ValueError(f"Unsupported storage type: {storage_type}")
@@ -0,0 +1,55 @@
+import math
+from typing import List, Tuple
+
+from src.business_information_scraper.data_models import SearchTile
+
+EARTH_RADIUS_METERS = 6_371_000.0
+
+
+def offset_coordinates(latitude: float, longitude: float, north_meters: float, east_meters: float) -> Tuple[float, float]:
+    """Moves a coordinate by the given north/east distances (equirectangular approximation)."""
+    delta_lat = math.degrees(north_meters / EARTH_RADIUS_METERS)
+    delta_lng = math.degrees(east_meters / (EARTH_RADIUS_METERS * math.cos(math.radians(latitude))))
+    return latitude + delta_lat, longitude + delta_lng
+
+
+def split_tile(tile: SearchTile) -> List[SearchTile]:
+    """Splits a circle into the four circles circumscribing the quadrants of its bounding square.
+
+    The children together cover the parent's bounding square, so no part of the
+    parent circle is lost when the parent is replaced by its children.
+    """
+    offset = tile.radius / 2
+    child_radius = tile.radius / math.sqrt(2)
+    children = []
+    for north, east in ((offset, -offset), (offset, offset), (-offset, -offset), (-offset, offset)):
+        latitude, longitude = offset_coordinates(tile.latitude, tile.longitude, north, east)
+        children.append(SearchTile(latitude=latitude, longitude=longitude, radius=child_radius, depth=tile.depth + 1))
+    return children
+
+
+def cover_with_tiles(tile: SearchTile, max_radius: float) -> List[SearchTile]:
+    """Covers a circle with a square grid of tiles no wider than ``max_radius``.
+
+    Each tile circumscribes one grid cell of side ``max_radius * sqrt(2)``, so
+    the tiles together cover every cell; cells that do not reach into the
+    circle are left out. A circle that already fits is returned unchanged.
+    """
+    if tile.radius <= max_radius:
+        return [tile]
+    side = max_radius * math.sqrt(2)
+    cells = math.ceil(2 * tile.radius / side)
+    origin = -cells * side / 2
+    tiles = []
+    for row in range(cells):
+        south = origin + row * side
+        for col in range(cells):
+            west = origin + col * side
+            # Distance from the centre to the nearest point of the cell.
+            north_gap = max(south, 0.0, -(south + side))
+            east_gap = max(west, 0.0, -(west + side))
+            if math.hypot(north_gap, east_gap) >= tile.radius:
+                continue
+            latitude, longitude = offset_coordinates(tile.latitude, tile.longitude, south + side / 2, west + side / 2)
+            tiles.append(SearchTile(latitude=latitude, longitude=longitude, radius=max_radius, depth=tile.depth))
+    return tiles
@@ -0,0 +1,109 @@
+import logging
+import sys
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+if sys.version_info >= (3, 12):
+    from typing import Required, TypedDict
+else:  # pydantic only accepts typing.TypedDict from Python 3.12 on
+    from typing_extensions import Required, TypedDict
+
+from src.business_information_scraper.data_models import UNKNOWN_ADDRESS, UNKNOWN_PHONE_NUMBER, BusinessRecord
+
+logger = logging.getLogger(__name__)
+
+# Distinct type lists are few (a few hundred at most), so the cache stays small.
+_MAX_CACHED_TYPE_TUPLES = 10_000
+_types_cache: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+class _LatLng(TypedDict):
+    lat: float
+    lng: float
+
+
+class _Geometry(TypedDict, total=False):
+    location: _LatLng
+
+
+class PlaceResult(TypedDict, total=False):
+    """The fields of a Nearby Search / Place Details result that become a business record."""
+    place_id: Required[str]
+    name: str
+    formatted_address: str
+    international_phone_number: str
+    types: List[str]
+    geometry: _Geometry
+
+
+_page_adapter = TypeAdapter(List[PlaceResult])
+_place_adapter = TypeAdapter(PlaceResult)
+
+
+def intern_types(types: Iterable[str]) -> Tuple[str, ...]:
+    """Returns a shared tuple of interned strings for a types list."""
+    key = tuple(types)
+    cached = _types_cache.get(key)
+    if cached is None:
+        cached = tuple(sys.intern(value) for value in key)
+        if len(_types_cache) < _MAX_CACHED_TYPE_TUPLES:
+            _types_cache[cached] = cached
+    return cached
+
+
+def _to_record(place: PlaceResult) -> BusinessRecord:
+    location = place.get('geometry', {}).get('location')
+    return BusinessRecord(
+        place['place_id'],
+        place.get('name', 'N/A'),
+        place.get('formatted_address', UNKNOWN_ADDRESS),
+        place.get('international_phone_number', UNKNOWN_PHONE_NUMBER),
+        intern_types(place.get('types', ())),
+        location['lat'] if location else None,
+        location['lng'] if location else None,
+    )
+
+
+def to_records(places: Sequence[dict]) -> Tuple[List[BusinessRecord], int]:
+    """Validates a page of places in one pass and returns the records plus the number that failed.
+
+    The whole page goes through a single ``TypeAdapter`` call. Only when it contains
+    an invalid place are the places validated one by one, to keep the valid ones.
+    """
+    try:
+        validated = _page_adapter.validate_python(places)
+    except ValidationError:
+        validated = []
+        for place in places:
+            try:
+                validated.append(_place_adapter.validate_python(place))
+            except ValidationError as e:
+                logger.error(f"Error transforming details for place_id {place.get('place_id', 'UNKNOWN')}: {e}")
+    return [_to_record(place) for place in validated], len(places) - len(validated)
+
+
+def combine_types(place: dict, other: dict) -> dict:
+    """``place`` with the types of ``other`` it lacks appended; a copy only when something is added."""
+    types = place.get('types') or []
+    extra = [name for name in other.get('types') or () if name not in types]
+    return {**place, 'types': [*types, *extra]} if extra else place
+
+
+def merge_places(places: Iterable[dict]) -> List[dict]:
+    """One place per place_id, in first-seen order, with the types of all its copies combined.
+
+    The first copy supplies every other field. Places without a place_id are
+    kept as they are, after the others.
+    """
+    merged: Dict[str, dict] = {}
+    without_id = []
+    for place in places:
+        place_id = place.get('place_id')
+        if not place_id:
+            without_id.append(place)
+        elif place_id in merged:
+            merged[place_id] = combine_types(merged[place_id], place)
+        else:
+            merged[place_id] = place
+    return [*merged.values(), *without_id]
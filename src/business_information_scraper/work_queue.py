@@ -0,0 +1,305 @@
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from src.business_information_scraper.batch import run_job
+from src.business_information_scraper.data_models import BatchReport, JobResult, SearchJob, SearchTile
+from src.business_information_scraper.exceptions import StorageError
+from src.business_information_scraper.processor import BusinessDataProcessor
+from src.business_information_scraper.tiling import cover_with_tiles
+
+logger = logging.getLogger(__name__)
+
+TASK_STATES = ('pending', 'leased', 'done', 'failed')
+
+
+def job_key(job: SearchJob) -> str:
+    """Identity of a job in the queue; enqueueing the same search twice adds it once."""
+    return f"{job.business_type}|{job.latitude:.6f}|{job.longitude:.6f}|{job.radius_meters}"
+
+
+def split_jobs(jobs: Iterable[SearchJob], max_radius: int) -> List[SearchJob]:
+    """Replaces each job wider than ``max_radius`` with jobs for the tiles covering its circle."""
+    split: List[SearchJob] = []
+    for job in jobs:
+        tiles = cover_with_tiles(
+            SearchTile(latitude=job.latitude, longitude=job.longitude, radius=job.radius_meters), max_radius
+        )
+        if len(tiles) == 1:
+            split.append(job)
+            continue
+        for number, tile in enumerate(tiles, start=1):
+            split.append(SearchJob(
+                latitude=round(tile.latitude, 6),
+                longitude=round(tile.longitude, 6),
+                radius_meters=max_radius,
+                business_type=job.business_type,
+                name=f"{job.label} tile {number}/{len(tiles)}",
+            ))
+    return split
+
+
+class Lease(NamedTuple):
+    """A claimed task. ``attempt`` fences it: once the task is claimed again, this lease is void."""
+    task_id: int
+    job: SearchJob
+    worker_id: str
+    attempt: int
+
+
+class WorkQueue:
+    """Search jobs shared by any number of worker processes through one SQLite file.
+
+    A worker claims a pending task for ``lease_seconds`` and must heartbeat
+    to keep it. A task whose lease runs out (its worker died or hung) is handed
+    to the next worker that asks, and each claim increments the task's attempt
+    counter. Heartbeats and completions carry the attempt they were claimed
+    with, so a worker that lost its lease cannot complete the task over its
+    new owner: every task ends done or failed exactly once. Its searches may
+    still have run twice in that case, which storage upserts absorb.
+
+    Claims take SQLite's write lock for one short transaction, so workers on
+    one machine, or on several sharing a volume with working POSIX locks,
+    scale until claims approach the database's write rate (thousands per
+    second). Network filesystems without reliable locking are not supported.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 120.0, max_attempts: int = 3):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        try:
+            # Autocommit mode, so claims can open their own BEGIN IMMEDIATE transaction.
+            self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tasks ("
+                "id INTEGER PRIMARY KEY, key TEXT NOT NULL UNIQUE, job TEXT NOT NULL, "
+                "state TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0, "
+                "lease_owner TEXT, lease_expires REAL, result TEXT, updated_at REAL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS tasks_state ON tasks(state, id)")
+        except sqlite3.Error as e:
+            raise StorageError(f"Could not open work queue at {path}: {e}")
+
+    def enqueue(self, jobs: Iterable[SearchJob]) -> int:
+        """Adds jobs not queued before; returns how many were added."""
+        now = time.time()
+        rows = [(job_key(job), job.model_dump_json(), now) for job in jobs]
+        with self._lock:
+            try:
+                before = self._conn.total_changes
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._conn.executemany("INSERT OR IGNORE INTO tasks (key, job, updated_at) VALUES (?, ?, ?)", rows)
+                self._conn.execute("COMMIT")
+                added = self._conn.total_changes - before
+            except sqlite3.Error as e:
+                self._rollback()
+                raise StorageError(f"Could not enqueue jobs in {self.path}: {e}")
+        logger.info(f"Enqueued {added} of {len(rows)} jobs in {self.path}")
+        return added
+
+    def claim(self, worker_id: str) -> Optional[Lease]:
+        """Leases the oldest pending or expired task to ``worker_id``, or returns None when there is none."""
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                # Expired leases that used up their attempts are given up instead of handed out again.
+                exhausted = self._conn.execute(
+                    "SELECT id, job, attempts FROM tasks WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                    (now, self.max_attempts),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE tasks SET state = 'failed', lease_owner = NULL, result = ?, updated_at = ? WHERE id = ?",
+                    [
+                        (JobResult(
+                            job=SearchJob.model_validate_json(job), succeeded=False,
+                            error=f"Lease expired on each of {attempts} attempts",
+                        ).model_dump_json(), now, task_id)
+                        for task_id, job, attempts in exhausted
+                    ],
+                )
+                row = self._conn.execute(
+                    "SELECT id, job, attempts FROM tasks WHERE state = 'pending' "
+                    "OR (state = 'leased' AND lease_expires < ?) ORDER BY id LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE tasks SET state = 'leased', attempts = attempts + 1, lease_owner = ?, "
+                        "lease_expires = ?, updated_at = ? WHERE id = ?",
+                        (worker_id, now + self.lease_seconds, now, row[0]),
+                    )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                self._rollback()
+                raise StorageError(f"Could not claim a task from {self.path}: {e}")
+        if row is None:
+            return None
+        task_id, job, attempts = row
+        return Lease(task_id, SearchJob.model_validate_json(job), worker_id, attempts + 1)
+
+    # Updates that only apply while the lease they carry still holds the task. Each binds
+    # its own values first, then updated_at, id, lease_owner and attempts.
+    _HEARTBEAT = (
+        "UPDATE tasks SET lease_expires = ?, updated_at = ? "
+        "WHERE id = ? AND state = 'leased' AND lease_owner = ? AND attempts = ?"
+    )
+    _COMPLETE = (
+        "UPDATE tasks SET state = 'done', lease_owner = NULL, result = ?, updated_at = ? "
+        "WHERE id = ? AND state = 'leased' AND lease_owner = ? AND attempts = ?"
+    )
+    _FAIL = (
+        "UPDATE tasks SET state = ?, lease_owner = NULL, lease_expires = NULL, result = ?, updated_at = ? "
+        "WHERE id = ? AND state = 'leased' AND lease_owner = ? AND attempts = ?"
+    )
+
+    def _update_leased(self, lease: Lease, statement: str, params: tuple) -> bool:
+        """Runs one of the lease-fenced updates; False means ``lease`` no longer holds the task."""
+        with self._lock:
+            try:
+                cursor = self._conn.execute(
+                    statement, (*params, time.time(), lease.task_id, lease.worker_id, lease.attempt)
+                )
+            except sqlite3.Error as e:
+                raise StorageError(f"Could not update task {lease.task_id} in {self.path}: {e}")
+        return cursor.rowcount == 1
+
+    def heartbeat(self, lease: Lease) -> bool:
+        """Extends the lease; False means it was lost to another worker."""
+        return self._update_leased(lease, self._HEARTBEAT, (time.time() + self.lease_seconds,))
+
+    def complete(self, lease: Lease, result: JobResult) -> bool:
+        """Records the task as done; False means the lease was lost and the result discarded."""
+        return self._update_leased(lease, self._COMPLETE, (result.model_dump_json(),))
+
+    def fail(self, lease: Lease, result: JobResult) -> bool:
+        """Puts a failed task back in the queue, or records it as failed once it used up its attempts.
+
+        Returns whether the task was given up.
+        """
+        final = lease.attempt >= self.max_attempts
+        recorded = self._update_leased(
+            lease, self._FAIL, ('failed' if final else 'pending', result.model_dump_json()),
+        )
+        return recorded and final
+
+    def counts(self) -> Dict[str, int]:
+        """Number of tasks in each state."""
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM tasks GROUP BY state").fetchall()
+        return {state: 0 for state in TASK_STATES} | dict(rows)
+
+    def results(self) -> List[JobResult]:
+        """Results of the finished tasks, in the order the tasks were enqueued."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT result FROM tasks WHERE state IN ('done', 'failed') ORDER BY id"
+            ).fetchall()
+        return [JobResult.model_validate_json(result) for (result,) in rows]
+
+    def is_drained(self) -> bool:
+        """Whether every task is done or failed."""
+        counts = self.counts()
+        return counts['pending'] == 0 and counts['leased'] == 0
+
+    def _rollback(self) -> None:
+        if self._conn.in_transaction:
+            self._conn.execute("ROLLBACK")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class QueueWorker:
+    """Claims and runs jobs from a WorkQueue until it is drained.
+
+    ``max_workers`` threads share the processor, each holding at most one lease;
+    one background thread heartbeats all of them every third of the lease
+    period. While other workers still hold leases, idle threads poll in case
+    one expires and has to be taken over.
+    """
+
+    def __init__(
+            self,
+            queue: WorkQueue,
+            processor: BusinessDataProcessor,
+            max_workers: int = 4,
+            worker_id: Optional[str] = None,
+            poll_interval: float = 1.0,
+    ):
+        self.queue = queue
+        self.processor = processor
+        self.max_workers = max_workers
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.poll_interval = poll_interval
+        self._leases: Dict[str, Lease] = {}
+        self._leases_lock = threading.Lock()
+        self._results: List[JobResult] = []
+        self._stopped = threading.Event()
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stopped.wait(self.queue.lease_seconds / 3):
+            with self._leases_lock:
+                leases = list(self._leases.items())
+            for thread_id, lease in leases:
+                try:
+                    if not self.queue.heartbeat(lease):
+                        logger.warning(f"Lease on task {lease.task_id} ({lease.job.label}) was lost by {thread_id}")
+                        with self._leases_lock:
+                            self._leases.pop(thread_id, None)
+                except StorageError as e:
+                    logger.error(f"Heartbeat failed: {e}")
+
+    def _work(self, thread_number: int) -> None:
+        thread_id = f"{self.worker_id}/{thread_number}"
+        while True:
+            lease = self.queue.claim(thread_id)
+            if lease is None:
+                if self.queue.is_drained():
+                    return
+                time.sleep(self.poll_interval)
+                continue
+            with self._leases_lock:
+                self._leases[thread_id] = lease
+            logger.info(f"{thread_id} claimed task {lease.task_id} ({lease.job.label}), attempt {lease.attempt}")
+            try:
+                result = run_job(self.processor, lease.job)
+            finally:
+                with self._leases_lock:
+                    self._leases.pop(thread_id, None)
+            if result.succeeded:
+                if self.queue.complete(lease, result):
+                    self._results.append(result)
+                else:
+                    logger.warning(f"Task {lease.task_id} was taken over before {thread_id} completed it")
+            elif self.queue.fail(lease, result):
+                self._results.append(result)
+
+    def run(self) -> BatchReport:
+        """Works until no task is pending or leased, and reports the tasks this worker finished."""
+        logger.info(f"Worker {self.worker_id} starting with {self.max_workers} threads on {self.queue.path}.")
+        started = time.perf_counter()
+        heartbeat = threading.Thread(target=self._heartbeat_loop, name='queue-heartbeat', daemon=True)
+        heartbeat.start()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='queue-job') as executor:
+                # list() re-raises the first error of any thread.
+                list(executor.map(self._work, range(self.max_workers)))
+        finally:
+            self._stopped.set()
+            heartbeat.join()
+        report = BatchReport(results=self._results, duration_seconds=time.perf_counter() - started)
+        logger.info(
+            f"Worker {self.worker_id} finished in {report.duration_seconds:.1f}s: "
+            f"{report.succeeded} succeeded, {report.failed} failed. Queue: {self.queue.counts()}"
+        )
+        return report
@@ -0,0 +1,162 @@
+import json
+import logging
+import queue
+import threading
+import time
+from typing import List, Optional, Sequence
+
+from src.business_information_scraper.data_models import BusinessInfo, BusinessRow
+from src.business_information_scraper.exceptions import StorageError
+from src.business_information_scraper.metrics import MetricsRegistry
+from src.business_information_scraper.storage import DataStorage
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+def _json_record(item: BusinessRow) -> dict:
+    return item.model_dump(mode='json') if isinstance(item, BusinessInfo) else item.to_json_dict()
+
+
+class _SavedBatches:
+    """How many batches one thread saved since its last flush, and how many of those were not written."""
+
+    def __init__(self) -> None:
+        self.saved = 0
+        self.failed = 0
+
+
+class BackgroundStorageWriter(DataStorage):
+    """Wraps any DataStorage so batches are written by a dedicated thread.
+
+    ``save()`` only enqueues the batch; when ``max_pending_batches`` are already
+    waiting it blocks, which slows the fetching side down to what storage can
+    absorb. A batch whose save fails is retried with a growing delay and, if it
+    still fails, appended to ``dead_letter_path`` as JSON lines (or logged as lost
+    when no path is configured).
+
+    ``flush()`` raises StorageError when any batch the calling thread saved since
+    its previous flush was dead-lettered or dropped, so callers that journal
+    progress after a flush never mark lost rows as stored.
+    """
+
+    def __init__(
+            self,
+            storage: DataStorage,
+            max_pending_batches: int = 8,
+            max_retries: int = 3,
+            retry_delay_seconds: float = 0.5,
+            dead_letter_path: Optional[str] = None,
+            metrics: Optional[MetricsRegistry] = None,
+    ):
+        self.storage = storage
+        self.metrics = metrics or MetricsRegistry()
+        self.max_retries = max_retries
+        self.retry_delay_seconds = retry_delay_seconds
+        self.dead_letter_path = dead_letter_path
+        self.batches_written = 0
+        self.rows_written = 0
+        self.retries = 0
+        self.spilled_rows = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending_batches)
+        self._thread: Optional[threading.Thread] = None
+        # Each queued batch carries its thread's counts, so a failure is charged to the
+        # flush of the thread that saved it; flush() resets them, nothing accumulates.
+        self._failed_lock = threading.Lock()
+        self._local = threading.local()
+
+    def setup(self) -> None:
+        self.storage.setup()
+        self._thread = threading.Thread(target=self._run, name='storage-writer', daemon=True)
+        self._thread.start()
+
+    def save(self, data: Sequence[BusinessRow]) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            raise StorageError("Background storage writer is not running; call setup() first")
+        counts = self._saved_batches()
+        with self._failed_lock:
+            counts.saved += 1
+        # Copy so the caller can keep reusing its buffer.
+        self._queue.put((counts, list(data)))
+
+    def _saved_batches(self) -> _SavedBatches:
+        counts = getattr(self._local, 'counts', None)
+        if counts is None:
+            counts = self._local.counts = _SavedBatches()
+        return counts
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                counts, batch = item
+                if not self._write(batch):
+                    with self._failed_lock:
+                        counts.failed += 1
+            finally:
+                self._queue.task_done()
+
+    def _write(self, batch: List[BusinessRow]) -> bool:
+        """Saves a batch, retrying; returns False once it had to be dead-lettered or dropped."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self.metrics.timer('storage_write_seconds'):
+                    self.storage.save(batch)
+                self.batches_written += 1
+                self.rows_written += len(batch)
+                return True
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self._spill(batch, e)
+                    return False
+                self.retries += 1
+                self.metrics.inc('storage_write_retries_total')
+                delay = self.retry_delay_seconds * (2 ** attempt)
+                logger.warning(f"Saving batch of {len(batch)} failed ({e}); retrying in {delay:.1f}s.")
+                time.sleep(delay)
+        return False
+
+    def _spill(self, batch: List[BusinessRow], error: Exception) -> None:
+        self.spilled_rows += len(batch)
+        self.metrics.inc('storage_dead_letter_rows_total', len(batch))
+        if not self.dead_letter_path:
+            logger.error(f"Dropping batch of {len(batch)} after {self.max_retries} retries: {error}. Data is lost.")
+            return
+        try:
+            with open(self.dead_letter_path, 'a', encoding='utf-8') as f:
+                for item in batch:
+                    f.write(json.dumps({'error': str(error), 'record': _json_record(item)}) + '\n')
+            logger.error(
+                f"Batch of {len(batch)} failed after {self.max_retries} retries ({error}); "
+                f"written to dead-letter file {self.dead_letter_path}."
+            )
+        except OSError as e:
+            logger.error(f"Could not write dead-letter file {self.dead_letter_path}: {e}. Batch of {len(batch)} is lost.")
+
+    def flush(self) -> None:
+        """Waits until every queued batch has been handled, then flushes the wrapped storage.
+
+        Raises StorageError if a batch this thread saved since its last flush was not written.
+        """
+        self._queue.join()
+        counts = self._saved_batches()
+        with self._failed_lock:
+            saved, failed = counts.saved, counts.failed
+            counts.saved = counts.failed = 0
+        self.storage.flush()
+        if failed:
+            raise StorageError(f"{failed} of the {saved} batches saved since the last flush were not written")
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+        self.storage.close()
+        logger.info(
+            f"Background writer closed: {self.rows_written} rows in {self.batches_written} batches, "
+            f"{self.retries} retries, {self.spilled_rows} rows dead-lettered."
+        )
@@ -1,18 +1,62 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field, PositiveInt
+from pydantic import Field, NonNegativeInt, PositiveFloat, PositiveInt
+from typing import Optional
 
 class AppSettings(BaseSettings):
     model_config = SettingsConfigDict(env_file='.env', env_file_encoding='utf-8', extra='ignore')
 
     google_api_key: str = Field(..., validation_alias='Maps_API_KEY')
-    search_latitude: float
-    search_longitude: float
+    search_latitude: Optional[float] = None # Required unless a batch manifest is given
+    search_longitude: Optional[float] = None
     search_radius_meters: PositiveInt = 5000 # Default 5km
-    target_business_type: str = 'restaurant' # Example: find restaurants
-    output_storage_type: str = 'csv' # e.g., 'csv', 'json', 'postgresql'
-    output_file_path: str | None = 'businesses.csv' # Required if type is csv/json
-    batch_size: int = 100
+    target_business_type: str = 'restaurant' # Comma-separated types are searched together and merged
+    min_tile_radius_meters: Optional[PositiveInt] = None # Enables adaptive tiling when set
+    coverage_area: Optional[str] = None # City or region to geocode and cover with search circles
+    coverage_radius_meters: PositiveInt = 1000 # Radius of each circle of the coverage plan
+    output_storage_type: str = 'csv' # 'csv', 'sqlite' or 'parquet'
+    output_file_path: str | None = 'businesses.csv' # Required for every storage type
+    parquet_row_group_size: PositiveInt = 100_000
+    parquet_compression: str = 'zstd' # e.g. 'zstd', 'snappy', 'gzip', 'none'
+    background_writer: bool = False # Write batches from a dedicated thread
+    writer_queue_batches: PositiveInt = 8 # Batches buffered before fetching blocks
+    writer_max_retries: NonNegativeInt = 3 # Retries of a failed batch before it is dead-lettered
+    dead_letter_path: Optional[str] = None # Batches that still fail are appended here as JSON lines
+    batch_size: PositiveInt = 100 # Businesses buffered before each storage write
+    batch_manifest_path: Optional[str] = None # CSV/JSON/TOML list of search jobs
+    batch_max_workers: PositiveInt = 4
+    batch_report_path: Optional[str] = None # Per-job results written as JSON
+    work_queue_path: Optional[str] = None # Shared SQLite job queue for --enqueue and --worker
+    work_queue_lease_seconds: PositiveInt = 120 # A job not heartbeated for this long goes to another worker
+    work_queue_max_attempts: PositiveInt = 3
+    work_queue_tile_radius_meters: Optional[PositiveInt] = None # Wider jobs are split into tiles when enqueued
+    checkpoint_path: Optional[str] = None # Progress journal; needed for --resume
+    checkpoint_token_ttl_seconds: PositiveInt = 120 # Older page tokens restart their query
     api_timeout_seconds: PositiveInt = 10
+    api_base_url: str = 'https://maps.googleapis.com' # Point at a local fake server for tests and benchmarks
+    max_concurrent_queries: PositiveInt = 8 # Nearby Search requests in flight at once
+    page_token_delay_seconds: PositiveFloat = 1.5 # Wait before a next_page_token is first tried
+    api_max_qps: PositiveFloat = 10.0 # Shared by every worker in the process
+    api_daily_budget: Optional[PositiveInt] = None # Max requests per UTC day
+    api_max_retries: NonNegativeInt = 5 # Retries for quota and transient errors
+    async_http: bool = False # Use the asyncio client with a pooled HTTP connection set
+    http_max_connections: PositiveInt = 100 # Async client only
+    http_max_keepalive_connections: PositiveInt = 20 # Async client only
+    enrich_details: bool = False # Fetch address/phone via Place Details
+    details_max_workers: PositiveInt = 8
+    dedup_index_path: Optional[str] = None # SQLite index of stored place_ids; known places are skipped
+    dedup_expected_places: PositiveInt = 10_000_000 # Sizes the in-memory bloom filter (~1.8 MB per million)
+    dedup_error_rate: PositiveFloat = 0.001 # Bloom filter false positive rate; hits are confirmed in SQLite
+    refresh_stale_after_seconds: Optional[PositiveInt] = None # Refresh mode: re-fetch indexed places older than this
+    spatial_index_path: Optional[str] = None # Local geohash index of saved businesses, queried with src.query
+    geo_filter: bool = False # Drop out-of-radius places and duplicates before storage; needs numpy
+    cache_path: Optional[str] = None # SQLite response cache; disabled when unset
+    cache_ttl_seconds: PositiveInt = 86400
+    cache_max_entries: PositiveInt = 100_000
+    cache_bypass: bool = False # Ignore cached responses but keep refreshing them
+    metrics_report_path: Optional[str] = None # JSON run report written when the run ends
+    metrics_prometheus_path: Optional[str] = None # Prometheus text-format file written when the run ends
+    metrics_port: Optional[PositiveInt] = None # Serve /metrics on this port while running
+    profile_interval_seconds: PositiveFloat = 0.01 # Sampling interval of --profile
     log_level: str = "INFO"
 
 settings = AppSettings()
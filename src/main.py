@@ -1,11 +1,29 @@
+import argparse
+import asyncio
 import logging
 import sys
+from contextlib import ExitStack
+from typing import List, NoReturn, Optional, Union
 
-from business_information_scraper.maps_api_client import GoogleMapsClient
-from business_information_scraper.storage import get_storage_strategy
-from business_information_scraper.processor import BusinessDataProcessor
-from config import settings
-from business_information_scraper.exceptions import ApiClientError, DataProcessingError
+from src.business_information_scraper.async_client import AsyncPlacesClient
+from src.business_information_scraper.batch import BatchRunner, load_manifest
+from src.business_information_scraper.data_models import BatchReport, CoveragePlan, SearchJob
+from src.business_information_scraper.cache import ResponseCache
+from src.business_information_scraper.checkpoint import CheckpointJournal
+from src.business_information_scraper.coverage import plan_coverage
+from src.business_information_scraper.dedup import PlaceIndex
+from src.business_information_scraper.enrichment import AsyncDetailsEnricher, DetailsEnricher
+from src.business_information_scraper.maps_api_client import GoogleMapsClient
+from src.business_information_scraper.metrics import MetricsRegistry
+from src.business_information_scraper.storage import DataStorage, get_storage_strategy
+from src.business_information_scraper.writer import BackgroundStorageWriter
+from src.business_information_scraper.processor import BusinessDataProcessor
+from src.business_information_scraper.profiling import StageProfiler
+from src.business_information_scraper.rate_limiter import RateLimiter, RetryPolicy
+from src.business_information_scraper.spatial import SpatialIndex
+from src.business_information_scraper.work_queue import QueueWorker, WorkQueue, split_jobs
+from src.config import settings
+from src.business_information_scraper.exceptions import ApiClientError, ConfigurationError, DataProcessingError
 
 logging.basicConfig(
     level=settings.log_level.upper(),
@@ -17,47 +35,450 @@ logging.getLogger("googlemaps").setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def run():
-    logger.info("Starting Business Locator application.")
-    logger.info(f"Configuration loaded: Search Location=({settings.search_latitude}, {settings.search_longitude}), Radius={settings.search_radius_meters}m, Type={settings.target_business_type}, Storage={settings.output_storage_type}")
+def run_batch(processor: BusinessDataProcessor, manifest_path: str) -> bool:
+    """Runs every job in the manifest and returns whether all of them succeeded."""
+    jobs = load_manifest(
+        manifest_path,
+        default_radius=settings.search_radius_meters,
+        default_business_type=settings.target_business_type,
+    )
+    return run_jobs(processor, jobs)
 
+
+def run_jobs(processor: BusinessDataProcessor, jobs: List[SearchJob]) -> bool:
+    """Runs the jobs on a thread pool and returns whether all of them succeeded."""
+    report = BatchRunner(processor, max_workers=settings.batch_max_workers).run(jobs)
+    write_batch_report(report)
+    return report.failed == 0
+
+
+def plan_area(area: str, api_client: Optional[GoogleMapsClient] = None) -> CoveragePlan:
+    """Geocodes the area and logs its coverage plan; a client is created for it when none is given."""
+    cache = None
     try:
-        # 1. Initialize API Client
-        api_client = GoogleMapsClient(
+        if api_client is None:
+            if settings.cache_path:
+                cache = ResponseCache(
+                    settings.cache_path,
+                    ttl_seconds=settings.cache_ttl_seconds,
+                    max_entries=settings.cache_max_entries,
+                    bypass=settings.cache_bypass,
+                )
+            api_client = GoogleMapsClient(
+                api_key=settings.google_api_key,
+                timeout=settings.api_timeout_seconds,
+                cache=cache,
+                base_url=settings.api_base_url,
+            )
+        plan = plan_coverage(api_client, area, settings.coverage_radius_meters, settings.target_business_type)
+    finally:
+        if cache is not None:
+            cache.close()
+    geocoding = f"{plan.geocode_calls} geocoding call" if plan.geocode_calls else "geocoding answered from cache"
+    logger.info(
+        f"Coverage plan for {plan.area}: {len(plan.circles)} circles of {plan.radius_meters}m over "
+        f"({plan.south:.5f}, {plan.west:.5f}) to ({plan.north:.5f}, {plan.east:.5f}); expect "
+        f"{plan.min_nearby_calls}-{plan.max_nearby_calls} Nearby Search calls (at most ${plan.max_cost_usd:.2f}), "
+        f"{geocoding}."
+    )
+    if settings.min_tile_radius_meters:
+        logger.info("Adaptive tiling adds calls for every circle that hits the 60-result cap.")
+    if settings.enrich_details:
+        logger.info("Place Details adds one call per new place on top.")
+    return plan
+
+
+def write_batch_report(report: BatchReport) -> None:
+    if settings.batch_report_path:
+        with open(settings.batch_report_path, 'w', encoding='utf-8') as f:
+            f.write(report.model_dump_json(indent=2))
+        logger.info(f"Batch report written to {settings.batch_report_path}")
+
+
+def open_work_queue() -> WorkQueue:
+    if not settings.work_queue_path:
+        raise ConfigurationError("--enqueue and --worker require WORK_QUEUE_PATH to be set")
+    return WorkQueue(
+        settings.work_queue_path,
+        lease_seconds=settings.work_queue_lease_seconds,
+        max_attempts=settings.work_queue_max_attempts,
+    )
+
+
+def enqueue_jobs(manifest_path: Optional[str], area: Optional[str]) -> int:
+    """Adds the manifest jobs, the area's coverage plan or the single configured search to the work queue."""
+    if area:
+        jobs = plan_area(area).jobs()
+    elif manifest_path:
+        jobs = load_manifest(
+            manifest_path,
+            default_radius=settings.search_radius_meters,
+            default_business_type=settings.target_business_type,
+        )
+    elif settings.search_latitude is None or settings.search_longitude is None:
+        raise ConfigurationError("SEARCH_LATITUDE and SEARCH_LONGITUDE are required without a batch manifest")
+    else:
+        jobs = [SearchJob(
+            latitude=settings.search_latitude,
+            longitude=settings.search_longitude,
+            radius_meters=settings.search_radius_meters,
+            business_type=settings.target_business_type,
+        )]
+    if settings.work_queue_tile_radius_meters:
+        jobs = split_jobs(jobs, settings.work_queue_tile_radius_meters)
+    queue = open_work_queue()
+    try:
+        return queue.enqueue(jobs)
+    finally:
+        queue.close()
+
+
+def run_worker(processor: BusinessDataProcessor) -> bool:
+    """Works on the shared queue until it is drained and returns whether this worker's jobs all succeeded."""
+    queue = open_work_queue()
+    try:
+        report = QueueWorker(queue, processor, max_workers=settings.batch_max_workers).run()
+        # Every worker sees the queue drained at the end, so any of them can report on all of it.
+        write_batch_report(BatchReport(results=queue.results(), duration_seconds=report.duration_seconds))
+    finally:
+        queue.close()
+    return report.failed == 0
+
+
+def write_metrics(metrics: MetricsRegistry) -> None:
+    """Writes the configured run report and Prometheus file, and stops the metrics endpoint."""
+    report = metrics.report()['derived']
+    logger.info(
+        f"Run metrics: {report['api_requests']:.0f} API requests, estimated cost ${report['estimated_cost_usd']:.2f}, "
+        f"saturation rate {report['saturation_rate']:.1%}, slowest stage: {report['slowest_stage']}."
+    )
+    try:
+        if settings.metrics_report_path:
+            metrics.write_report(settings.metrics_report_path)
+        if settings.metrics_prometheus_path:
+            metrics.write_prometheus(settings.metrics_prometheus_path)
+    except OSError as e:
+        logger.error(f"Could not write run metrics: {e}")
+    finally:
+        metrics.close()
+
+
+async def run_location_async(
+        processor: BusinessDataProcessor, api_client: AsyncPlacesClient, latitude: float, longitude: float
+) -> None:
+    """Runs the single configured search on the async client, closing its connection pool afterwards."""
+    async with api_client:
+        await processor.process_location_async(
+            latitude=latitude,
+            longitude=longitude,
+            radius=settings.search_radius_meters,
+            business_type=settings.target_business_type
+        )
+
+
+def raise_logged(error: Exception) -> NoReturn:
+    """Logs an error that ends the run and re-raises it as the application error the caller expects."""
+    if isinstance(error, ApiClientError):
+        logger.critical(f"API Client critical error: {error}", exc_info=True)
+        raise ApiClientError from error
+    if isinstance(error, (DataProcessingError, ConfigurationError, ValueError, NotImplementedError)):
+        logger.critical(f"Configuration or Processing error: {error}", exc_info=True)
+        raise DataProcessingError from error
+    logger.critical(f"An unexpected critical error occurred: {error}", exc_info=True)
+    raise error
+
+
+def run_plan(area: Optional[str]) -> bool:
+    """Reports the coverage plan of the area without running any search."""
+    if not area:
+        raise ConfigurationError("--plan-only requires --city or COVERAGE_AREA")
+    plan_area(area)
+    return True
+
+
+def run_enqueue(manifest_path: Optional[str], area: Optional[str]) -> bool:
+    """Adds this run's jobs to the shared work queue for --worker processes to pick up."""
+    added = enqueue_jobs(manifest_path, area)
+    logger.info(f"{added} new jobs queued in {settings.work_queue_path}; start workers with --worker.")
+    return True
+
+
+def log_configuration(manifest_path: Optional[str], worker: bool, area: Optional[str]) -> None:
+    if worker:
+        details = f"Work queue={settings.work_queue_path}, Workers={settings.batch_max_workers}"
+    elif area:
+        details = (
+            f"Coverage area={area}, Circle radius={settings.coverage_radius_meters}m, "
+            f"Type={settings.target_business_type}, Workers={settings.batch_max_workers}"
+        )
+    elif manifest_path:
+        details = f"Batch manifest={manifest_path}, Workers={settings.batch_max_workers}"
+    else:
+        details = (
+            f"Search Location=({settings.search_latitude}, {settings.search_longitude}), "
+            f"Radius={settings.search_radius_meters}m, Type={settings.target_business_type}"
+        )
+    logger.info(f"Configuration loaded: {details}, Storage={settings.output_storage_type}")
+
+
+def check_settings(resume: bool, manifest_path: Optional[str], worker: bool, area: Optional[str]) -> None:
+    """Rejects setting combinations the run cannot honour, before any file or connection is opened."""
+    if resume and not settings.checkpoint_path:
+        raise ConfigurationError("--resume requires CHECKPOINT_PATH to be set")
+    if resume and settings.output_storage_type.lower() == 'parquet':
+        raise ConfigurationError("Parquet output is rewritten on every run and cannot be resumed")
+    if settings.async_http and (
+            manifest_path or area or worker or settings.min_tile_radius_meters or settings.checkpoint_path
+    ):
+        raise ConfigurationError("ASYNC_HTTP supports single searches without adaptive tiling or checkpointing")
+    if settings.refresh_stale_after_seconds and not settings.dedup_index_path:
+        raise ConfigurationError("REFRESH_STALE_AFTER_SECONDS requires DEDUP_INDEX_PATH to be set")
+    if settings.refresh_stale_after_seconds and settings.output_storage_type.lower() != 'sqlite':
+        raise ConfigurationError(
+            "REFRESH_STALE_AFTER_SECONDS requires OUTPUT_STORAGE_TYPE=sqlite: refreshed places are updated in "
+            "place, which CSV (append-only) and Parquet (rewritten every run) cannot do"
+        )
+
+
+def open_api_client(
+        cache: Optional[ResponseCache], metrics: MetricsRegistry
+) -> Union[GoogleMapsClient, AsyncPlacesClient]:
+    rate_limiter = RateLimiter(max_qps=settings.api_max_qps, daily_budget=settings.api_daily_budget)
+    retry_policy = RetryPolicy(max_retries=settings.api_max_retries)
+    if settings.async_http:
+        return AsyncPlacesClient(
             api_key=settings.google_api_key,
-            timeout=settings.api_timeout_seconds
+            timeout=settings.api_timeout_seconds,
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            max_concurrent_queries=settings.max_concurrent_queries,
+            token_activation_delay=settings.page_token_delay_seconds,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            base_url=settings.api_base_url,
+            metrics=metrics,
         )
+    return GoogleMapsClient(
+        api_key=settings.google_api_key,
+        timeout=settings.api_timeout_seconds,
+        max_concurrent_queries=settings.max_concurrent_queries,
+        token_activation_delay=settings.page_token_delay_seconds,
+        cache=cache,
+        rate_limiter=rate_limiter,
+        retry_policy=retry_policy,
+        base_url=settings.api_base_url,
+        metrics=metrics,
+    )
 
-        # 2. Initialize Storage Strategy
-        storage = get_storage_strategy(
-            storage_type=settings.output_storage_type,
-            file_path=settings.output_file_path, # Pass relevant config
+
+def open_storage(metrics: MetricsRegistry) -> DataStorage:
+    """Returns the configured storage, behind the background writer when enabled; the caller sets it up."""
+    storage = get_storage_strategy(
+        storage_type=settings.output_storage_type,
+        file_path=settings.output_file_path, # Pass relevant config
+        row_group_size=settings.parquet_row_group_size,
+        compression=settings.parquet_compression,
+    )
+    if settings.background_writer:
+        storage = BackgroundStorageWriter(
+            storage,
+            max_pending_batches=settings.writer_queue_batches,
+            max_retries=settings.writer_max_retries,
+            dead_letter_path=settings.dead_letter_path,
+            metrics=metrics,
         )
-        storage.setup()
+    return storage
 
-        # 3. Initialize Processor
-        processor = BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=settings.batch_size)
 
-        # 4. Execute the main logic
+def open_enricher(
+        api_client: Union[GoogleMapsClient, AsyncPlacesClient]
+) -> Optional[Union[DetailsEnricher, AsyncDetailsEnricher]]:
+    if not settings.enrich_details:
+        return None
+    if isinstance(api_client, AsyncPlacesClient):
+        return AsyncDetailsEnricher(api_client, max_concurrency=settings.details_max_workers)
+    return DetailsEnricher(api_client, max_workers=settings.details_max_workers)
+
+
+def run_search(processor: BusinessDataProcessor, api_client: Union[GoogleMapsClient, AsyncPlacesClient]) -> bool:
+    """Runs the single search configured in settings."""
+    if settings.search_latitude is None or settings.search_longitude is None:
+        raise ConfigurationError("SEARCH_LATITUDE and SEARCH_LONGITUDE are required without a batch manifest")
+    if isinstance(api_client, AsyncPlacesClient):
+        asyncio.run(run_location_async(processor, api_client, settings.search_latitude, settings.search_longitude))
+    else:
         processor.process_location(
             latitude=settings.search_latitude,
             longitude=settings.search_longitude,
             radius=settings.search_radius_meters,
             business_type=settings.target_business_type
         )
+    return True
+
+
+def run_mode(
+        processor: BusinessDataProcessor,
+        api_client: Union[GoogleMapsClient, AsyncPlacesClient],
+        manifest_path: Optional[str],
+        worker: bool,
+        area: Optional[str],
+) -> bool:
+    """Runs the queue worker, the area's coverage plan, the manifest or the single search."""
+    if worker:
+        return run_worker(processor)
+    # check_settings limits the async client to single searches.
+    if area and isinstance(api_client, GoogleMapsClient):
+        return run_jobs(processor, plan_area(area, api_client).jobs())
+    if manifest_path:
+        return run_batch(processor, manifest_path)
+    return run_search(processor, api_client)
+
+
+def write_profile(profiler: StageProfiler, profile_dir: str) -> None:
+    profiler.stop()
+    profiler.write(profile_dir)
+
+
+def run_pipeline(
+        manifest_path: Optional[str], resume: bool, profile_dir: Optional[str], worker: bool, area: Optional[str]
+) -> bool:
+    """Opens the client, storage and indexes, runs the selected mode and closes everything again.
 
+    Cleanup runs through an ExitStack in reverse order of opening, so a close()
+    that fails does not skip the others, the metrics files or the profile.
+    """
+    metrics = MetricsRegistry()
+    with ExitStack() as cleanup:
+        profiler = None
+        if profile_dir:
+            profiler = StageProfiler(interval=settings.profile_interval_seconds).start()
+            cleanup.callback(write_profile, profiler, profile_dir)
+        cleanup.callback(write_metrics, metrics)
+        if settings.metrics_port:
+            metrics.serve(settings.metrics_port)
+        check_settings(resume, manifest_path, worker, area)
+
+        checkpoint = None
+        if settings.checkpoint_path:
+            checkpoint = CheckpointJournal(
+                settings.checkpoint_path, resume=resume, token_ttl_seconds=settings.checkpoint_token_ttl_seconds
+            )
+            cleanup.callback(checkpoint.close)
+
+        # 1. Initialize API Client
+        cache = None
+        if settings.cache_path:
+            cache = ResponseCache(
+                settings.cache_path,
+                ttl_seconds=settings.cache_ttl_seconds,
+                max_entries=settings.cache_max_entries,
+                bypass=settings.cache_bypass,
+            )
+            cleanup.callback(cache.close)
+        api_client = open_api_client(cache, metrics)
+
+        # 2. Initialize Storage Strategy
+        storage = open_storage(metrics)
+        cleanup.callback(storage.close)
+        storage.setup()
+
+        # 3. Initialize Processor
+        place_index = None
+        if settings.dedup_index_path:
+            place_index = PlaceIndex(
+                settings.dedup_index_path,
+                expected_places=settings.dedup_expected_places,
+                error_rate=settings.dedup_error_rate,
+                stale_after_seconds=settings.refresh_stale_after_seconds,
+            )
+            cleanup.callback(place_index.close)
+        spatial_index = None
+        if settings.spatial_index_path:
+            spatial_index = SpatialIndex(settings.spatial_index_path)
+            cleanup.callback(spatial_index.close)
+        enricher = open_enricher(api_client)
+        if enricher is not None:
+            cleanup.callback(enricher.close)
+        processor = BusinessDataProcessor(
+            api_client=api_client,
+            storage=storage,
+            batch_size=settings.batch_size,
+            min_tile_radius=settings.min_tile_radius_meters,
+            enricher=enricher,
+            checkpoint=checkpoint,
+            metrics=metrics,
+            profiler=profiler,
+            geo_filter=settings.geo_filter,
+            place_index=place_index,
+            spatial_index=spatial_index,
+        )
+
+        # 4. Execute the main logic
+        succeeded = run_mode(processor, api_client, manifest_path, worker, area)
         logger.info("Business Locator application finished successfully.")
+        return succeeded
+
+
+def run(
+        manifest_path: Optional[str] = None,
+        resume: bool = False,
+        profile_dir: Optional[str] = None,
+        enqueue: bool = False,
+        worker: bool = False,
+        area: Optional[str] = None,
+        plan_only: bool = False,
+) -> bool:
+    """Runs a single search from settings, or every job of a batch manifest.
 
-    except ApiClientError as e:
-         logger.critical(f"API Client critical error: {e}", exc_info=True)
-         raise ApiClientError from e
-    except (DataProcessingError, ValueError, NotImplementedError) as e:
-        logger.critical(f"Configuration or Processing error: {e}", exc_info=True)
-        raise DataProcessingError from e
+    With ``enqueue``, the jobs are only added to the shared work queue; with
+    ``worker``, jobs are taken from that queue until it is drained.
+    With ``area``, a city or region is geocoded and covered with search circles
+    that run as batch jobs; ``plan_only`` stops after reporting the plan.
+
+    With ``resume``, work recorded as done in the checkpoint journal is skipped.
+    With ``profile_dir``, the run is sampled and a collapsed-stack file plus a
+    per-stage wall/CPU breakdown are written there.
+    Returns False if any batch job failed.
+    """
+    manifest_path = manifest_path or settings.batch_manifest_path
+    area = area or settings.coverage_area
+    try:
+        if area and manifest_path:
+            raise ConfigurationError("A coverage area and a batch manifest cannot be combined")
+        if plan_only:
+            return run_plan(area)
+        if enqueue:
+            return run_enqueue(manifest_path, area)
+        logger.info("Starting Business Locator application.")
+        log_configuration(manifest_path, worker, area)
+        return run_pipeline(manifest_path, resume, profile_dir, worker, area)
     except Exception as e:
-        logger.critical(f"An unexpected critical error occurred: {e}", exc_info=True)
-        raise e
+        raise_logged(e)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Collect business data for an area from Google Places.")
+    parser.add_argument('--manifest', help="Batch manifest (CSV/JSON/TOML) listing many search jobs")
+    parser.add_argument('--resume', action='store_true', help="Continue an interrupted run from CHECKPOINT_PATH")
+    parser.add_argument(
+        '--profile', nargs='?', const='profile', metavar='DIR',
+        help="Sample the run and write flamegraph stacks and a per-stage time breakdown to DIR (default: profile)",
+    )
+    parser.add_argument('--city', help="City or region to geocode and cover with search circles (COVERAGE_AREA)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--enqueue', action='store_true', help="Add the jobs to WORK_QUEUE_PATH instead of running them")
+    mode.add_argument('--worker', action='store_true', help="Run jobs from WORK_QUEUE_PATH until it is drained")
+    mode.add_argument(
+        '--plan-only', action='store_true',
+        help="Report the coverage plan of --city and its expected API calls, then stop",
+    )
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    run()
+    args = parse_args()
+    sys.exit(0 if run(
+        manifest_path=args.manifest, resume=args.resume, profile_dir=args.profile,
+        enqueue=args.enqueue, worker=args.worker, area=args.city, plan_only=args.plan_only,
+    ) else 1)
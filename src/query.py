@@ -0,0 +1,104 @@
+"""Query businesses collected earlier from the local spatial index, without API requests.
+
+    python -m src.query --index businesses_geo.sqlite radius 4.6748 -74.0474 500 --type cafe
+    python -m src.query --index businesses_geo.sqlite box 4.66 -74.06 4.68 -74.04
+    python -m src.query --index businesses_geo.sqlite nearest 4.6748 -74.0474 5 --type bar
+    python -m src.query --index businesses_geo.sqlite import-sqlite businesses.db
+
+Matches are printed as JSON lines. The index is filled while scraping when
+SPATIAL_INDEX_PATH is set, or from an existing SQLite output with import-sqlite.
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from typing import List, Optional
+
+from src.business_information_scraper.data_models import BusinessRecord
+from src.business_information_scraper.spatial import SpatialIndex
+from src.business_information_scraper.transform import intern_types
+
+# Rows read per batch by import-sqlite.
+IMPORT_BATCH_SIZE = 10_000
+
+
+def import_sqlite(index: SpatialIndex, path: str) -> int:
+    """Indexes every business with coordinates from a SqliteStorage output file."""
+    indexed = 0
+    with sqlite3.connect(path) as conn:
+        cursor = conn.execute(
+            "SELECT place_id, name, address, phone_number, types, latitude, longitude FROM businesses "
+            "WHERE latitude IS NOT NULL AND longitude IS NOT NULL"
+        )
+        while True:
+            rows = cursor.fetchmany(IMPORT_BATCH_SIZE)
+            if not rows:
+                return indexed
+            indexed += index.add(
+                BusinessRecord(place_id, name, address, phone, intern_types(json.loads(types)), latitude, longitude)
+                for place_id, name, address, phone, types, latitude, longitude in rows
+            )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--index', default=os.environ.get('SPATIAL_INDEX_PATH'),
+        help="Spatial index file (default: $SPATIAL_INDEX_PATH)",
+    )
+    filters = argparse.ArgumentParser(add_help=False)
+    filters.add_argument('--type', action='append', default=[], dest='types', help="Only businesses of this type (repeatable)")
+    filters.add_argument('--limit', type=int, help="Print at most this many matches")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    radius = commands.add_parser('radius', parents=[filters], help="Businesses within a radius, nearest first")
+    radius.add_argument('latitude', type=float)
+    radius.add_argument('longitude', type=float)
+    radius.add_argument('meters', type=float)
+
+    box = commands.add_parser('box', parents=[filters], help="Businesses inside a bounding box")
+    for name in ('south', 'west', 'north', 'east'):
+        box.add_argument(name, type=float)
+
+    nearest = commands.add_parser('nearest', parents=[filters], help="The k nearest businesses")
+    nearest.add_argument('latitude', type=float)
+    nearest.add_argument('longitude', type=float)
+    nearest.add_argument('k', type=int)
+
+    load = commands.add_parser('import-sqlite', help="Index the businesses of a SQLite output file")
+    load.add_argument('path')
+
+    args = parser.parse_args(argv)
+    if not args.index:
+        parser.error("--index or SPATIAL_INDEX_PATH is required")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    index = SpatialIndex(args.index)
+    try:
+        started = time.perf_counter()
+        if args.command == 'import-sqlite':
+            indexed = import_sqlite(index, args.path)
+            print(f"Indexed {indexed} businesses from {args.path}", file=sys.stderr)
+            return
+        if args.command == 'radius':
+            matches = index.within_radius(args.latitude, args.longitude, args.meters, args.types, args.limit)
+        elif args.command == 'box':
+            matches = index.within_box(args.south, args.west, args.north, args.east, args.types, args.limit)
+        else:
+            matches = index.nearest(args.latitude, args.longitude, args.k, args.types)
+            matches = matches[:args.limit] if args.limit else matches
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        for match in matches:
+            print(json.dumps(match.to_json_dict(), ensure_ascii=False))
+        print(f"{len(matches)} matches in {elapsed_ms:.2f} ms", file=sys.stderr)
+    finally:
+        index.close()
+
+
+if __name__ == '__main__':
+    main()
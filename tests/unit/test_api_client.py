@@ -2,8 +2,13 @@ import pytest
 from unittest.mock import call
 from googlemaps.exceptions import ApiError, Timeout, TransportError, HTTPError
 
-from src.business_information_scraper.maps_api_client import GoogleMapsClient
-from src.business_information_scraper.exceptions import ApiClientError
+from benchmarks.fake_places import FakePlacesServer
+from src.business_information_scraper.cache import ResponseCache
+from src.business_information_scraper.checkpoint import CheckpointJournal
+from src.business_information_scraper.data_models import NearbyQuery, TilingSummary
+from src.business_information_scraper.maps_api_client import DETAILS_FIELDS, GoogleMapsClient
+from src.business_information_scraper.exceptions import ApiClientError, QuotaExceededError
+from src.business_information_scraper.rate_limiter import RateLimiter, RetryPolicy
 
 @pytest.fixture
 def mock_google_client(mocker):
@@ -18,7 +23,9 @@ def test_Maps_client_init_success(mocker):
     mock_client_constructor = mocker.patch('googlemaps.Client')
     api_client = GoogleMapsClient(api_key="fake_key", timeout=5)
     assert api_client.client is not None
-    mock_client_constructor.assert_called_once_with(key="fake_key", timeout=5)
+    mock_client_constructor.assert_called_once_with(
+        key="fake_key", timeout=5, retry_over_query_limit=False, base_url="https://maps.googleapis.com"
+    )
 
 def test_Maps_client_init_failure(mocker):
     """Test failure during initialization."""
@@ -41,17 +48,15 @@ def test_find_nearby_businesses_single_page(mock_google_client, sample_nearby_re
         location=(1.0, 2.0), radius=100, type='test'
     )
 
-def test_find_nearby_businesses_multiple_pages(mock_google_client, mocker, sample_nearby_result_page_1, sample_nearby_result_page_2):
+def test_find_nearby_businesses_multiple_pages(mock_google_client, sample_nearby_result_page_1, sample_nearby_result_page_2):
     """Test nearby search handling pagination."""
-    mock_sleep = mocker.patch('time.sleep') # Mock time.sleep
-
     # Configure mock responses for pagination
     mock_google_client.places_nearby.side_effect = [
         sample_nearby_result_page_1,
         sample_nearby_result_page_2
     ]
 
-    client = GoogleMapsClient(api_key="fake_key")
+    client = GoogleMapsClient(api_key="fake_key", token_activation_delay=0.01)
     results = client.find_nearby_businesses(latitude=1.0, longitude=2.0, radius=100, business_type='test')
 
     # Check combined results
@@ -64,9 +69,22 @@ def test_find_nearby_businesses_multiple_pages(mock_google_client, mocker, sampl
         call(page_token=sample_nearby_result_page_1['next_page_token'])
     ]
     assert mock_google_client.places_nearby.call_args_list == expected_calls
+    assert client.api_calls == 2
 
-    # Check that sleep was called between page requests
-    mock_sleep.assert_called_once_with(2) # Check sleep duration
+def test_find_nearby_businesses_retries_inactive_page_token(mock_google_client, sample_nearby_result_page_1, sample_nearby_result_page_2):
+    """A page token rejected as INVALID_REQUEST is retried until Google activates it."""
+    mock_google_client.places_nearby.side_effect = [
+        sample_nearby_result_page_1,
+        ApiError("INVALID_REQUEST"),
+        sample_nearby_result_page_2
+    ]
+
+    client = GoogleMapsClient(api_key="fake_key", token_activation_delay=0.01)
+    client.scheduler.token_retry_interval = 0.01
+    results = client.find_nearby_businesses(latitude=1.0, longitude=2.0, radius=100, business_type='test')
+
+    assert [r['place_id'] for r in results] == ['PLACE_A', 'PLACE_B', 'PLACE_C']
+    assert mock_google_client.places_nearby.call_count == 3
 
 @pytest.mark.parametrize(
     "api_exception",
@@ -92,3 +110,212 @@ def test_find_nearby_businesses_unexpected_error(mock_google_client):
     client = GoogleMapsClient(api_key="fake_key")
     with pytest.raises(ApiClientError, match="Unexpected error during Nearby Search"):
          client.find_nearby_businesses(latitude=1.0, longitude=2.0, radius=100, business_type='test')
+
+def _nearby_by_radius(saturated_above: int):
+    """Builds a places_nearby side effect that saturates circles larger than the given radius."""
+    counter = {'n': 0}
+
+    def side_effect(location=None, radius=None, type=None, page_token=None):
+        if page_token:
+            return {'results': [], 'status': 'OK'}
+        counter['n'] += 1
+        size = 60 if radius > saturated_above else 5
+        results = [{'place_id': f"P{counter['n']}_{i}", 'name': 'x'} for i in range(size)]
+        # Every tile also returns a shared place to exercise deduplication.
+        results.append({'place_id': 'SHARED', 'name': 'shared'})
+        return {'results': results, 'status': 'OK'}
+    return side_effect
+
+def test_find_nearby_businesses_adaptive_splits_saturated_tiles(mock_google_client):
+    """Saturated circles are split once; unsaturated children are not split further."""
+    mock_google_client.places_nearby.side_effect = _nearby_by_radius(saturated_above=800)
+
+    client = GoogleMapsClient(api_key="fake_key")
+    results, summary = client.find_nearby_businesses_adaptive(
+        latitude=1.0, longitude=2.0, radius=1000, business_type='test', min_radius=100
+    )
+
+    assert summary.tiles_searched == 5
+    assert summary.saturated_tiles == 1
+    assert summary.truncated_tiles == 0
+    assert summary.max_depth == 1
+    assert summary.api_calls == 5
+    assert summary.coverage_ratio == 1.0
+    assert len(results) == 60 + 4 * 5 + 1
+    assert summary.unique_places == len(results)
+
+def test_find_nearby_businesses_adaptive_stops_at_min_radius(mock_google_client):
+    """Tiles that would split below min_radius are reported as truncated."""
+    mock_google_client.places_nearby.side_effect = _nearby_by_radius(saturated_above=0)
+
+    client = GoogleMapsClient(api_key="fake_key")
+    _, summary = client.find_nearby_businesses_adaptive(
+        latitude=1.0, longitude=2.0, radius=1000, business_type='test', min_radius=600
+    )
+
+    assert summary.tiles_searched == 5
+    assert summary.truncated_tiles == 4
+    assert summary.coverage_ratio == 0.0
+
+def test_find_nearby_businesses_uses_response_cache(mock_google_client, tmp_path, sample_nearby_result_page_1, sample_nearby_result_page_2):
+    """A repeated search is answered from the cache without calling the API."""
+    mock_google_client.places_nearby.side_effect = [sample_nearby_result_page_1, sample_nearby_result_page_2]
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'))
+
+    client = GoogleMapsClient(api_key="fake_key", token_activation_delay=0.01, cache=cache)
+    first = client.find_nearby_businesses(latitude=1.0, longitude=2.0, radius=100, business_type='test')
+    second = client.find_nearby_businesses(latitude=1.0, longitude=2.0, radius=100, business_type='test')
+
+    assert first == second
+    assert mock_google_client.places_nearby.call_count == 2
+    assert cache.hits == 1
+
+def test_get_place_details_requests_only_needed_fields(mock_google_client):
+    mock_google_client.place.return_value = {'result': {'place_id': 'PLACE_A', 'formatted_address': 'Street 1'}, 'status': 'OK'}
+
+    client = GoogleMapsClient(api_key="fake_key")
+    details = client.get_place_details('PLACE_A')
+
+    assert details == {'place_id': 'PLACE_A', 'formatted_address': 'Street 1'}
+    mock_google_client.place.assert_called_once_with(place_id='PLACE_A', fields=DETAILS_FIELDS)
+
+def test_get_place_details_api_error(mock_google_client):
+    mock_google_client.place.side_effect = ApiError("NOT_FOUND")
+
+    client = GoogleMapsClient(api_key="fake_key")
+    with pytest.raises(ApiClientError, match="API error during Place Details"):
+        client.get_place_details('PLACE_A')
+
+def test_iter_nearby_pages_resumes_from_checkpoint(mock_google_client, tmp_path, sample_nearby_result_page_2):
+    """Completed queries are skipped; interrupted ones continue from their stored token."""
+    done = NearbyQuery(latitude=1.0, longitude=2.0, radius=100, business_type='done')
+    interrupted = NearbyQuery(latitude=1.0, longitude=2.0, radius=100, business_type='test')
+    journal = CheckpointJournal(str(tmp_path / 'run.journal'))
+    journal.record_stored([
+        CheckpointJournal.query_done_event(done),
+        CheckpointJournal.page_event(interrupted, 0, 'TOKEN_FOR_PAGE_2'),
+    ], rows=40)
+    mock_google_client.places_nearby.return_value = sample_nearby_result_page_2
+
+    client = GoogleMapsClient(api_key="fake_key")
+    assert list(client.iter_nearby_pages(1.0, 2.0, 100, 'done', checkpoint=journal)) == []
+    pages = list(client.iter_nearby_pages(1.0, 2.0, 100, 'test', checkpoint=journal))
+
+    mock_google_client.places_nearby.assert_called_once_with(page_token='TOKEN_FOR_PAGE_2')
+    assert [(p.page_index, p.is_last) for p in pages] == [(1, True)]
+
+def test_adaptive_search_splits_completed_saturated_tile_without_refetching(mock_google_client, tmp_path):
+    mock_google_client.places_nearby.side_effect = _nearby_by_radius(saturated_above=800)
+    root = NearbyQuery(latitude=1.0, longitude=2.0, radius=1000, business_type='test')
+    journal = CheckpointJournal(str(tmp_path / 'run.journal'))
+    journal.record_tile(root, saturated=True)
+    journal.record_stored([CheckpointJournal.query_done_event(root)], rows=61)
+
+    client = GoogleMapsClient(api_key="fake_key")
+    summary = TilingSummary()
+    list(client.iter_nearby_pages_adaptive(1.0, 2.0, 1000, 'test', min_radius=100, summary=summary, checkpoint=journal))
+
+    assert mock_google_client.places_nearby.call_count == 4
+    assert all(c.kwargs['radius'] < 1000 for c in mock_google_client.places_nearby.call_args_list)
+    assert summary.tiles_searched == 5
+
+def test_quota_errors_are_retried_and_slow_the_limiter(mock_google_client, mocker, sample_nearby_result_page_2):
+    mocker.patch('src.business_information_scraper.maps_api_client.time.sleep')
+    mock_google_client.places_nearby.side_effect = [ApiError("OVER_QUERY_LIMIT"), sample_nearby_result_page_2]
+    limiter = RateLimiter(max_qps=100)
+
+    client = GoogleMapsClient(api_key="fake_key", rate_limiter=limiter, retry_policy=RetryPolicy(max_retries=3))
+    results = client.find_nearby_businesses(latitude=1.0, longitude=2.0, radius=100, business_type='test')
+
+    assert results == sample_nearby_result_page_2['results']
+    assert client.api_calls == 2
+    assert limiter.throttle_events == 1
+
+def test_non_transient_errors_are_not_retried(mock_google_client):
+    mock_google_client.places_nearby.side_effect = ApiError("REQUEST_DENIED")
+
+    client = GoogleMapsClient(api_key="fake_key", retry_policy=RetryPolicy(max_retries=3))
+    with pytest.raises(ApiClientError, match="REQUEST_DENIED"):
+        client.find_nearby_businesses(latitude=1.0, longitude=2.0, radius=100, business_type='test')
+    assert mock_google_client.places_nearby.call_count == 1
+
+def test_exhausted_daily_budget_stops_requests(mock_google_client):
+    client = GoogleMapsClient(api_key="fake_key", rate_limiter=RateLimiter(max_qps=100, daily_budget=0))
+
+    with pytest.raises(QuotaExceededError):
+        client.find_nearby_businesses(latitude=1.0, longitude=2.0, radius=100, business_type='test')
+    mock_google_client.places_nearby.assert_not_called()
+
+def test_client_pages_through_fake_places_server_over_http():
+    """Runs the real googlemaps HTTP stack against the local fake server, including token activation."""
+    with FakePlacesServer(density=300, token_activation_delay=0.05) as server:
+        client = GoogleMapsClient(api_key="AIzaFakeKey", base_url=server.base_url, token_activation_delay=0.01)
+        client.scheduler.token_retry_interval = 0.01
+
+        results = client.find_nearby_businesses(4.67, -74.05, 1000, 'cafe')
+        details = client.get_place_details(results[0]['place_id'])
+
+    assert len(results) == 60
+    assert len({place['place_id'] for place in results}) == 60
+    assert server.requests['token_not_ready'] >= 1
+    assert details['place_id'] == results[0]['place_id']
+    assert details['formatted_address'] and details['international_phone_number']
+
+def test_call_records_latency_and_status_per_endpoint(mock_google_client):
+    mock_google_client.places_nearby.side_effect = [ApiError('OVER_QUERY_LIMIT'), {'results': [], 'status': 'OK'}]
+    client = GoogleMapsClient(api_key="fake_key", retry_policy=RetryPolicy(max_retries=1, base_delay=0))
+
+    client.find_nearby_businesses(1.0, 2.0, 100, 'cafe')
+
+    metrics = client.metrics
+    assert metrics.counter_value('api_requests_total', endpoint='nearby', status='ok') == 1
+    assert metrics.counter_value('api_requests_total', endpoint='nearby', status='OVER_QUERY_LIMIT') == 1
+    assert metrics.counter_value('api_retries_total', endpoint='nearby') == 1
+    assert metrics.histogram('api_request_seconds', endpoint='nearby').count == 2
+    assert metrics.counter_value('nearby_pages_total', source='api') == 1
+    assert metrics.counter_value('nearby_queries_total') == 1
+
+def test_geocode_is_cached(mock_google_client, tmp_path):
+    """An area is geocoded once; later plans read it from the response cache."""
+    result = {'formatted_address': 'Bogotá, Colombia', 'geometry': {'location': {'lat': 4.7, 'lng': -74.1}}}
+    mock_google_client.geocode.return_value = [result]
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'))
+
+    client = GoogleMapsClient(api_key="fake_key", cache=cache)
+    assert client.geocode("Bogotá,  Colombia") == result
+    assert client.geocode("bogotá, colombia") == result
+
+    mock_google_client.geocode.assert_called_once_with(address="Bogotá,  Colombia")
+    assert client.api_calls == 1
+    cache.close()
+
+def test_geocode_without_result(mock_google_client):
+    mock_google_client.geocode.return_value = []
+    client = GoogleMapsClient(api_key="fake_key")
+    with pytest.raises(ApiClientError, match="No geocoding result"):
+        client.geocode("Nowhere")
+
+def test_iter_nearby_pages_runs_one_query_per_type(mock_google_client):
+    mock_google_client.places_nearby.side_effect = lambda location, radius, type: {
+        'results': [{'place_id': f"{type}_1"}], 'status': 'OK'
+    }
+    client = GoogleMapsClient(api_key="fake_key")
+
+    pages = list(client.iter_nearby_pages(1.0, 2.0, 100, 'cafe, bar'))
+
+    assert sorted(page.query.business_type for page in pages) == ['bar', 'cafe']
+    assert sorted(page.results[0]['place_id'] for page in pages) == ['bar_1', 'cafe_1']
+    assert mock_google_client.places_nearby.call_count == 2
+
+def test_adaptive_search_reports_shared_places_for_each_type():
+    """A place found for one type is still yielded for another type's search of the same tile."""
+    with FakePlacesServer(density=5, token_activation_delay=0.01, shared_types=['cafe', 'bar']) as server:
+        client = GoogleMapsClient(api_key="AIzaFakeKey", base_url=server.base_url, token_activation_delay=0.01)
+        summary = TilingSummary()
+        pages = list(client.iter_nearby_pages_adaptive(4.67, -74.05, 1000, ['cafe', 'bar'], 500, summary))
+
+    found = {(page.query.business_type, place['place_id']) for page in pages for place in page.results}
+    by_type = {name: {place_id for type_name, place_id in found if type_name == name} for name in ('cafe', 'bar')}
+    assert by_type['cafe'] and by_type['bar']
+    assert by_type['cafe'] & by_type['bar']
+    assert summary.unique_places == len(by_type['cafe'] | by_type['bar'])
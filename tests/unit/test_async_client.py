@@ -0,0 +1,133 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.business_information_scraper.async_client import AsyncPlacesClient
+from src.business_information_scraper.data_models import NearbyQuery
+from src.business_information_scraper.exceptions import ApiClientError
+from src.business_information_scraper.rate_limiter import RateLimiter, RetryPolicy
+
+
+class StubPlacesServer:
+    """Serves canned Places API responses from a local thread; ``responses`` maps a path to a queue of (status, body)."""
+
+    def __init__(self):
+        self.responses = {}
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                stub.requests.append((url.path, {k: v[0] for k, v in parse_qs(url.query).items()}))
+                status, body = stub.responses[url.path].pop(0)
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+NEARBY = '/maps/api/place/nearbysearch/json'
+DETAILS = '/maps/api/place/details/json'
+
+
+@pytest.fixture
+def stub():
+    server = StubPlacesServer()
+    yield server
+    server.close()
+
+
+def _client(stub, **kwargs):
+    return AsyncPlacesClient('test-key', timeout=5, base_url=stub.base_url, token_activation_delay=0,
+                             token_retry_interval=0, **kwargs)
+
+
+def test_find_nearby_businesses_follows_page_tokens(stub):
+    stub.responses[NEARBY] = [
+        (200, {'status': 'OK', 'results': [{'place_id': 'A'}], 'next_page_token': 'T1'}),
+        (200, {'status': 'INVALID_REQUEST'}),  # token not active yet
+        (200, {'status': 'OK', 'results': [{'place_id': 'B'}]}),
+    ]
+
+    async def scenario():
+        async with _client(stub) as client:
+            return await client.find_nearby_businesses(1.5, 2.5, 300, 'cafe'), client.api_calls
+
+    results, api_calls = asyncio.run(scenario())
+
+    assert [place['place_id'] for place in results] == ['A', 'B']
+    assert api_calls == 3
+    first_params = stub.requests[0][1]
+    assert first_params == {'location': '1.5,2.5', 'radius': '300', 'type': 'cafe', 'key': 'test-key'}
+    assert stub.requests[1][1] == {'pagetoken': 'T1', 'key': 'test-key'}
+
+
+def test_get_place_details_requests_only_the_given_fields(stub):
+    stub.responses[DETAILS] = [(200, {'status': 'OK', 'result': {'place_id': 'A', 'name': 'Cafe'}})]
+
+    async def scenario():
+        async with _client(stub) as client:
+            return await client.get_place_details('A', fields=['place_id', 'name'])
+
+    assert asyncio.run(scenario()) == {'place_id': 'A', 'name': 'Cafe'}
+    assert stub.requests[0][1]['fields'] == 'place_id,name'
+
+
+def test_quota_errors_are_retried_and_slow_the_limiter(stub):
+    stub.responses[NEARBY] = [
+        (200, {'status': 'OVER_QUERY_LIMIT'}),
+        (200, {'status': 'OK', 'results': [{'place_id': 'A'}]}),
+    ]
+    limiter = RateLimiter(max_qps=1000)
+
+    async def scenario():
+        async with _client(stub, rate_limiter=limiter, retry_policy=RetryPolicy(max_retries=2, base_delay=0)) as client:
+            return await client.find_nearby_businesses(1.0, 2.0, 100, 'cafe')
+
+    assert [place['place_id'] for place in asyncio.run(scenario())] == ['A']
+    assert limiter.throttle_events == 1
+
+
+def test_http_errors_raise_api_client_error(stub):
+    stub.responses[NEARBY] = [(500, {})]
+
+    async def scenario():
+        async with _client(stub) as client:
+            await client.find_nearby_businesses(1.0, 2.0, 100, 'cafe')
+
+    with pytest.raises(ApiClientError, match="API error during Nearby Search"):
+        asyncio.run(scenario())
+
+
+def test_find_nearby_businesses_many_runs_queries_concurrently(stub):
+    stub.responses[NEARBY] = [(200, {'status': 'OK', 'results': [{'place_id': 'A'}]}) for _ in range(3)]
+    queries = [NearbyQuery(latitude=float(i), longitude=0.0, radius=100, business_type='cafe') for i in range(3)]
+
+    async def scenario():
+        async with _client(stub, max_concurrent_queries=2) as client:
+            return await client.find_nearby_businesses_many(queries)
+
+    results = asyncio.run(scenario())
+    assert set(results) == set(queries)
+    assert all(len(places) == 1 for places in results.values())
@@ -0,0 +1,83 @@
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from src.business_information_scraper.batch import BatchRunner, load_manifest
+from src.business_information_scraper.data_models import SearchJob
+from src.business_information_scraper.exceptions import ApiClientError, ConfigurationError
+
+# --- Test load_manifest ---
+
+def test_load_manifest_csv_applies_defaults(tmp_path):
+    manifest = tmp_path / 'jobs.csv'
+    manifest.write_text(
+        "latitude,longitude,radius_meters,business_type\n"
+        "4.67,-74.04,1000,cafe\n"
+        "4.60,-74.08,,\n",
+        encoding='utf-8'
+    )
+
+    jobs = load_manifest(str(manifest), default_radius=500, default_business_type='restaurant')
+
+    assert jobs == [
+        SearchJob(latitude=4.67, longitude=-74.04, radius_meters=1000, business_type='cafe'),
+        SearchJob(latitude=4.60, longitude=-74.08, radius_meters=500, business_type='restaurant'),
+    ]
+
+def test_load_manifest_json(tmp_path):
+    manifest = tmp_path / 'jobs.json'
+    manifest.write_text(json.dumps({'jobs': [{'latitude': 1, 'longitude': 2, 'name': 'north'}]}), encoding='utf-8')
+
+    jobs = load_manifest(str(manifest), default_radius=500, default_business_type='bar')
+
+    assert jobs[0].name == 'north'
+    assert jobs[0].business_type == 'bar'
+
+def test_load_manifest_toml(tmp_path):
+    pytest.importorskip('tomllib')
+    manifest = tmp_path / 'jobs.toml'
+    manifest.write_text('[[jobs]]\nlatitude = 1.0\nlongitude = 2.0\nbusiness_type = "bank"\n', encoding='utf-8')
+
+    jobs = load_manifest(str(manifest), default_radius=500, default_business_type='bar')
+
+    assert jobs[0].business_type == 'bank'
+
+def test_load_manifest_invalid_job(tmp_path):
+    manifest = tmp_path / 'jobs.json'
+    manifest.write_text(json.dumps([{'latitude': 1}]), encoding='utf-8')
+
+    with pytest.raises(ConfigurationError, match="Invalid job #1"):
+        load_manifest(str(manifest), default_radius=500, default_business_type='bar')
+
+def test_load_manifest_unsupported_format(tmp_path):
+    manifest = tmp_path / 'jobs.yaml'
+    manifest.write_text('', encoding='utf-8')
+
+    with pytest.raises(ConfigurationError, match="Unsupported manifest format"):
+        load_manifest(str(manifest), default_radius=500, default_business_type='bar')
+
+# --- Test BatchRunner ---
+
+def test_batch_runner_reports_each_job():
+    """A failing job is reported without stopping the others."""
+    processor = MagicMock()
+
+    def process_location(latitude, longitude, radius, business_type):
+        if business_type == 'broken':
+            raise ApiClientError from ApiClientError("OVER_QUERY_LIMIT")
+        return 7
+    processor.process_location.side_effect = process_location
+
+    jobs = [
+        SearchJob(latitude=1, longitude=2, radius_meters=100, business_type='cafe'),
+        SearchJob(latitude=1, longitude=2, radius_meters=100, business_type='broken'),
+        SearchJob(latitude=3, longitude=4, radius_meters=100, business_type='bar'),
+    ]
+    report = BatchRunner(processor, max_workers=2).run(jobs)
+
+    assert [r.job for r in report.results] == jobs
+    assert report.succeeded == 2
+    assert report.failed == 1
+    assert report.results[0].businesses_processed == 7
+    assert report.results[1].error == "ApiClientError: OVER_QUERY_LIMIT"
+    assert processor.process_location.call_count == 3
@@ -0,0 +1,64 @@
+import pytest
+
+from src.business_information_scraper.cache import ResponseCache
+from src.business_information_scraper.data_models import NearbyQuery
+
+QUERY = NearbyQuery(latitude=4.6748, longitude=-74.0474, radius=500, business_type='cafe')
+PAGES = [
+    {'results': [{'place_id': 'A'}], 'next_page_token': 'T1'},
+    {'results': [{'place_id': 'B'}]},
+]
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'), ttl_seconds=60, max_entries=10)
+    yield cache
+    cache.close()
+
+
+def test_nearby_pages_round_trip(cache):
+    assert cache.get_nearby_pages(QUERY) is None
+    cache.put_nearby_pages(QUERY, PAGES)
+
+    assert cache.get_nearby_pages(QUERY) == PAGES
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 0}
+
+def test_nearby_key_normalizes_location_and_type():
+    noisy = NearbyQuery(latitude=4.67480000001, longitude=-74.0474, radius=500, business_type=' Cafe ')
+    assert ResponseCache.nearby_key(noisy, 1) == ResponseCache.nearby_key(QUERY, 1)
+    assert ResponseCache.nearby_key(QUERY, 0) != ResponseCache.nearby_key(QUERY, 1)
+
+def test_incomplete_chain_is_a_miss(cache):
+    cache.put(ResponseCache.nearby_key(QUERY, 0), PAGES[0])
+    assert cache.get_nearby_pages(QUERY) is None
+
+def test_expired_entries_are_misses(cache, mocker):
+    cache.put_nearby_pages(QUERY, PAGES)
+    now = __import__('time').time()
+    mocker.patch('src.business_information_scraper.cache.time.time', return_value=now + 61)
+
+    assert cache.get_nearby_pages(QUERY) is None
+
+def test_least_recently_used_entries_are_evicted(tmp_path, mocker):
+    clock = mocker.patch('src.business_information_scraper.cache.time.time', return_value=1000.0)
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'), max_entries=2)
+    cache.put('a', {'v': 1})
+    clock.return_value = 1001.0
+    cache.put('b', {'v': 2})
+    clock.return_value = 1002.0
+    cache.get('a')  # 'a' is now more recently used than 'b'
+    clock.return_value = 1003.0
+    cache.put('c', {'v': 3})
+
+    assert cache.get('b') is None
+    assert cache.get('a') == {'v': 1}
+    assert cache.evictions == 1
+
+def test_bypass_skips_reads_but_refreshes(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    bypassed = ResponseCache(path, bypass=True)
+    bypassed.put_nearby_pages(QUERY, PAGES)
+    assert bypassed.get_nearby_pages(QUERY) is None
+    bypassed.close()
+
+    assert ResponseCache(path).get_nearby_pages(QUERY) == PAGES
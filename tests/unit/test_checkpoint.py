@@ -0,0 +1,53 @@
+import pytest
+
+from src.business_information_scraper.checkpoint import CheckpointJournal
+from src.business_information_scraper.data_models import NearbyQuery
+
+QUERY = NearbyQuery(latitude=1.0, longitude=2.0, radius=100, business_type='cafe')
+OTHER = NearbyQuery(latitude=1.0, longitude=2.0, radius=100, business_type='bar')
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / 'run.journal')
+
+
+def test_resume_restores_progress(journal_path):
+    journal = CheckpointJournal(journal_path)
+    journal.record_tile(QUERY, saturated=True)
+    journal.record_stored([CheckpointJournal.query_done_event(QUERY)], rows=60)
+    journal.record_stored([CheckpointJournal.page_event(OTHER, 0, 'TOKEN')], rows=20)
+    journal.close()
+
+    resumed = CheckpointJournal(journal_path, resume=True)
+    assert resumed.is_completed(QUERY)
+    assert resumed.tile_saturated(QUERY) is True
+    assert not resumed.is_completed(OTHER)
+    assert resumed.resume_point(OTHER) == (1, 'TOKEN')
+    assert resumed.rows_flushed == 80
+
+def test_fresh_journal_discards_previous_run(journal_path):
+    journal = CheckpointJournal(journal_path)
+    journal.record_stored([CheckpointJournal.query_done_event(QUERY)], rows=1)
+    journal.close()
+
+    assert not CheckpointJournal(journal_path).is_completed(QUERY)
+
+def test_expired_page_tokens_are_not_resumed(journal_path, mocker):
+    journal = CheckpointJournal(journal_path, token_ttl_seconds=60)
+    journal.record_stored([CheckpointJournal.page_event(QUERY, 0, 'TOKEN')], rows=20)
+    now = __import__('time').time()
+    mocker.patch('src.business_information_scraper.checkpoint.time.time', return_value=now + 61)
+
+    assert journal.resume_point(QUERY) is None
+
+def test_truncated_last_line_is_ignored(journal_path):
+    journal = CheckpointJournal(journal_path)
+    journal.record_stored([CheckpointJournal.query_done_event(QUERY)], rows=5)
+    journal.close()
+    with open(journal_path, 'a', encoding='utf-8') as f:
+        f.write('{"event": "flu')
+
+    resumed = CheckpointJournal(journal_path, resume=True)
+    assert resumed.is_completed(QUERY)
+    assert resumed.rows_flushed == 5
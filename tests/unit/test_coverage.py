@@ -0,0 +1,109 @@
+import math
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.business_information_scraper.coverage import area_bounds, hex_cover, plan_coverage
+from src.business_information_scraper.exceptions import ApiClientError
+from src.business_information_scraper.tiling import EARTH_RADIUS_METERS, offset_coordinates
+
+SOUTH, WEST = 4.60, -74.10
+NORTH, EAST = offset_coordinates(SOUTH, WEST, 8000, 6000)
+
+
+def _distance_meters(lat1, lng1, lat2, lng2):
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lng2 - lng1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_METERS * math.asin(math.sqrt(a))
+
+
+def _geocode_result(**geometry):
+    return {'formatted_address': 'Bogotá, Colombia', 'geometry': {'location': {'lat': 4.65, 'lng': -74.08}, **geometry}}
+
+
+def _box(south, west, north, east):
+    return {'southwest': {'lat': south, 'lng': west}, 'northeast': {'lat': north, 'lng': east}}
+
+
+# --- Test hex_cover ---
+
+def test_hex_cover_covers_every_point_of_the_box():
+    circles = hex_cover(SOUTH, WEST, NORTH, EAST, 1000)
+    rng = random.Random(1)
+
+    for _ in range(2000):
+        lat, lng = rng.uniform(SOUTH, NORTH), rng.uniform(WEST, EAST)
+        # Small slack for the equirectangular offsets.
+        assert min(_distance_meters(lat, lng, c.latitude, c.longitude) for c in circles) <= 1001
+
+
+def test_hex_cover_uses_few_circles():
+    circles = hex_cover(SOUTH, WEST, NORTH, EAST, 1000)
+
+    # 48 km² over hexagonal cells of 2.6 km² each, plus a ring of cells along the edges.
+    hex_cells = 48e6 / (1.5 * math.sqrt(3) * 1000 ** 2)
+    square_cells = 48e6 / 2e6
+    assert hex_cells <= len(circles) < square_cells * 1.5
+    assert all(circle.radius == 1000 for circle in circles)
+
+
+def test_hex_cover_row_and_column_spacing():
+    circles = hex_cover(SOUTH, WEST, NORTH, EAST, 1000)
+    first = min(circles, key=lambda c: (c.latitude, c.longitude))
+    same_row = sorted((c for c in circles if abs(c.latitude - first.latitude) < 1e-9), key=lambda c: c.longitude)
+    rows = sorted({round(c.latitude, 9) for c in circles})
+
+    assert _distance_meters(same_row[0].latitude, same_row[0].longitude,
+                            same_row[1].latitude, same_row[1].longitude) == pytest.approx(1000 * math.sqrt(3), rel=1e-3)
+    assert (rows[1] - rows[0]) * math.pi / 180 * EARTH_RADIUS_METERS == pytest.approx(1500, rel=1e-3)
+
+
+def test_hex_cover_small_area_needs_one_circle():
+    north, east = offset_coordinates(SOUTH, WEST, 500, 500)
+    assert len(hex_cover(SOUTH, WEST, north, east, 1000)) == 1
+
+
+def test_hex_cover_across_antimeridian():
+    circles = hex_cover(-17.0, 179.98, -16.98, -179.98, 1000)
+
+    assert circles
+    assert all(-180 <= circle.longitude <= 180 for circle in circles)
+
+
+# --- Test area_bounds ---
+
+def test_area_bounds_prefers_bounds_over_viewport():
+    result = _geocode_result(bounds=_box(1, 2, 3, 4), viewport=_box(0, 1, 4, 5))
+    assert area_bounds(result) == (1, 2, 3, 4)
+    assert area_bounds(_geocode_result(viewport=_box(0, 1, 4, 5))) == (0, 1, 4, 5)
+
+
+def test_area_bounds_without_viewport():
+    with pytest.raises(ApiClientError, match="has no viewport"):
+        area_bounds(_geocode_result())
+
+
+# --- Test plan_coverage ---
+
+def test_plan_coverage_reports_expected_calls():
+    client = MagicMock(api_calls=0)
+
+    def geocode(area):
+        client.api_calls += 1
+        return _geocode_result(viewport=_box(SOUTH, WEST, NORTH, EAST))
+    client.geocode.side_effect = geocode
+
+    plan = plan_coverage(client, 'bogota', 1000, 'cafe')
+
+    client.geocode.assert_called_once_with('bogota')
+    assert plan.area == 'Bogotá, Colombia'
+    assert plan.geocode_calls == 1
+    assert plan.min_nearby_calls == len(plan.circles)
+    assert plan.max_nearby_calls == 3 * len(plan.circles)
+    assert plan.max_cost_usd == pytest.approx(plan.max_nearby_calls * 0.032)
+    jobs = plan.jobs()
+    assert len(jobs) == len(plan.circles)
+    assert jobs[0].radius_meters == 1000 and jobs[0].business_type == 'cafe'
+    assert jobs[0].name == f"Bogotá, Colombia circle 1/{len(jobs)}"
@@ -0,0 +1,90 @@
+import sqlite3
+
+from src.business_information_scraper.data_models import BusinessRecord
+from src.business_information_scraper.dedup import BloomFilter, PlaceIndex
+
+
+def _records(*place_ids, name='Cafe'):
+    return [BusinessRecord(place_id, name, None, None, ('cafe',)) for place_id in place_ids]
+
+
+def test_bloom_filter_has_no_false_negatives_and_about_the_requested_error_rate():
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    for i in range(10_000):
+        bloom.add(f"known{i}")
+
+    assert all(f"known{i}" in bloom for i in range(10_000))
+    false_positives = sum(f"other{i}" in bloom for i in range(10_000))
+    assert false_positives < 200
+
+
+def test_claim_new_skips_stored_and_reserved_places(tmp_path):
+    index = PlaceIndex(str(tmp_path / 'index.sqlite'), expected_places=1000)
+
+    assert index.claim_new(['A', 'B', 'A']) == (['A', 'B'], 1)
+    assert index.claim_new(['A', 'C']) == (['C'], 1)  # A is reserved until stored or released
+    index.mark_stored(_records('A'))
+    index.release(['B'])
+
+    assert index.claim_new(['A', 'B']) == (['B'], 1)
+    assert index.known == 1
+    index.close()
+
+
+def test_new_places_are_counted_even_when_the_bloom_filter_reports_them(tmp_path):
+    index = PlaceIndex(str(tmp_path / 'index.sqlite'), expected_places=1000)
+    index.bloom.bits = bytearray(b'\xff' * len(index.bloom.bits))  # every lookup is a false positive
+
+    assert index.claim_new(['A']) == (['A'], 0)
+    index.mark_stored(_records('A'))
+    index.mark_stored(_records('A', 'B'))  # B was never claimed
+
+    assert index.known == 2
+    assert index.false_positives == 1
+    index.close()
+
+
+def test_index_persists_across_runs(tmp_path):
+    path = str(tmp_path / 'index.sqlite')
+    index = PlaceIndex(path, expected_places=1000)
+    index.claim_new(['A', 'B'])
+    index.mark_stored(_records('A', 'B'))
+    index.close()
+
+    reopened = PlaceIndex(path, expected_places=1000)
+    assert reopened.known == 2
+    assert reopened.claim_new(['A', 'B', 'C']) == (['C'], 2)
+    reopened.close()
+
+
+def test_bloom_filter_catches_up_with_rows_written_after_the_snapshot(tmp_path):
+    path = str(tmp_path / 'index.sqlite')
+    PlaceIndex(path, expected_places=1000).close()
+    # Rows stored by a run that crashed before writing its snapshot.
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO places (place_id) VALUES ('LATE')")
+
+    index = PlaceIndex(path, expected_places=1000)
+
+    assert 'LATE' in index.bloom
+    assert index.claim_new(['LATE']) == ([], 1)
+    index.close()
+
+
+def test_refresh_hands_out_stale_places_and_splits_off_unchanged_ones(tmp_path):
+    path = str(tmp_path / 'index.sqlite')
+    index = PlaceIndex(path, expected_places=1000, stale_after_seconds=3600)
+    index.claim_new(['A', 'B', 'C'])
+    index.mark_stored(_records('A', 'B', 'C'))
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE places SET last_fetched = last_fetched - 7200 WHERE place_id IN ('A', 'B')")
+
+    assert index.claim_new(['A', 'B', 'C']) == (['A', 'B'], 1)
+    changed, unchanged = index.split_changed(_records('A') + _records('B', name='Cafe Bar'))
+    assert [r.place_id for r in changed] == ['B']
+    assert [r.place_id for r in unchanged] == ['A']
+
+    index.mark_stored(changed + unchanged)
+    assert index.claim_new(['A', 'B']) == ([], 2)  # fresh again
+    assert index.known == 3
+    index.close()
@@ -0,0 +1,112 @@
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+
+from src.business_information_scraper.enrichment import AsyncDetailsEnricher, DetailsEnricher
+from src.business_information_scraper.exceptions import ApiClientError, QuotaExceededError
+from src.business_information_scraper.maps_api_client import DETAILS_FIELDS
+
+
+@pytest.fixture
+def details_client():
+    client = MagicMock()
+    client.get_place_details.side_effect = lambda place_id, fields: {
+        'place_id': place_id,
+        'formatted_address': f"{place_id} street",
+        'international_phone_number': '+57 1 234',
+        'types': ['cafe'],
+    }
+    return client
+
+
+def test_enrich_merges_details_in_order(details_client):
+    enricher = DetailsEnricher(details_client, max_workers=4)
+    places = [{'place_id': 'A', 'name': 'a'}, {'place_id': 'B', 'name': 'b'}]
+
+    enriched = enricher.enrich(places)
+    enricher.close()
+
+    assert [p['place_id'] for p in enriched] == ['A', 'B']
+    assert enriched[0]['name'] == 'a'
+    assert enriched[0]['formatted_address'] == 'A street'
+    details_client.get_place_details.assert_any_call('A', fields=DETAILS_FIELDS)
+    assert enricher.stats.api_requests == 2
+
+def test_enrich_deduplicates_in_flight_lookups(details_client):
+    release = threading.Event()
+    original = details_client.get_place_details.side_effect
+
+    def slow_details(place_id, fields):
+        release.wait(timeout=5)
+        return original(place_id, fields)
+    details_client.get_place_details.side_effect = slow_details
+
+    enricher = DetailsEnricher(details_client, max_workers=2)
+    places = [{'place_id': 'A'}, {'place_id': 'A'}, {'place_id': 'B'}]
+    worker = threading.Thread(target=lambda: enricher.enrich(places))
+    worker.start()
+    while enricher.stats.requested < 3:  # hold lookups open until every place is submitted
+        time.sleep(0.001)
+    release.set()
+    worker.join()
+    enricher.close()
+
+    assert details_client.get_place_details.call_count == 2
+    assert enricher.stats.requested == 3
+    assert enricher.stats.deduplicated == 1
+
+def test_enrich_keeps_place_when_lookup_fails(details_client):
+    details_client.get_place_details.side_effect = ApiClientError("NOT_FOUND")
+    enricher = DetailsEnricher(details_client)
+
+    enriched = enricher.enrich([{'place_id': 'A', 'name': 'a'}, {'name': 'no id'}])
+    enricher.close()
+
+    assert enriched == [{'place_id': 'A', 'name': 'a'}, {'name': 'no id'}]
+    assert enricher.stats.failures == 1
+
+def test_enrich_raises_when_quota_is_exceeded(details_client):
+    details_client.get_place_details.side_effect = QuotaExceededError("OVER_QUERY_LIMIT")
+    enricher = DetailsEnricher(details_client)
+
+    with pytest.raises(QuotaExceededError):
+        enricher.enrich([{'place_id': 'A', 'name': 'a'}])
+    enricher.close()
+
+def test_async_enrich_raises_when_quota_is_exceeded():
+    class AsyncDetailsClient:
+        async def get_place_details(self, place_id, fields):
+            raise QuotaExceededError("OVER_QUERY_LIMIT")
+
+    enricher = AsyncDetailsEnricher(AsyncDetailsClient())
+
+    with pytest.raises(QuotaExceededError):
+        asyncio.run(enricher.enrich([{'place_id': 'A'}]))
+
+def test_async_enrich_deduplicates_in_flight_lookups():
+    calls = []
+
+    class AsyncDetailsClient:
+        async def get_place_details(self, place_id, fields):
+            calls.append(place_id)
+            await asyncio.sleep(0)
+            if place_id == 'B':
+                raise ApiClientError("NOT_FOUND")
+            return {'place_id': place_id, 'formatted_address': f"{place_id} street"}
+
+    enricher = AsyncDetailsEnricher(AsyncDetailsClient(), max_concurrency=2)
+    places = [{'place_id': 'A'}, {'place_id': 'A'}, {'place_id': 'B'}, {'name': 'no id'}]
+
+    enriched = asyncio.run(enricher.enrich(places))
+
+    assert sorted(calls) == ['A', 'B']
+    assert enriched == [
+        {'place_id': 'A', 'formatted_address': 'A street'},
+        {'place_id': 'A', 'formatted_address': 'A street'},
+        {'place_id': 'B'},
+        {'name': 'no id'},
+    ]
+    assert enricher.stats.deduplicated == 1
+    assert enricher.stats.failures == 1
@@ -0,0 +1,49 @@
+import pytest
+
+from src.business_information_scraper.data_models import BusinessRecord
+from src.business_information_scraper.geo import filter_records, haversine_meters
+
+np = pytest.importorskip('numpy')
+
+CENTRE = (4.6748, -74.0474)
+# One thousandth of a degree of latitude is about 111 m.
+DEGREES_PER_100M = 100 / 111_195
+
+
+def _record(place_id, metres_north=None, name='Cafe'):
+    latitude = None if metres_north is None else CENTRE[0] + metres_north * DEGREES_PER_100M / 100
+    longitude = None if metres_north is None else CENTRE[1]
+    return BusinessRecord(place_id, name, None, None, ('cafe',), latitude, longitude)
+
+
+def test_haversine_meters_matches_known_distance():
+    # Bogotá to Medellín, roughly 240 km.
+    distances = haversine_meters(4.711, -74.0721, np.array([6.2442, 4.711]), np.array([-75.5812, -74.0721]))
+
+    assert distances[0] == pytest.approx(239_700, rel=0.01)
+    assert distances[1] == 0.0
+
+
+def test_filter_records_drops_places_outside_the_radius():
+    records = [_record('A', 50), _record('B', 150), _record('C', 99)]
+
+    result = filter_records(records, *CENTRE, radius=100)
+
+    assert [r.place_id for r in result.records] == ['A', 'C']
+    assert (result.out_of_radius, result.duplicates) == (1, 0)
+
+
+def test_filter_records_keeps_the_copy_nearest_the_centre_in_original_order():
+    records = [_record('A', 80, name='far'), _record('B', 10), _record('A', 20, name='near'), _record('A', 90)]
+
+    result = filter_records(records, *CENTRE, radius=100)
+
+    assert [(r.place_id, r.name) for r in result.records] == [('B', 'Cafe'), ('A', 'near')]
+    assert (result.out_of_radius, result.duplicates) == (0, 2)
+
+
+def test_filter_records_keeps_places_without_coordinates():
+    result = filter_records([_record('A'), _record('B', 500), _record('C'), _record('C', 10)], *CENTRE, radius=100)
+
+    assert [(r.place_id, r.latitude is None) for r in result.records] == [('A', True), ('C', False)]
+    assert (result.out_of_radius, result.duplicates) == (1, 1)
@@ -0,0 +1,64 @@
+import json
+import urllib.request
+
+from src.business_information_scraper.metrics import Histogram, MetricsRegistry
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram((0.1, 0.5, 1.0))
+    for value in (0.05, 0.1, 0.3, 0.7, 2.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1, 1]  # <=0.1, <=0.5, <=1.0, +Inf
+    assert histogram.count == 5
+    assert 0.1 <= histogram.quantile(0.5) <= 0.5
+    assert histogram.summary()['mean'] == round(3.15 / 5, 6)
+
+
+def test_report_derives_cost_saturation_and_slowest_stage():
+    metrics = MetricsRegistry(prices_per_1000={'nearby': 32.0, 'details': 20.0})
+    metrics.inc('api_requests_total', 3, endpoint='nearby', status='ok')
+    metrics.inc('api_requests_total', endpoint='nearby', status='OVER_QUERY_LIMIT')
+    metrics.inc('api_requests_total', 10, endpoint='details', status='ok')
+    metrics.inc('nearby_queries_total', 4)
+    metrics.inc('nearby_queries_saturated_total')
+    metrics.inc('stage_seconds_total', 2.0, stage='search')
+    metrics.inc('stage_seconds_total', 0.5, stage='storage')
+    metrics.observe('api_request_seconds', 0.2, endpoint='nearby')
+
+    report = json.loads(json.dumps(metrics.report()))
+
+    assert report['derived']['api_requests'] == 14
+    assert report['derived']['estimated_cost_usd'] == round(3 * 0.032 + 10 * 0.02, 4)
+    assert report['derived']['saturation_rate'] == 0.25
+    assert report['derived']['slowest_stage'] == 'search'
+    assert report['counters']['api_requests_total{endpoint="nearby",status="ok"}'] == 3
+    assert report['histograms']['api_request_seconds{endpoint="nearby"}']['count'] == 1
+
+
+def test_prometheus_text_format():
+    metrics = MetricsRegistry()
+    metrics.inc('storage_rows_total', 250)
+    metrics.observe('storage_batch_seconds', 0.02)
+    metrics.observe('storage_batch_seconds', 3.0)
+
+    text = metrics.to_prometheus()
+
+    assert '# TYPE business_scraper_storage_rows_total counter\nbusiness_scraper_storage_rows_total 250\n' in text
+    assert 'business_scraper_storage_batch_seconds_bucket{le="0.025"} 1' in text
+    assert 'business_scraper_storage_batch_seconds_bucket{le="+Inf"} 2' in text
+    assert 'business_scraper_storage_batch_seconds_count 2' in text
+
+
+def test_serve_exposes_metrics_over_http():
+    metrics = MetricsRegistry()
+    metrics.inc('nearby_pages_total', source='api')
+    metrics.serve(0)
+    try:
+        port = metrics._server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:  # nosec B310
+            body = response.read().decode()
+    finally:
+        metrics.close()
+
+    assert 'business_scraper_nearby_pages_total{source="api"} 1' in body
@@ -0,0 +1,88 @@
+import threading
+import time
+from collections import deque
+
+import pytest
+
+from src.business_information_scraper.data_models import NearbyQuery
+from src.business_information_scraper.exceptions import ApiClientError, PageTokenNotReadyError
+from src.business_information_scraper.pagination import PageTokenScheduler
+
+
+class FakePagedClient:
+    """Serves two pages per query; tokens only become valid after ``activation`` seconds."""
+
+    def __init__(self, activation: float = 0.0, never_ready: bool = False):
+        self.activation = activation
+        self.never_ready = never_ready
+        self.issued = {}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    cache = None
+
+    def get_cached_pages(self, query):
+        return None
+
+    def fetch_nearby_page(self, query, page_token=None):
+        with self.lock:
+            self.calls.append((query, page_token))
+        if page_token is None:
+            token = f"TOKEN_{query.business_type}"
+            self.issued[token] = time.monotonic()
+            return {'results': [{'place_id': f"{query.business_type}_1"}], 'next_page_token': token}
+        if self.never_ready or time.monotonic() - self.issued[page_token] < self.activation:
+            raise PageTokenNotReadyError("not yet")
+        return {'results': [{'place_id': f"{query.business_type}_2"}]}
+
+
+def _queries(n):
+    return [NearbyQuery(latitude=1.0, longitude=2.0, radius=100, business_type=f"t{i}") for i in range(n)]
+
+
+def test_scheduler_overlaps_token_waits():
+    """Waits for many queries overlap, so wall time is close to one activation delay."""
+    client = FakePagedClient(activation=0.2)
+    scheduler = PageTokenScheduler(client, max_workers=4, token_activation_delay=0.2, token_retry_interval=0.02)
+
+    started = time.monotonic()
+    results = scheduler.run(_queries(10))
+    elapsed = time.monotonic() - started
+
+    assert len(results) == 10
+    assert all(len(pages) == 2 for pages in results.values())
+    assert elapsed < 10 * 0.2 / 2
+
+
+def test_scheduler_polls_until_token_is_valid():
+    client = FakePagedClient(activation=0.1)
+    scheduler = PageTokenScheduler(client, token_activation_delay=0.0, token_retry_interval=0.02)
+
+    results = scheduler.run(_queries(1))
+
+    assert [p['place_id'] for p in results[_queries(1)[0]]] == ['t0_1', 't0_2']
+    assert len(client.calls) > 2  # early attempts were rejected and retried
+
+
+def test_scheduler_gives_up_on_token_that_never_activates():
+    client = FakePagedClient(never_ready=True)
+    scheduler = PageTokenScheduler(client, token_activation_delay=0.0, token_retry_interval=0.0, max_token_retries=3)
+
+    with pytest.raises(ApiClientError, match="did not become valid"):
+        scheduler.run(_queries(1))
+
+
+def test_scheduler_accepts_queries_added_while_iterating():
+    client = FakePagedClient()
+    scheduler = PageTokenScheduler(client, token_activation_delay=0.0)
+    first, second = _queries(2)
+    pending = deque([first])
+
+    seen = []
+    for page in scheduler.iter_pages(pending):
+        if page.is_last:
+            seen.append(page.query)
+            if page.query == first:
+                pending.append(second)
+
+    assert seen == [first, second]
@@ -0,0 +1,350 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from src.business_information_scraper.checkpoint import CheckpointJournal
+from src.business_information_scraper.data_models import BusinessRecord, NearbyQuery
+from src.business_information_scraper.dedup import PlaceIndex
+from src.business_information_scraper.exceptions import ApiClientError, StorageError
+from src.business_information_scraper.pagination import NearbyPage
+from src.business_information_scraper.processor import BusinessDataProcessor
+from src.business_information_scraper.spatial import SpatialIndex
+from src.business_information_scraper.writer import BackgroundStorageWriter
+
+
+QUERY = NearbyQuery(latitude=1.0, longitude=2.0, radius=100, business_type='cafe')
+
+
+def _page(start, size, page_index=0, next_page_token=None):
+    results = [{'place_id': f"P{i}", 'name': f"Place {i}", 'types': ['cafe']} for i in range(start, start + size)]
+    return NearbyPage(QUERY, results, page_index, next_page_token)
+
+
+@pytest.fixture
+def api_client():
+    client = MagicMock()
+    client.api_calls = 0
+    return client
+
+
+def test_process_location_flushes_at_batch_size(api_client):
+    api_client.iter_nearby_pages.return_value = iter([_page(0, 20), _page(20, 20), _page(40, 5)])
+    storage = MagicMock()
+
+    processor = BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=15)
+    processed = processor.process_location(latitude=1.0, longitude=2.0, radius=100, business_type='cafe')
+
+    assert processed == 45
+    assert [len(c.args[0]) for c in storage.save.call_args_list] == [15, 15, 15]
+    api_client.iter_nearby_pages.assert_called_once_with(1.0, 2.0, 100, 'cafe', checkpoint=None)
+
+def test_process_location_consumes_pages_lazily(api_client):
+    """The first batch reaches storage before the second page is requested."""
+    events = []
+
+    def pages():
+        events.append('page 1')
+        yield _page(0, 20)
+        events.append('page 2')
+        yield _page(20, 20)
+    api_client.iter_nearby_pages.return_value = pages()
+    storage = MagicMock()
+    storage.save.side_effect = lambda batch: events.append(f"save {len(batch)}")
+
+    BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=20).process_location(1.0, 2.0, 100, 'cafe')
+
+    assert events == ['page 1', 'save 20', 'page 2', 'save 20']
+
+def test_process_location_uses_adaptive_tiling_when_configured(api_client):
+    api_client.iter_nearby_pages_adaptive.return_value = iter([_page(0, 3)])
+    storage = MagicMock()
+
+    processor = BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=10, min_tile_radius=200)
+    processor.process_location(1.0, 2.0, 1000, 'cafe')
+
+    api_client.iter_nearby_pages_adaptive.assert_called_once_with(1.0, 2.0, 1000, 'cafe', 200, checkpoint=None)
+    api_client.iter_nearby_pages.assert_not_called()
+
+def test_process_location_enriches_each_page(api_client):
+    api_client.iter_nearby_pages.return_value = iter([_page(0, 2)])
+    enricher = MagicMock()
+    enricher.enrich.side_effect = lambda page: [{**p, 'formatted_address': 'Street'} for p in page]
+    storage = MagicMock()
+
+    BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=10, enricher=enricher).process_location(1.0, 2.0, 100, 'cafe')
+
+    saved = storage.save.call_args.args[0]
+    assert [b.address for b in saved] == ['Street', 'Street']
+
+def test_process_location_saves_buffer_before_reraising(api_client):
+    def pages():
+        yield _page(0, 3)
+        raise ApiClientError("OVER_QUERY_LIMIT")
+    api_client.iter_nearby_pages.return_value = pages()
+    storage = MagicMock()
+
+    processor = BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=10)
+    with pytest.raises(ApiClientError):
+        processor.process_location(1.0, 2.0, 100, 'cafe')
+
+    assert len(storage.save.call_args.args[0]) == 3
+
+def test_process_location_journals_pages_after_they_are_flushed(api_client, tmp_path):
+    """Page and completion events reach the journal only once their rows are flushed."""
+    api_client.iter_nearby_pages.return_value = iter([
+        _page(0, 20, page_index=0, next_page_token='T1'),
+        _page(20, 5, page_index=1),
+    ])
+    storage = MagicMock()
+    journal = CheckpointJournal(str(tmp_path / 'run.journal'))
+    journaled = []
+    storage.flush.side_effect = lambda: journaled.append(journal.resume_point(QUERY))
+
+    processor = BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=20, checkpoint=journal)
+    processor.process_location(1.0, 2.0, 100, 'cafe')
+    journal.close()
+
+    # The first flush happens mid-way, before page 0's event was journaled.
+    assert journaled == [None, None]
+    resumed = CheckpointJournal(str(tmp_path / 'run.journal'), resume=True)
+    assert resumed.is_completed(QUERY)
+    assert resumed.rows_flushed == 25
+
+def test_process_location_stops_journaling_after_failed_save(api_client, tmp_path):
+    api_client.iter_nearby_pages.return_value = iter([_page(0, 5)])
+    storage = MagicMock()
+    storage.save.side_effect = StorageError("disk full")
+    journal = CheckpointJournal(str(tmp_path / 'run.journal'))
+
+    BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=20, checkpoint=journal).process_location(1.0, 2.0, 100, 'cafe')
+
+    assert not journal.is_completed(QUERY)
+
+def test_transform_details_to_model_defaults():
+    business = BusinessDataProcessor._transform_details_to_model({'place_id': 'P1'})
+
+    assert business.name == 'N/A'
+    assert business.address == 'unknown_address'
+    assert BusinessDataProcessor._transform_details_to_model({'name': 'no id'}) is None
+
+
+def test_process_location_async_saves_batches_from_async_pages():
+    class AsyncClient:
+        api_calls = 0
+
+        async def iter_nearby_pages(self, latitude, longitude, radius, business_type):
+            for page in (_page(0, 20), _page(20, 5)):
+                yield page
+
+    storage = MagicMock()
+    processor = BusinessDataProcessor(api_client=AsyncClient(), storage=storage, batch_size=15)
+
+    processed = asyncio.run(processor.process_location_async(1.0, 2.0, 100, 'cafe'))
+
+    assert processed == 25
+    assert [len(c.args[0]) for c in storage.save.call_args_list] == [15, 10]
+
+def test_process_location_records_stage_metrics(api_client):
+    page = _page(0, 3)
+    page.results.append({'name': 'no id'})
+    page.results.append({'place_id': 'BAD', 'name': 'bad types', 'types': 'not-a-list'})
+    api_client.iter_nearby_pages.return_value = iter([page])
+    storage = MagicMock()
+
+    processor = BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=10)
+    processor.process_location(1.0, 2.0, 100, 'cafe')
+
+    metrics = processor.metrics
+    assert metrics.counter_value('businesses_processed_total') == 3
+    assert metrics.counter_value('transform_failures_total') == 1
+    assert metrics.counter_value('places_skipped_total', reason='missing_place_id') == 1
+    assert metrics.counter_value('storage_rows_total') == 3
+    assert metrics.histogram('storage_batch_seconds').count == 1
+    assert {'search', 'transform', 'storage'} <= {
+        name.split('"')[1] for name in metrics.report()['counters'] if name.startswith('stage_seconds_total')
+    }
+
+def test_process_location_geo_filter_drops_far_and_duplicate_places(api_client):
+    pytest.importorskip('numpy')
+    near = {'geometry': {'location': {'lat': 1.0, 'lng': 2.0}}, 'types': ['cafe']}
+    far = {'geometry': {'location': {'lat': 1.01, 'lng': 2.0}}, 'types': ['cafe']}  # ~1.1 km away
+    results = [{'place_id': 'A', **near}, {'place_id': 'B', **far}, {'place_id': 'A', **near}, {'place_id': 'C'}]
+    api_client.iter_nearby_pages.return_value = iter([NearbyPage(QUERY, results, 0, None)])
+    storage = MagicMock()
+    processor = BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=10, geo_filter=True)
+
+    processed = processor.process_location(1.0, 2.0, 100, 'cafe')
+
+    assert processed == 2
+    assert [record.place_id for record in storage.save.call_args.args[0]] == ['A', 'C']
+    assert processor.metrics.counter_value('places_filtered_total', reason='out_of_radius') == 1
+    assert processor.metrics.counter_value('places_filtered_total', reason='duplicate') == 1
+
+def test_process_location_skips_places_already_in_the_index(api_client, tmp_path):
+    index = PlaceIndex(str(tmp_path / 'index.sqlite'), expected_places=1000)
+    index.claim_new(['P0', 'P1'])
+    index.mark_stored([BusinessRecord(f"P{i}", f"Place {i}", None, None, ('cafe',)) for i in range(2)])
+    api_client.iter_nearby_pages.return_value = iter([_page(0, 3), _page(2, 2)])
+    enricher = MagicMock()
+    enricher.enrich.side_effect = lambda page: page
+    storage = MagicMock()
+    processor = BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=10, enricher=enricher, place_index=index)
+
+    processed = processor.process_location(1.0, 2.0, 100, 'cafe')
+
+    assert processed == 2
+    assert [[p['place_id'] for p in c.args[0]] for c in enricher.enrich.call_args_list] == [['P2'], ['P3']]
+    assert [record.place_id for record in storage.save.call_args.args[0]] == ['P2', 'P3']
+    assert processor.metrics.report()['derived']['known_places_skipped'] == 3
+    assert index.claim_new(['P2', 'P3']) == ([], 2)
+    index.close()
+
+def test_process_location_refresh_writes_only_changed_places(api_client, tmp_path):
+    index = PlaceIndex(str(tmp_path / 'index.sqlite'), expected_places=1000, stale_after_seconds=1)
+    api_client.iter_nearby_pages.return_value = iter([_page(0, 3)])
+    storage = MagicMock()
+    BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=10, place_index=index).process_location(1.0, 2.0, 100, 'cafe')
+    index.stale_after_seconds = 1e-9  # everything stored so far is now stale
+
+    page = _page(0, 3)
+    page.results[1]['name'] = 'Renamed'
+    api_client.iter_nearby_pages.return_value = iter([page])
+    storage.reset_mock()
+    processor = BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=10, place_index=index)
+    processed = processor.process_location(1.0, 2.0, 100, 'cafe')
+
+    assert processed == 1
+    assert [record.name for record in storage.save.call_args.args[0]] == ['Renamed']
+    assert processor.metrics.counter_value('places_unchanged_total') == 2
+    index.close()
+
+def test_process_location_adds_saved_batches_to_the_spatial_index(api_client, tmp_path):
+    spatial = SpatialIndex(str(tmp_path / 'geo.sqlite'))
+    page = _page(0, 2)
+    page.results[0]['geometry'] = {'location': {'lat': 1.0, 'lng': 2.0}}
+    api_client.iter_nearby_pages.return_value = iter([page])
+
+    BusinessDataProcessor(api_client=api_client, storage=MagicMock(), batch_size=10, spatial_index=spatial).process_location(1.0, 2.0, 100, 'cafe')
+
+    assert [m.record.place_id for m in spatial.within_radius(1.0, 2.0, 100)] == ['P0']
+    spatial.close()
+
+def test_process_location_keeps_checkpointing_when_the_spatial_index_fails(api_client, tmp_path):
+    page = _page(0, 2)
+    page.results[0]['geometry'] = {'location': {'lat': 1.0, 'lng': 2.0}}
+    api_client.iter_nearby_pages.return_value = iter([page])
+    spatial = MagicMock()
+    spatial.add.side_effect = StorageError("database is locked")
+    journal = CheckpointJournal(str(tmp_path / 'run.journal'))
+    processor = BusinessDataProcessor(
+        api_client=api_client, storage=MagicMock(), batch_size=10, checkpoint=journal, spatial_index=spatial,
+    )
+
+    processor.process_location(1.0, 2.0, 100, 'cafe')
+
+    assert journal.is_completed(QUERY)
+    assert processor.metrics.counter_value('storage_failed_rows_total') == 0
+    assert processor.metrics.counter_value('spatial_index_failed_rows_total') == 2
+    journal.close()
+
+def _typed_page(business_type, place_ids, page_index=0, next_page_token=None):
+    query = QUERY.model_copy(update={'business_type': business_type})
+    results = [{'place_id': place_id, 'name': place_id, 'types': [business_type]} for place_id in place_ids]
+    return NearbyPage(query, results, page_index, next_page_token)
+
+
+def test_process_location_merges_types_before_a_single_write(api_client):
+    api_client.iter_nearby_pages.return_value = iter([
+        _typed_page('cafe', ['A', 'B']), _typed_page('bar', ['B', 'C']), _typed_page('restaurant', ['A']),
+    ])
+    storage = MagicMock()
+    processor = BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=100)
+
+    processed = processor.process_location(1.0, 2.0, 100, 'cafe,bar,restaurant')
+
+    assert processed == 3
+    api_client.iter_nearby_pages.assert_called_once_with(1.0, 2.0, 100, ['cafe', 'bar', 'restaurant'], checkpoint=None)
+    storage.save.assert_called_once()
+    saved = {record.place_id: record.types for record in storage.save.call_args.args[0]}
+    assert saved == {'A': ('cafe', 'restaurant'), 'B': ('cafe', 'bar'), 'C': ('bar',)}
+    assert processor.metrics.counter_value('places_merged_total') == 2
+
+def test_process_location_enriches_merged_places_once(api_client):
+    api_client.iter_nearby_pages.return_value = iter([_typed_page('cafe', ['A']), _typed_page('bar', ['A'])])
+    enricher = MagicMock()
+    enricher.enrich.side_effect = lambda places: [{**place, 'types': ['food']} for place in places]
+    storage = MagicMock()
+
+    BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=10, enricher=enricher).process_location(
+        1.0, 2.0, 100, ['cafe', 'bar'],
+    )
+
+    assert [len(c.args[0]) for c in enricher.enrich.call_args_list] == [1]
+    assert storage.save.call_args.args[0][0].types == ('food', 'cafe', 'bar')
+
+def test_process_location_types_stores_partial_results_and_journals_them(api_client, tmp_path):
+    def pages():
+        yield _typed_page('cafe', ['A'])
+        raise ApiClientError("bar search failed")
+    api_client.iter_nearby_pages.return_value = pages()
+    storage = MagicMock()
+    journal = CheckpointJournal(str(tmp_path / 'journal.jsonl'))
+    processor = BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=10, checkpoint=journal)
+
+    with pytest.raises(ApiClientError):
+        processor.process_location(1.0, 2.0, 100, ['cafe', 'bar'])
+
+    assert [record.place_id for record in storage.save.call_args.args[0]] == ['A']
+    assert journal.is_completed(QUERY)
+    journal.close()
+
+def test_process_location_async_runs_types_concurrently():
+    started = []
+
+    class AsyncClient:
+        api_calls = 0
+
+        async def iter_nearby_pages(self, latitude, longitude, radius, business_type):
+            started.append(business_type)
+            await asyncio.sleep(0)
+            # Every search is under way before any returns a page.
+            assert len(started) == 2
+            yield _typed_page(business_type, ['A', business_type])
+
+    storage = MagicMock()
+    processor = BusinessDataProcessor(api_client=AsyncClient(), storage=storage, batch_size=10)
+
+    processed = asyncio.run(processor.process_location_async(1.0, 2.0, 100, ['cafe', 'bar']))
+
+    assert processed == 3
+    saved = {record.place_id: record.types for record in storage.save.call_args.args[0]}
+    assert saved == {'A': ('cafe', 'bar'), 'cafe': ('cafe',), 'bar': ('bar',)}
+
+def test_process_location_does_not_journal_rows_the_writer_dead_lettered(api_client, tmp_path):
+    api_client.iter_nearby_pages.return_value = iter([_page(0, 5)])
+    inner = MagicMock()
+    inner.save.side_effect = StorageError("disk full")
+    storage = BackgroundStorageWriter(inner, max_retries=0)
+    storage.setup()
+    journal = CheckpointJournal(str(tmp_path / 'run.journal'))
+
+    BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=20, checkpoint=journal).process_location(1.0, 2.0, 100, 'cafe')
+    storage.close()
+    journal.close()
+
+    assert not CheckpointJournal(str(tmp_path / 'run.journal'), resume=True).is_completed(QUERY)
+
+def test_process_location_keeps_places_the_writer_failed_to_store_out_of_the_index(api_client, tmp_path):
+    index = PlaceIndex(str(tmp_path / 'index.sqlite'), expected_places=1000)
+    api_client.iter_nearby_pages.return_value = iter([_page(0, 2)])
+    inner = MagicMock()
+    inner.save.side_effect = StorageError("disk full")
+    storage = BackgroundStorageWriter(inner, max_retries=0)
+    storage.setup()
+
+    BusinessDataProcessor(api_client=api_client, storage=storage, batch_size=10, place_index=index).process_location(1.0, 2.0, 100, 'cafe')
+    storage.close()
+
+    assert storage.rows_written == 0
+    assert index.claim_new(['P0', 'P1']) == (['P0', 'P1'], 0)
+    index.close()
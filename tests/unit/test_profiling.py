@@ -0,0 +1,49 @@
+import json
+import threading
+import time
+
+from src.business_information_scraper.profiling import StageProfiler
+
+
+def _busy(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_stage_samples_are_rooted_at_the_stage_name():
+    with StageProfiler(interval=0.001) as profiler:
+        with profiler.stage('transform'):
+            _busy(0.05)
+
+    stacks = [stack for stack in profiler.samples if stack.startswith('transform;')]
+    assert stacks
+    assert any('_busy (unit/test_profiling.py:' in stack for stack in stacks)
+    times = profiler.stage_times['transform']
+    assert times['calls'] == 1
+    assert times['wall_seconds'] >= 0.05
+    assert times['cpu_seconds'] > 0
+
+
+def test_unstaged_threads_are_grouped_by_thread_name():
+    worker = threading.Thread(target=_busy, args=(0.05,), name='nearby_3')
+    with StageProfiler(interval=0.001) as profiler:
+        worker.start()
+        worker.join()
+
+    assert any(stack.startswith('nearby;') for stack in profiler.samples)
+
+
+def test_write_emits_collapsed_stacks_and_stage_breakdown(tmp_path):
+    with StageProfiler(interval=0.001) as profiler:
+        with profiler.stage('search'):
+            time.sleep(0.03)
+
+    profiler.write(str(tmp_path))
+
+    lines = (tmp_path / 'stacks.collapsed').read_text().splitlines()
+    assert lines and all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+    report = json.loads((tmp_path / 'stages.json').read_text())
+    assert report['stages']['search']['wall_seconds'] >= 0.03
+    # Sleeping is waiting, not CPU work.
+    assert report['stages']['search']['cpu_utilisation'] < 0.5
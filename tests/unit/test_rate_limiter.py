@@ -0,0 +1,42 @@
+import pytest
+
+from src.business_information_scraper.exceptions import QuotaExceededError
+from src.business_information_scraper.rate_limiter import RateLimiter, RetryPolicy
+
+
+def test_rate_limiter_allows_burst_then_spaces_requests():
+    limiter = RateLimiter(max_qps=10, burst=2)
+
+    delays = [limiter.reserve() for _ in range(4)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.1, abs=0.02)
+    assert delays[3] == pytest.approx(0.2, abs=0.02)
+
+def test_rate_limiter_enforces_daily_budget():
+    limiter = RateLimiter(max_qps=100, daily_budget=2)
+    limiter.reserve()
+    limiter.reserve()
+
+    with pytest.raises(QuotaExceededError, match="Daily budget of 2"):
+        limiter.reserve()
+
+def test_rate_limiter_backs_off_on_quota_errors_and_recovers():
+    limiter = RateLimiter(max_qps=8, min_qps=1)
+
+    limiter.record_quota_error()
+    limiter.record_quota_error()
+    assert limiter.rate == 2
+    assert limiter.reserve() > 0  # bucket drained after a quota error
+
+    for _ in range(200):
+        limiter.record_success()
+    assert limiter.rate == 8
+
+def test_retry_policy_delay_is_capped_and_jittered():
+    policy = RetryPolicy(base_delay=1, max_delay=4)
+
+    delays = [policy.delay(attempt) for attempt in range(10) for _ in range(20)]
+
+    assert all(0 <= d <= 4 for d in delays)
+    assert len(set(delays)) > 1
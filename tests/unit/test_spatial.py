@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from src.business_information_scraper.data_models import BusinessRecord
+from src.business_information_scraper.spatial import SpatialIndex, covering_cells, geohash_encode, haversine_meters
+
+CENTRE = (4.6748, -74.0474)
+
+
+@pytest.fixture
+def index(tmp_path):
+    rng = random.Random(7)
+    spatial = SpatialIndex(str(tmp_path / 'geo.sqlite'))
+    records = [
+        BusinessRecord(f"P{i}", f"Place {i}", None, None, ('cafe',) if i % 2 else ('bar', 'food'),
+                       CENTRE[0] + rng.uniform(-0.02, 0.02), CENTRE[1] + rng.uniform(-0.02, 0.02))
+        for i in range(2000)
+    ]
+    spatial.add(records)
+    yield spatial, records
+    spatial.close()
+
+
+def test_geohash_encode_matches_reference_value():
+    assert geohash_encode(57.64911, 10.40744, 11) == 'u4pruydqqvj'
+    assert geohash_encode(CENTRE[0], CENTRE[1], 5) == 'd2g6e'
+
+
+def test_covering_cells_contain_every_point_of_the_box():
+    cells = covering_cells(4.66, -74.06, 4.68, -74.04)
+    rng = random.Random(1)
+    for _ in range(500):
+        point = geohash_encode(rng.uniform(4.66, 4.68), rng.uniform(-74.06, -74.04))
+        assert any(point.startswith(cell) for cell in cells)
+
+
+def test_within_radius_matches_brute_force_nearest_first(index):
+    spatial, records = index
+    expected = sorted(
+        (haversine_meters(*CENTRE, r.latitude, r.longitude), r.place_id) for r in records
+        if haversine_meters(*CENTRE, r.latitude, r.longitude) <= 500
+    )
+
+    matches = spatial.within_radius(*CENTRE, 500)
+
+    assert [(m.distance_meters, m.record.place_id) for m in matches] == expected
+    assert matches[0].record.types in (('cafe',), ('bar', 'food'))
+
+
+def test_within_box_and_type_filter(index):
+    spatial, records = index
+    box = (4.670, -74.050, 4.675, -74.045)
+    expected = sorted(
+        r.place_id for r in records
+        if box[0] <= r.latitude <= box[2] and box[1] <= r.longitude <= box[3] and 'bar' in r.types
+    )
+
+    assert [m.record.place_id for m in spatial.within_box(*box, types=['bar'])] == expected
+
+
+def test_queries_across_the_antimeridian(tmp_path):
+    spatial = SpatialIndex(str(tmp_path / 'geo.sqlite'))
+    spatial.add([
+        BusinessRecord('E', 'East', None, None, ('cafe',), 0.0, 179.9),
+        BusinessRecord('W', 'West', None, None, ('cafe',), 0.0, -179.9),
+        BusinessRecord('F', 'Far', None, None, ('cafe',), 0.0, 170.0),
+    ])
+
+    assert [m.record.place_id for m in spatial.within_box(-1, 179, 1, 181)] == ['E', 'W']
+    assert [m.record.place_id for m in spatial.within_box(-1, 179, 1, -179)] == ['E', 'W']
+    assert sorted(m.record.place_id for m in spatial.within_radius(0.0, 180.0, 20_000)) == ['E', 'W']
+    spatial.close()
+
+
+def test_nearest_returns_k_closest(index):
+    spatial, records = index
+    expected = sorted(records, key=lambda r: haversine_meters(*CENTRE, r.latitude, r.longitude))[:5]
+
+    assert [m.record.place_id for m in spatial.nearest(*CENTRE, 5)] == [r.place_id for r in expected]
+
+
+def test_records_without_coordinates_are_not_indexed_and_rows_persist(tmp_path):
+    path = str(tmp_path / 'geo.sqlite')
+    spatial = SpatialIndex(path)
+    assert spatial.add([BusinessRecord('A', 'Cafe', None, None, (), 1.0, 2.0), BusinessRecord('B', 'Bar', None, None, ())]) == 1
+    spatial.close()
+
+    reopened = SpatialIndex(path)
+    assert len(reopened) == 1
+    assert reopened.nearest(1.0, 2.0, 1)[0].to_json_dict()['distance_meters'] == 0.0
+    reopened.close()
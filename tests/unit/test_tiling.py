@@ -0,0 +1,61 @@
+import math
+import pytest
+
+from src.business_information_scraper.data_models import SearchTile
+from src.business_information_scraper.tiling import EARTH_RADIUS_METERS, cover_with_tiles, offset_coordinates, split_tile
+
+
+def _distance_meters(lat1, lng1, lat2, lng2):
+    """Haversine distance used to check the tiling geometry."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_METERS * math.asin(math.sqrt(a))
+
+
+def test_offset_coordinates_moves_expected_distance():
+    lat, lng = offset_coordinates(4.6748, -74.0474, north_meters=300, east_meters=400)
+    assert _distance_meters(4.6748, -74.0474, lat, lng) == pytest.approx(500, rel=1e-3)
+
+
+def test_split_tile_children_shape():
+    parent = SearchTile(latitude=4.6748, longitude=-74.0474, radius=1000, depth=2)
+    children = split_tile(parent)
+
+    assert len(children) == 4
+    assert all(child.depth == 3 for child in children)
+    assert all(child.radius == pytest.approx(1000 / math.sqrt(2)) for child in children)
+
+
+def test_split_tile_children_cover_parent():
+    """Every point of the parent circle lies inside at least one child circle."""
+    parent = SearchTile(latitude=4.6748, longitude=-74.0474, radius=1000)
+    children = split_tile(parent)
+
+    for bearing in range(0, 360, 15):
+        for fraction in (0.0, 0.5, 0.99):
+            north = parent.radius * fraction * math.cos(math.radians(bearing))
+            east = parent.radius * fraction * math.sin(math.radians(bearing))
+            lat, lng = offset_coordinates(parent.latitude, parent.longitude, north, east)
+            assert any(
+                _distance_meters(lat, lng, child.latitude, child.longitude) <= child.radius * 1.001
+                for child in children
+            )
+
+
+def test_cover_with_tiles_covers_circle_with_small_tiles():
+    parent = SearchTile(latitude=4.6748, longitude=-74.0474, radius=5000)
+    tiles = cover_with_tiles(parent, max_radius=1000)
+
+    assert all(tile.radius <= 1000 for tile in tiles)
+    # An 8 x 8 grid spans the circle; its corner cells fall outside it.
+    assert 0 < len(tiles) < 64
+    for north, east in ((0, 0), (4900, 0), (0, -4900), (3400, 3400), (-2500, 1200)):
+        lat, lng = offset_coordinates(parent.latitude, parent.longitude, north, east)
+        assert any(_distance_meters(lat, lng, tile.latitude, tile.longitude) <= tile.radius for tile in tiles)
+
+
+def test_cover_with_tiles_keeps_small_circle():
+    parent = SearchTile(latitude=1.0, longitude=2.0, radius=500)
+    assert cover_with_tiles(parent, max_radius=1000) == [parent]
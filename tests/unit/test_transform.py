@@ -0,0 +1,62 @@
+from src.business_information_scraper.data_models import UNKNOWN_ADDRESS, UNKNOWN_PHONE_NUMBER, BusinessInfo, BusinessRecord
+from src.business_information_scraper.transform import combine_types, intern_types, merge_places, to_records
+
+
+def test_to_records_validates_a_page_and_applies_defaults():
+    places = [
+        {'place_id': 'A', 'name': 'Cafe A', 'formatted_address': 'Calle 1', 'types': ['cafe', 'food'],
+         'geometry': {'location': {'lat': 1.0, 'lng': 2.0}}},
+        {'place_id': 'B'},
+    ]
+
+    records, failed = to_records(places)
+
+    assert failed == 0
+    assert records == [
+        BusinessRecord('A', 'Cafe A', 'Calle 1', UNKNOWN_PHONE_NUMBER, ('cafe', 'food'), 1.0, 2.0),
+        BusinessRecord('B', 'N/A', UNKNOWN_ADDRESS, UNKNOWN_PHONE_NUMBER, ()),
+    ]
+
+
+def test_to_records_keeps_valid_places_when_one_is_invalid():
+    places = [{'place_id': 'A'}, {'place_id': 'B', 'types': 'not-a-list'}, {'place_id': 'C', 'name': None}, {'place_id': 'D'}]
+
+    records, failed = to_records(places)
+
+    assert [record.place_id for record in records] == ['A', 'D']
+    assert failed == 2
+
+
+def test_records_with_equal_types_share_one_interned_tuple():
+    records, _ = to_records([{'place_id': 'A', 'types': ['cafe', 'food']}, {'place_id': 'B', 'types': ['cafe', 'food']}])
+
+    assert records[0].types is records[1].types
+    assert records[0].types is intern_types(['cafe', 'food'])
+
+
+def test_record_converts_to_model_at_the_boundary():
+    record = BusinessRecord('A', 'Cafe A', 'Calle 1', '+57 1', ('cafe',))
+
+    assert record.to_model() == BusinessInfo(place_id='A', name='Cafe A', address='Calle 1', phone_number='+57 1', types=['cafe'])
+    assert record.to_json_dict()['types'] == ['cafe']
+
+
+def test_merge_places_combines_types_of_copies():
+    cafe = {'place_id': 'A', 'name': 'Cafe Bar', 'types': ['cafe', 'food']}
+    bar = {'place_id': 'A', 'name': 'Other name', 'types': ['bar', 'food']}
+    other = {'place_id': 'B', 'types': ['bar']}
+    no_id = {'name': 'Anonymous'}
+
+    merged = merge_places([cafe, no_id, other, bar])
+
+    assert merged == [
+        {'place_id': 'A', 'name': 'Cafe Bar', 'types': ['cafe', 'food', 'bar']},
+        other,
+        no_id,
+    ]
+    assert cafe['types'] == ['cafe', 'food']  # inputs are not modified
+
+
+def test_combine_types_returns_same_place_when_nothing_added():
+    place = {'place_id': 'A', 'types': ['cafe']}
+    assert combine_types(place, {'types': ['cafe']}) is place
@@ -0,0 +1,153 @@
+import threading
+from unittest.mock import MagicMock
+
+from src.business_information_scraper.data_models import JobResult, SearchJob
+from src.business_information_scraper.exceptions import ApiClientError
+from src.business_information_scraper.work_queue import QueueWorker, WorkQueue, split_jobs
+
+
+def _jobs(count, business_type='cafe'):
+    return [SearchJob(latitude=1 + index, longitude=2, radius_meters=100, business_type=business_type)
+            for index in range(count)]
+
+
+def _done(lease):
+    return JobResult(job=lease.job, succeeded=True, businesses_processed=1)
+
+
+# --- Test WorkQueue ---
+
+def test_enqueue_is_idempotent(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.db'))
+
+    assert queue.enqueue(_jobs(3)) == 3
+    assert queue.enqueue(_jobs(4)) == 1
+    assert queue.counts() == {'pending': 4, 'leased': 0, 'done': 0, 'failed': 0}
+    queue.close()
+
+
+def test_claim_hands_out_each_task_once(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.db'))
+    queue.enqueue(_jobs(2))
+
+    first, second = queue.claim('a'), queue.claim('b')
+
+    assert {first.task_id, second.task_id} == {1, 2}
+    assert first.job == _jobs(2)[0]
+    assert queue.claim('c') is None
+    assert queue.complete(first, _done(first))
+    assert queue.counts() == {'pending': 0, 'leased': 1, 'done': 1, 'failed': 0}
+    assert not queue.is_drained()
+    queue.close()
+
+
+def test_expired_lease_is_requeued_and_fenced(tmp_path):
+    path = str(tmp_path / 'queue.db')
+    queue = WorkQueue(path, lease_seconds=-1)  # every lease is already expired
+    queue.enqueue(_jobs(1))
+
+    stale = queue.claim('a')
+    current = queue.claim('b')
+
+    assert current.task_id == stale.task_id
+    assert current.attempt == stale.attempt + 1
+    # The first worker lost the task: it can neither keep nor complete it.
+    assert not queue.heartbeat(stale)
+    assert not queue.complete(stale, _done(stale))
+    assert queue.complete(current, _done(current))
+    assert queue.counts()['done'] == 1
+    queue.close()
+
+
+def test_heartbeat_keeps_lease(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.db'), lease_seconds=60)
+    queue.enqueue(_jobs(1))
+    lease = queue.claim('a')
+
+    assert queue.heartbeat(lease)
+    assert queue.claim('b') is None
+    queue.close()
+
+
+def test_fail_retries_until_max_attempts(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.db'), max_attempts=2)
+    queue.enqueue(_jobs(1))
+    failure = JobResult(job=_jobs(1)[0], succeeded=False, error="ApiClientError: boom")
+
+    assert not queue.fail(queue.claim('a'), failure)
+    assert queue.counts()['pending'] == 1
+    assert queue.fail(queue.claim('a'), failure)
+    assert queue.counts()['failed'] == 1
+    assert queue.results() == [failure]
+    queue.close()
+
+
+def test_expired_lease_gives_up_after_max_attempts(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.db'), lease_seconds=-1, max_attempts=1)
+    queue.enqueue(_jobs(1))
+    queue.claim('a')
+
+    assert queue.claim('b') is None
+    assert queue.is_drained()
+    assert queue.results()[0].error == "Lease expired on each of 1 attempts"
+    queue.close()
+
+
+def test_queue_shared_between_connections(tmp_path):
+    """Workers in other processes open the same file; each task is claimed by exactly one of them."""
+    path = str(tmp_path / 'queue.db')
+    WorkQueue(path).enqueue(_jobs(50))
+    queues = [WorkQueue(path) for _ in range(4)]
+    claimed = [[] for _ in queues]
+
+    def drain(index):
+        while (lease := queues[index].claim(f"w{index}")) is not None:
+            claimed[index].append(lease.task_id)
+            queues[index].complete(lease, _done(lease))
+
+    threads = [threading.Thread(target=drain, args=(index,)) for index in range(len(queues))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    task_ids = [task_id for worker in claimed for task_id in worker]
+    assert sorted(task_ids) == list(range(1, 51))
+    assert queues[0].counts()['done'] == 50
+    for queue in queues:
+        queue.close()
+
+
+def test_split_jobs_tiles_wide_jobs():
+    wide = SearchJob(latitude=4.67, longitude=-74.04, radius_meters=5000, business_type='bar', name='city')
+    small = SearchJob(latitude=1, longitude=2, radius_meters=500, business_type='bar')
+
+    jobs = split_jobs([wide, small], max_radius=1000)
+
+    assert jobs[-1] == small
+    assert len(jobs) > 2
+    assert all(job.radius_meters == 1000 and job.business_type == 'bar' for job in jobs[:-1])
+    assert jobs[0].name.startswith('city tile 1/')
+
+
+# --- Test QueueWorker ---
+
+def test_queue_worker_drains_queue(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.db'), max_attempts=1)
+    queue.enqueue(_jobs(3) + _jobs(1, business_type='broken'))
+    processor = MagicMock()
+
+    def process_location(latitude, longitude, radius, business_type):
+        if business_type == 'broken':
+            raise ApiClientError from ApiClientError("INVALID_REQUEST")
+        return 5
+    processor.process_location.side_effect = process_location
+
+    report = QueueWorker(queue, processor, max_workers=2, poll_interval=0.01).run()
+
+    assert report.succeeded == 3
+    assert report.failed == 1
+    assert processor.process_location.call_count == 4
+    assert queue.counts() == {'pending': 0, 'leased': 0, 'done': 3, 'failed': 1}
+    assert [result.job for result in queue.results()] == _jobs(3) + _jobs(1, business_type='broken')
+    queue.close()
@@ -0,0 +1,101 @@
+import json
+import threading
+import pytest
+from unittest.mock import MagicMock
+
+from src.business_information_scraper.exceptions import StorageError
+from src.business_information_scraper.writer import BackgroundStorageWriter
+
+
+def test_background_writer_saves_batches_in_order(sample_business_info):
+    inner = MagicMock()
+    writer = BackgroundStorageWriter(inner)
+    writer.setup()
+    writer.save([sample_business_info])
+    writer.save([sample_business_info, sample_business_info])
+    writer.close()
+
+    inner.setup.assert_called_once()
+    assert [len(c.args[0]) for c in inner.save.call_args_list] == [1, 2]
+    inner.close.assert_called_once()
+    assert writer.rows_written == 3
+
+def test_background_writer_applies_backpressure(sample_business_info):
+    """save() blocks once the queue is full, until the writer thread catches up."""
+    release = threading.Event()
+    inner = MagicMock()
+    inner.save.side_effect = lambda batch: release.wait(timeout=5)
+    writer = BackgroundStorageWriter(inner, max_pending_batches=1)
+    writer.setup()
+    writer.save([sample_business_info])  # taken by the writer thread, which blocks
+    writer.save([sample_business_info])  # fills the queue
+
+    producer = threading.Thread(target=writer.save, args=([sample_business_info],))
+    producer.start()
+    producer.join(timeout=0.2)
+    assert producer.is_alive()
+
+    release.set()
+    producer.join(timeout=5)
+    writer.close()
+    assert inner.save.call_count == 3
+
+def test_background_writer_retries_failed_saves(sample_business_info):
+    inner = MagicMock()
+    inner.save.side_effect = [StorageError("disk busy"), None]
+    writer = BackgroundStorageWriter(inner, retry_delay_seconds=0)
+    writer.setup()
+    writer.save([sample_business_info])
+    writer.flush()
+    writer.close()
+
+    assert inner.save.call_count == 2
+    assert writer.retries == 1
+    assert writer.spilled_rows == 0
+
+def test_background_writer_dead_letters_exhausted_batches(tmp_path, sample_business_info):
+    dead_letter = tmp_path / 'dead.jsonl'
+    inner = MagicMock()
+    inner.save.side_effect = StorageError("disk full")
+    writer = BackgroundStorageWriter(inner, max_retries=2, retry_delay_seconds=0, dead_letter_path=str(dead_letter))
+    writer.setup()
+    writer.save([sample_business_info])
+    writer.close()
+
+    assert inner.save.call_count == 3
+    lines = [json.loads(line) for line in dead_letter.read_text(encoding='utf-8').splitlines()]
+    assert lines == [{'error': 'disk full', 'record': sample_business_info.model_dump(mode='json')}]
+
+def test_background_writer_requires_setup(sample_business_info):
+    with pytest.raises(StorageError, match="not running"):
+        BackgroundStorageWriter(MagicMock()).save([sample_business_info])
+
+def test_background_writer_flush_reports_batches_that_were_not_written(sample_business_info):
+    inner = MagicMock()
+    inner.save.side_effect = [StorageError("disk full"), None]
+    writer = BackgroundStorageWriter(inner, max_retries=0)
+    writer.setup()
+    writer.save([sample_business_info])
+
+    with pytest.raises(StorageError, match="1 of the 1 batches"):
+        writer.flush()
+    # Each failure is reported once, and only to the thread that saved the batch.
+    writer.save([sample_business_info])
+    writer.flush()
+    writer.close()
+    assert writer.spilled_rows == 1
+
+def test_background_writer_flush_ignores_other_threads_failures(sample_business_info):
+    inner = MagicMock()
+    inner.save.side_effect = [StorageError("disk full"), None]
+    writer = BackgroundStorageWriter(inner, max_retries=0)
+    writer.setup()
+    # The worker never flushes; its failed batch must not surface in this thread's flush.
+    worker = threading.Thread(target=writer.save, args=([sample_business_info],))
+    worker.start()
+    worker.join()
+
+    writer.save([sample_business_info])
+    writer.flush()
+    writer.close()
+    assert writer.spilled_rows == 1